@@ -1,5 +1,4 @@
-"""
-nl_reasoner.py — Motor de Inferência em Lógica Natural (NL-Agent Framework)
+"""nl_reasoner.py — Motor de Inferência em Lógica Natural (NL-Agent Framework).
 
 Axiomas: K1 Veracidade, K2 Distribuição, K3 Introspecção Positiva.
 Autor: Framework NL-Agent, 2026
@@ -7,9 +6,24 @@ Autor: Framework NL-Agent, 2026
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Any
+import hashlib
 import json
 
+_CLOSING = {"{": "}", "[": "]"}
+
+
+def _closes_opening(text: str) -> bool:
+    """Pré-verificação O(1) de um blob JSON: o último caractere fecha o primeiro.
+
+    Condição necessária (falso garante JSON inválido) que captura blobs
+    truncados sem hash nem parse. Uma varredura completa de colchetes/aspas
+    não compensa: custa mais que o ``json.loads`` em C sobre o mesmo texto.
+    """
+    return text.rstrip()[-1:] == _CLOSING[text[0]]
+
 
 class InferenceMode(Enum):
     MONOTONIC = "monotonic"
@@ -42,6 +56,7 @@ class ConsistencyReport:
     corrections_applied: list[str] = field(default_factory=list)
     original_propositions: int = 0
     valid_propositions: int = 0
+    truncated: bool = False  # Validação interrompida ao atingir INCONSISTENT
 
     @property
     def is_acceptable(self) -> bool:
@@ -54,18 +69,143 @@ class ConsistencyReport:
         return self.valid_propositions / self.original_propositions
 
 
+class KnowledgeBase:
+    """Base de conhecimento incremental: conjunto por conteúdo + índice por fonte.
+
+    Inserção, consulta e revisão são O(1) amortizado (a revisão percorre apenas
+    as proposições da mesma fonte). A ordem de inserção é preservada.
+    """
+
+    def __init__(self) -> None:
+        self._by_content: dict[str, Proposition] = {}
+        self._by_source: dict[str, dict[str, Proposition]] = {}
+
+    def __len__(self) -> int:
+        """Número de proposições na base."""
+        return len(self._by_content)
+
+    def __iter__(self) -> Iterator[Proposition]:
+        """Itera as proposições na ordem de inserção."""
+        return iter(self._by_content.values())
+
+    def __contains__(self, item: Proposition | str) -> bool:
+        """Pertinência por conteúdo (aceita a proposição ou o texto)."""
+        content = item.content if isinstance(item, Proposition) else item
+        return content in self._by_content
+
+    def get(self, content: str) -> Proposition | None:
+        """Proposição com o conteúdo dado, se presente."""
+        return self._by_content.get(content)
+
+    def from_source(self, source: str) -> list[Proposition]:
+        """Proposições de uma fonte, na ordem de inserção."""
+        return list(self._by_source.get(source, {}).values())
+
+    def snapshot(self) -> tuple[Proposition, ...]:
+        """Cópia imutável do estado atual (segura para iterar durante atualizações)."""
+        return tuple(self._by_content.values())
+
+    def add(self, prop: Proposition) -> bool:
+        """Atualização monotônica: insere se o conteúdo é novo; retorna se inseriu."""
+        if prop.content in self._by_content:
+            return False
+        self._insert(prop)
+        return True
+
+    def revise(self, prop: Proposition) -> list[Proposition]:
+        """Atualização não-monotônica: retrata as derrotáveis contraditas e insere.
+
+        Uma proposição derrotável é contradita pela nova se tem a mesma fonte e
+        conteúdo diferente. Conteúdo já presente é substituído pela nova versão.
+
+        Returns:
+            Proposições retratadas
+        """
+        retracted: list[Proposition] = []
+        if prop.source:
+            for existing in list(self._by_source.get(prop.source, {}).values()):
+                if existing.defeasible and existing.content != prop.content:
+                    self._remove(existing)
+                    retracted.append(existing)
+        previous = self._by_content.get(prop.content)
+        if previous is not None:
+            self._remove(previous)
+        self._insert(prop)
+        return retracted
+
+    def discard(self, content: str) -> Proposition | None:
+        """Remove a proposição com o conteúdo dado; retorna a removida."""
+        prop = self._by_content.get(content)
+        if prop is not None:
+            self._remove(prop)
+        return prop
+
+    def clear(self) -> None:
+        """Esvazia a base."""
+        self._by_content.clear()
+        self._by_source.clear()
+
+    def _insert(self, prop: Proposition) -> None:
+        self._by_content[prop.content] = prop
+        self._by_source.setdefault(prop.source, {})[prop.content] = prop
+
+    def _remove(self, prop: Proposition) -> None:
+        del self._by_content[prop.content]
+        bucket = self._by_source[prop.source]
+        del bucket[prop.content]
+        if not bucket:
+            del self._by_source[prop.source]
+
+
 class NLReasoner:
     """Motor de inferência NL com axiomas K1-K3 e inferência monotônica/não-monotônica."""
 
-    def __init__(self, consistency_threshold: float = 0.95) -> None:
+    def __init__(
+        self, consistency_threshold: float = 0.95, distribution_memo_size: int = 4096
+    ) -> None:
         self.threshold = consistency_threshold
-        self._knowledge_base: list[Proposition] = []
+        self._knowledge_base = KnowledgeBase()
+        # Veredictos K2 por digest BLAKE2b de 128 bits do conteúdo (LRU): blobs
+        # repetidos não são reprocessados, o memo não retém o texto e uma
+        # colisão de ``hash()`` não devolve o veredicto de outro blob.
+        self.distribution_memo_size = distribution_memo_size
+        self._distribution_memo: OrderedDict[bytes, bool] = OrderedDict()
+        self.distribution_memo_hits = 0
+        self.distribution_parses = 0
+
+    @property
+    def knowledge_base(self) -> KnowledgeBase:
+        """Base de conhecimento interna, atualizada por ``learn``."""
+        return self._knowledge_base
 
-    def validate_message(self, message: dict[str, Any]) -> ConsistencyReport:
+    def learn(
+        self, new: Proposition, mode: InferenceMode = InferenceMode.MONOTONIC
+    ) -> list[Proposition]:
+        """Atualiza a base interna no lugar; retorna as proposições retratadas."""
+        if mode is InferenceMode.NON_MONOTONIC:
+            return self._knowledge_base.revise(new)
+        self._knowledge_base.add(new)
+        return []
+
+    # Acima deste número de problemas a mensagem é INCONSISTENT.
+    INCONSISTENT_AFTER = 5
+
+    def validate_message(
+        self, message: dict[str, Any], early_exit: bool = False
+    ) -> ConsistencyReport:
+        """Valida as proposições da mensagem à medida que são extraídas.
+
+        Com ``early_exit``, a validação para assim que o nível INCONSISTENT é
+        atingido; o relatório contabiliza apenas as proposições vistas.
+        """
         issues: list[str] = []
-        propositions = self._extract_propositions(message)
-        valid_count = 0
-        for prop in propositions:
+        total = valid_count = 0
+        truncated = False
+        for prop in self._iter_propositions(message):
+            if early_exit and len(issues) > self.INCONSISTENT_AFTER:
+                truncated = True
+                break
+            total += 1
             if not prop.content.strip():
                 issues.append(f"K1 violado: proposição vazia de '{prop.source}'")
                 continue
@@ -80,13 +220,14 @@ class NLReasoner:
             level = ConsistencyLevel.CONSISTENT
         elif len(issues) <= 2:
             level = ConsistencyLevel.MINOR_ISSUES
-        elif len(issues) <= 5:
+        elif len(issues) <= self.INCONSISTENT_AFTER:
             level = ConsistencyLevel.MAJOR_ISSUES
         else:
             level = ConsistencyLevel.INCONSISTENT
         return ConsistencyReport(level=level, issues=issues,
-                                 original_propositions=len(propositions),
-                                 valid_propositions=valid_count)
+                                 original_propositions=total,
+                                 valid_propositions=valid_count,
+                                 truncated=truncated)
 
     def apply_corrections(self, message: dict[str, Any], report: ConsistencyReport) -> dict[str, Any]:
         corrected = dict(message)
@@ -104,6 +245,8 @@ class NLReasoner:
         report.corrections_applied = corrections
         return corrected
 
+    # Variantes puras sobre listas explícitas (O(n) por cópia); para acumular
+    # conhecimento use ``learn``, que atualiza a base interna no lugar.
     def infer_monotonic(self, base: list[Proposition], new: Proposition) -> list[Proposition]:
         result = list(base)
         if not any(p.content == new.content for p in result):
@@ -116,30 +259,77 @@ class NLReasoner:
         return result
 
     def _extract_propositions(self, message: dict[str, Any]) -> list[Proposition]:
-        propositions: list[Proposition] = []
-        def _traverse(obj: Any, path: str = "") -> None:
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    cp = f"{path}.{key}" if path else key
-                    if isinstance(value, str) and value.strip():
-                        propositions.append(Proposition(content=value, confidence=0.9, source=cp))
-                    elif isinstance(value, (int, float)):
-                        propositions.append(Proposition(content=f"{cp}={value}", confidence=1.0, source=cp))
-                    else:
-                        _traverse(value, cp)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    _traverse(item, f"{path}[{i}]")
-        _traverse(message)
-        return propositions
+        return list(self._iter_propositions(message))
+
+    def _iter_propositions(self, message: Any) -> Iterator[Proposition]:
+        """Gera as proposições em profundidade, com pilha explícita de iteradores.
+
+        Sem recursão (qualquer profundidade). A pilha guarda só o segmento de
+        caminho de cada nível; o caminho completo é montado ao emitir, então a
+        memória é proporcional à profundidade, não ao tamanho da mensagem.
+        """
+        # (itens, é dict, segmento do caminho, caminho vazio até aqui)
+        stack: list[tuple[Iterator[tuple[Any, Any]], bool, str, bool]] = []
+        if isinstance(message, dict):
+            stack.append((iter(message.items()), True, "", True))
+        elif isinstance(message, list):
+            stack.append((iter(enumerate(message)), False, "", True))
+        while stack:
+            items, is_dict, _, empty = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                continue
+            key, value = entry
+            if is_dict:
+                seg = f".{key}" if not empty else key
+                if isinstance(value, str) and value.strip():
+                    cp = self._join_path(stack, seg)
+                    yield Proposition(content=value, confidence=0.9, source=cp)
+                    continue
+                if isinstance(value, (int, float)):
+                    cp = self._join_path(stack, seg)
+                    content = f"{cp}={value}"
+                    yield Proposition(content=content, confidence=1.0, source=cp)
+                    continue
+                child_empty = empty and not seg
+            else:
+                seg, child_empty = f"[{key}]", False
+            if isinstance(value, dict):
+                stack.append((iter(value.items()), True, str(seg), child_empty))
+            elif isinstance(value, list):
+                stack.append((iter(enumerate(value)), False, str(seg), child_empty))
+
+    @staticmethod
+    def _join_path(stack: list[tuple[Any, bool, str, bool]], seg: Any) -> Any:
+        if stack[-1][3]:
+            return seg  # Chave de topo: usada como está, sem conversão para texto.
+        return "".join([entry[2] for entry in stack]) + seg
 
     def _check_distribution(self, prop: Proposition) -> bool:
-        if prop.content.startswith("{") or prop.content.startswith("["):
-            try:
-                json.loads(prop.content)
-            except json.JSONDecodeError:
-                return False
-        return True
+        content = prop.content
+        if not (content.startswith("{") or content.startswith("[")):
+            return True
+        if not _closes_opening(content):
+            return False
+        memo = self._distribution_memo
+        key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        verdict = memo.get(key)
+        if verdict is not None:
+            memo.move_to_end(key)
+            self.distribution_memo_hits += 1
+            return verdict
+        self.distribution_parses += 1
+        try:
+            json.loads(content)
+            verdict = True
+        except json.JSONDecodeError:
+            verdict = False
+        if self.distribution_memo_size > 0:
+            memo[key] = verdict
+            if len(memo) > self.distribution_memo_size:
+                memo.popitem(last=False)
+        return verdict
 
     def _contradicts(self, existing: Proposition, new: Proposition) -> bool:
         if existing.source and new.source and existing.source == new.source:
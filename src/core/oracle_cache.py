@@ -0,0 +1,355 @@
+"""oracle_cache.py — Cache de Respostas Oraculares (NL-Agent Framework).
+
+Evita reenviar ao oráculo (LLM/LRM) prompts idênticos em sequência — caso
+comum quando centenas de rotas fazem a mesma pergunta de compliance.
+
+Estrutura em dois níveis:
+    - Frente em memória: LRU limitado por ``max_entries``
+    - Fundo opcional em SQLite: sobrevive a reinícios do processo
+
+Chave: SHA-256 de (prompt normalizado, nível do modelo, tipo de oráculo).
+Respostas que não puderam ser parseadas são armazenadas como cache negativo,
+com TTL mais curto, para que um prompt problemático não martele o endpoint.
+
+Consultas idênticas simultâneas (ainda não em cache) são coalescidas:
+``SingleFlight`` (threads) e ``AsyncSingleFlight`` (asyncio) fazem os
+seguidores aguardarem o resultado da chamada líder.
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Mapping
+from pathlib import Path
+from typing import Any
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normaliza Unicode (NFC) e colapsa espaços em branco do prompt."""
+    return " ".join(unicodedata.normalize("NFC", prompt).split())
+
+
+def make_cache_key(prompt: str, model_tier: str, oracle_type: str) -> str:
+    """Chave de cache: hash do prompt normalizado, nível e tipo de oráculo."""
+    digest = hashlib.sha256()
+    digest.update(model_tier.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(oracle_type.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(normalize_prompt(prompt).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class OracleResponseCache:
+    """Cache de respostas brutas do oráculo com TTL, limite de tamanho e métricas.
+
+    Parâmetros:
+        max_entries: máximo de entradas na frente em memória (LRU)
+        ttl_seconds: tempo de vida de respostas válidas
+        negative_ttl_seconds: tempo de vida de respostas não parseáveis
+        path: arquivo SQLite para persistência; ``None`` mantém só em memória
+        max_disk_entries: máximo de entradas no SQLite (remove as mais antigas)
+        clock: relógio de parede (persistência exige tempo absoluto)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600.0,
+        negative_ttl_seconds: float = 60.0,
+        path: str | Path | None = None,
+        max_disk_entries: int = 100000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries deve ser positivo")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self._clock = clock
+        self._memory: OrderedDict[str, tuple[float, str, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = self._open(Path(path))
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> OracleResponseCache | None:
+        """Constrói o cache a partir da seção ``oracle_cache`` de bridge-config.
+
+        Returns:
+            OracleResponseCache configurado, ou None quando ``enabled`` é falso.
+        """
+        if not config.get("enabled", True):
+            return None
+        return cls(
+            max_entries=int(config.get("max_entries", 10000)),
+            ttl_seconds=float(config.get("ttl_seconds", 3600)),
+            negative_ttl_seconds=float(config.get("negative_ttl_seconds", 60)),
+            path=config.get("sqlite_path"),
+            max_disk_entries=int(config.get("max_disk_entries", 100000)),
+        )
+
+    # -----------------------------------------------------------------------
+    # Operações
+    # -----------------------------------------------------------------------
+
+    def get(self, key: str) -> str | None:
+        """Retorna a resposta bruta em cache (memória, depois disco) ou None."""
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, raw, negative = entry
+                if expires_at >= now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    self.negative_hits += negative
+                    return raw
+                del self._memory[key]
+                self.expirations += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT raw, expires_at, negative FROM oracle_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    stored: str = row[0]
+                    expires_at, negative = row[1], bool(row[2])
+                    if expires_at >= now:
+                        self._remember(key, expires_at, stored, negative)
+                        self.disk_hits += 1
+                        self.negative_hits += negative
+                        return stored
+                    self._db.execute("DELETE FROM oracle_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self.expirations += 1
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, raw: str, negative: bool = False) -> None:
+        """Armazena a resposta; ``negative`` usa o TTL de falhas de parse."""
+        ttl = self.negative_ttl_seconds if negative else self.ttl_seconds
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._remember(key, expires_at, raw, negative)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO oracle_cache "
+                    "(key, raw, expires_at, negative) VALUES (?, ?, ?, ?)",
+                    (key, raw, expires_at, int(negative)),
+                )
+                self._prune_disk()
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Remove todas as entradas (memória e disco)."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM oracle_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Aplica o limite de tamanho e fecha o arquivo SQLite, se houver."""
+        with self._lock:
+            if self._db is not None:
+                self._prune_disk(force=True)
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        """Número de entradas na frente em memória."""
+        return len(self._memory)
+
+    # -----------------------------------------------------------------------
+    # Métricas
+    # -----------------------------------------------------------------------
+
+    @property
+    def hits(self) -> int:
+        """Acertos somados (memória e disco)."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fração de consultas atendidas pelo cache (memória ou disco)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Contadores de uso do cache."""
+        return {
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": self.hit_ratio,
+            "persistent": self._db is not None,
+        }
+
+    # -----------------------------------------------------------------------
+    # Métodos Internos
+    # -----------------------------------------------------------------------
+
+    def _remember(self, key: str, expires_at: float, raw: str, negative: bool) -> None:
+        self._memory[key] = (expires_at, raw, negative)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # Frequência da poda do SQLite (em escritas), para não contar a cada put
+    PRUNE_EVERY = 256
+
+    def _prune_disk(self, force: bool = False) -> None:
+        assert self._db is not None
+        self._puts_since_prune += 1
+        if not force and self._puts_since_prune < self.PRUNE_EVERY:
+            return
+        self._puts_since_prune = 0
+        (count,) = self._db.execute("SELECT COUNT(*) FROM oracle_cache").fetchone()
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM oracle_cache WHERE key IN ("
+                "SELECT key FROM oracle_cache ORDER BY expires_at LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+
+    @staticmethod
+    def _open(path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS oracle_cache ("
+            "key TEXT PRIMARY KEY, raw TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, negative INTEGER NOT NULL DEFAULT 0)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS oracle_cache_expires "
+            "ON oracle_cache (expires_at)"
+        )
+        db.commit()
+        return db
+
+
+# ---------------------------------------------------------------------------
+# Coalescência de Consultas em Voo (single-flight)
+# ---------------------------------------------------------------------------
+
+
+class _Flight:
+    """Consulta em andamento compartilhada entre líder e seguidores."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalescência de chamadas idênticas simultâneas entre threads.
+
+    A primeira thread a chamar ``do(key, fn)`` (líder) executa ``fn``; as que
+    chegam com a mesma chave enquanto ela está em voo (seguidoras) aguardam e
+    recebem o mesmo resultado — ou a mesma exceção.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Executa ``fn`` uma única vez por chave em voo."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.leaders += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def in_flight(self) -> int:
+        """Número de chaves com chamada em andamento."""
+        return len(self._flights)
+
+
+class AsyncSingleFlight:
+    """Coalescência de corrotinas idênticas simultâneas em um event loop.
+
+    O líder agenda a corrotina como tarefa; seguidores aguardam a mesma
+    tarefa protegida por ``asyncio.shield``, de modo que o cancelamento de um
+    chamador não cancela a consulta para os demais.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[tuple[int, str], asyncio.Task[Any]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+        """Aguarda ``fn()`` executando-a uma única vez por chave em voo."""
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = loop.create_task(fn())
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Número de chaves com corrotina em andamento."""
+        return len(self._tasks)
@@ -0,0 +1,216 @@
+"""oracle_decode.py — Decodificação Tipada de Respostas Oraculares (NL-Agent Framework).
+
+Substitui o par ``json.loads`` + ``.get()`` por um decodificador dirigido por
+esquema: cada campo declara o seu tipo, o valor padrão e as conversões
+admitidas. O resultado é construído diretamente na dataclass de destino.
+
+Regras de conversão (explícitas):
+    - Número (``float``): aceita int/float; texto numérico ("0.9", "85%") é
+      convertido e anotado; bool, NaN e valores fora do intervalo são
+      rejeitados
+    - Texto (``str``): números viram texto; None vira ""; demais rejeitados
+    - Lista de textos: texto isolado vira lista de um item; itens não
+      textuais são rejeitados
+    - Mapa de textos: apenas objetos; chaves e valores escalares viram texto
+    - Lista de mapas: itens que não são objetos são rejeitados
+
+Campos rejeitados recebem o valor padrão e uma anotação (modo tolerante) ou
+levantam ``OracleDecodeError`` (modo estrito).
+
+Backend JSON: ``orjson`` quando instalado (extra ``fast``), senão ``json``.
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+try:  # Backend acelerado opcional: pip install "framework-agentnl[fast]"
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depende do ambiente
+    _HAS_ORJSON = False
+
+JSON_BACKEND = "orjson" if _HAS_ORJSON else "json"
+
+T = TypeVar("T")
+
+
+def json_loads(raw: str | bytes) -> Any:
+    """Decodifica JSON com o backend disponível (ValueError se inválido)."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_MISSING = object()
+
+
+class OracleDecodeError(ValueError):
+    """Resposta oracular malformada (modo estrito)."""
+
+
+class FieldError(ValueError):
+    """Valor de campo rejeitado pelo esquema."""
+
+
+# ---------------------------------------------------------------------------
+# Conversores
+# ---------------------------------------------------------------------------
+
+
+def as_str(value: Any) -> str:
+    """Texto; números viram texto e None vira vazio."""
+    if type(value) is str:
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise FieldError(f"esperado texto, recebido {type(value).__name__}")
+
+
+def as_unit_float(value: Any) -> float:
+    """Número em [0, 1]; aceita texto numérico e percentual ("85%")."""
+    if type(value) is float:
+        number = value
+    elif isinstance(value, int) and not isinstance(value, bool):
+        number = float(value)
+    elif isinstance(value, str):
+        text = value.strip()
+        try:
+            number = float(text[:-1]) / 100 if text.endswith("%") else float(text)
+        except ValueError:
+            raise FieldError(f"texto não numérico: {value!r}") from None
+    else:
+        raise FieldError(f"esperado número, recebido {type(value).__name__}")
+    if math.isnan(number) or not 0.0 <= number <= 1.0:
+        raise FieldError(f"fora do intervalo [0, 1]: {value!r}")
+    return number
+
+
+def as_str_list(value: Any) -> list[str]:
+    """Lista de textos; texto isolado vira lista de um item."""
+    if type(value) is list:
+        for item in value:
+            if type(item) is not str:
+                raise FieldError("lista com itens não textuais")
+        return value
+    if isinstance(value, str):
+        return [value]
+    raise FieldError(f"esperada lista de textos, recebido {type(value).__name__}")
+
+
+def as_str_map(value: Any) -> dict[str, str]:
+    """Objeto com valores textuais (escalares convertidos)."""
+    if type(value) is not dict:
+        raise FieldError(f"esperado objeto, recebido {type(value).__name__}")
+    return {str(k): v if type(v) is str else as_str(v) for k, v in value.items()}
+
+
+def as_map_list(value: Any) -> list[dict[str, Any]]:
+    """Lista de objetos."""
+    if type(value) is not list:
+        raise FieldError(f"esperada lista de objetos, recebido {type(value).__name__}")
+    for item in value:
+        if type(item) is not dict:
+            raise FieldError("lista com itens que não são objetos")
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Esquema
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Field:
+    """Campo de um esquema: nome, conversor e fábrica do valor padrão."""
+
+    name: str
+    convert: Callable[[Any], Any]
+    default: Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class Schema(Generic[T]):
+    """Esquema de decodificação para uma dataclass de resposta.
+
+    Args:
+        target: classe construída com os campos decodificados
+        fields: campos lidos do objeto JSON
+        notes_field: campo (lista de textos) que recebe as anotações de
+            conversão/rejeição no modo tolerante; None descarta
+    """
+
+    target: Callable[..., T]
+    fields: tuple[Field, ...]
+    notes_field: str | None = None
+    _specs: tuple[tuple[str, Callable[[Any], Any], Callable[[], Any]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Pré-computa as tuplas de campos usadas em ``build``."""
+        # Tuplas simples: evitam acesso a atributos no laço de decodificação.
+        specs = tuple((f.name, f.convert, f.default) for f in self.fields)
+        object.__setattr__(self, "_specs", specs)
+
+    def decode(self, raw: str | bytes, strict: bool = False, **extra: Any) -> T:
+        """Decodifica JSON bruto diretamente na classe de destino.
+
+        Args:
+            raw: resposta bruta do oráculo
+            strict: rejeitar com ``OracleDecodeError`` em vez de anotar
+            **extra: argumentos adicionais do construtor (ex.: metadados)
+
+        Raises:
+            OracleDecodeError: JSON inválido, não-objeto ou campo rejeitado
+                (modo estrito); ``ValueError`` no modo tolerante para JSON
+                inválido, para que o chamador aplique o seu fallback
+        """
+        try:
+            data = json_loads(raw)
+        except ValueError as exc:
+            if strict:
+                raise OracleDecodeError(f"JSON inválido: {exc}") from exc
+            raise
+        if type(data) is not dict:
+            message = f"esperado objeto JSON, recebido {type(data).__name__}"
+            if strict:
+                raise OracleDecodeError(message)
+            raise ValueError(message)
+        return self.build(data, strict, **extra)
+
+    def build(self, data: Mapping[str, Any], strict: bool = False, **extra: Any) -> T:
+        """Constrói a classe de destino a partir de um objeto já decodificado."""
+        notes: list[str] = []
+        values = extra
+        missing = _MISSING
+        for name, convert, default in self._specs:
+            value = data.get(name, missing)
+            if value is missing:
+                values[name] = default()
+                continue
+            try:
+                converted = convert(value)
+            except FieldError as exc:
+                note = f"Campo '{name}' rejeitado: {exc}"
+                if strict:
+                    raise OracleDecodeError(note) from exc
+                notes.append(note)
+                values[name] = default()
+                continue
+            if type(value) is str and type(converted) is not str:
+                notes.append(f"Campo '{name}' convertido de texto")
+            values[name] = converted
+
+        if notes and self.notes_field is not None:
+            values[self.notes_field] = [*values[self.notes_field], *notes]
+        return self.target(**values)
@@ -0,0 +1,209 @@
+"""oracle_metrics.py — Histogramas de Latência Oracular (NL-Agent Framework).
+
+Mede a latência de cada invocação do oráculo para acompanhar os SLIs de
+``health.sli`` (p50 150 ms / p99 900 ms).
+
+Histograma no estilo HDR (log-linear):
+    - Valores em microssegundos, inteiros
+    - Até 127 µs: um balde por valor
+    - Acima: 64 sub-baldes por potência de 2 (erro relativo ≤ 1,6%)
+    - Registro O(1) com poucas operações inteiras; memória esparsa
+
+Séries indexadas por (nível do modelo, tipo de oráculo, cache hit/miss),
+com snapshot em dicionário e exportação em texto Prometheus ou JSON.
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# Bits de precisão: 2**7 = 128 sub-baldes, metade (64) por oitava acima de 128.
+_SUB_BITS = 7
+_HALF_SHIFT = _SUB_BITS - 1
+_LINEAR_LIMIT = 1 << _SUB_BITS
+
+QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99, 0.999)
+
+
+def _bucket_index(value_us: int) -> int:
+    """Índice do balde HDR para um valor em microssegundos."""
+    if value_us < _LINEAR_LIMIT:
+        return value_us if value_us > 0 else 0
+    shift = value_us.bit_length() - _SUB_BITS
+    return (shift << _HALF_SHIFT) + (value_us >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Limites inferior e superior (inclusivos) do balde, em microssegundos."""
+    if index < _LINEAR_LIMIT:
+        return index, index
+    shift = (index >> _HALF_SHIFT) - 1
+    sub = index - (shift << _HALF_SHIFT)
+    return sub << shift, ((sub + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Histograma de latências log-linear (estilo HDR).
+
+    ``record_us`` é o caminho quente: um cálculo de índice e um incremento
+    em dicionário. Quantis são reconstruídos no snapshot.
+    """
+
+    __slots__ = ("count", "counts", "max_us", "min_us", "total_us")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+
+    def record_us(self, value_us: int) -> None:
+        """Registra uma latência em microssegundos."""
+        index = value_us if value_us < _LINEAR_LIMIT else _bucket_index(value_us)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+
+    def quantile_us(self, q: float) -> int:
+        """Quantil ``q`` (entre 0 e 1): limite superior do balde que o contém."""
+        if not self.count:
+            return 0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1], self.max_us)
+        return self.max_us
+
+    def snapshot(self) -> dict[str, Any]:
+        """Contagem, soma, extremos, média e quantis (em ms)."""
+        return {
+            "count": self.count,
+            "sum_ms": self.total_us / 1000,
+            "min_ms": (self.min_us or 0) / 1000,
+            "max_ms": self.max_us / 1000,
+            "mean_ms": self.total_us / self.count / 1000 if self.count else 0.0,
+            "quantiles_ms": {str(q): self.quantile_us(q) / 1000 for q in QUANTILES},
+        }
+
+
+class OracleMetrics:
+    """Histogramas de latência por (nível, tipo de oráculo, cache hit/miss).
+
+    Exemplo::
+
+        metrics.record("llm", "first_order", False, 182_000)
+        metrics.snapshot()["llm|first_order|miss"]["quantiles_ms"]["0.99"]
+        metrics.dump("oracle_latency.prom")
+    """
+
+    METRIC_NAME = "nlagent_oracle_latency_ms"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str, bool], LatencyHistogram] = {}
+
+    def record(
+        self, tier: str, oracle_type: str, cache_hit: bool, latency_us: int
+    ) -> None:
+        """Registra uma invocação (latência em microssegundos)."""
+        key = (tier, oracle_type, cache_hit)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record_us(latency_us)
+
+    def histogram(
+        self, tier: str, oracle_type: str, cache_hit: bool
+    ) -> LatencyHistogram | None:
+        """Histograma de uma série, ou None se ainda sem amostras."""
+        return self._histograms.get((tier, oracle_type, cache_hit))
+
+    def clear(self) -> None:
+        """Descarta todas as séries."""
+        with self._lock:
+            self._histograms.clear()
+
+    # -----------------------------------------------------------------------
+    # Snapshot e Exportação
+    # -----------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Estado de todas as séries.
+
+        Returns:
+            ``{"<nível>|<tipo>|<hit|miss>": {...}}`` com os rótulos e os
+            campos de ``LatencyHistogram.snapshot``
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+            series = {}
+            for (tier, oracle_type, cache_hit), histogram in items:
+                cache = "hit" if cache_hit else "miss"
+                series[f"{tier}|{oracle_type}|{cache}"] = {
+                    "tier": tier,
+                    "oracle_type": oracle_type,
+                    "cache": cache,
+                    **histogram.snapshot(),
+                }
+        return series
+
+    def to_json(self) -> str:
+        """Snapshot em JSON indentado."""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Exposição em formato texto do Prometheus (tipo summary)."""
+        name = self.METRIC_NAME
+        lines = [
+            f"# HELP {name} Latência das invocações do oráculo (ms).",
+            f"# TYPE {name} summary",
+        ]
+        for series in self.snapshot().values():
+            labels = (
+                f'tier="{series["tier"]}",oracle_type="{series["oracle_type"]}",'
+                f'cache="{series["cache"]}"'
+            )
+            for q, value in series["quantiles_ms"].items():
+                lines.append(f'{name}{{{labels},quantile="{q}"}} {value}')
+            lines.append(f"{name}_sum{{{labels}}} {series['sum_ms']}")
+            lines.append(f"{name}_count{{{labels}}} {series['count']}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str | Path, fmt: str | None = None) -> Path:
+        """Grava o snapshot em arquivo local (escrita atômica).
+
+        Args:
+            path: arquivo de destino
+            fmt: ``"prometheus"`` ou ``"json"``; por padrão, JSON para
+                ``.json`` e Prometheus para as demais extensões
+
+        Returns:
+            Caminho gravado
+        """
+        path = Path(path)
+        if fmt is None:
+            fmt = "json" if path.suffix == ".json" else "prometheus"
+        if fmt not in ("json", "prometheus"):
+            raise ValueError(f"Formato de métricas desconhecido: {fmt}")
+        text = self.to_json() if fmt == "json" else self.to_prometheus()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+        return path
@@ -0,0 +1,332 @@
+"""oracle_pool.py — Pool de Endpoints Oraculares (NL-Agent Framework).
+
+Distribui as chamadas de um nível (LLM ou LRM) entre várias réplicas do
+modelo. O pool expõe a mesma interface de um endpoint (``generate`` e
+``generate_async``) e pode ser passado diretamente ao ``OracleQuery``.
+
+Mecanismos:
+    - Balanceamento por menor número de requisições em andamento
+    - Limite de concorrência por réplica (espera quando todas estão cheias)
+    - Disjuntor por réplica: ``failure_threshold`` falhas seguidas abrem o
+      circuito; após ``reset_timeout_s`` uma única sondagem (meio-aberto)
+      decide se a réplica volta
+    - Falha de uma réplica: a chamada segue para a próxima disponível
+
+``PoolUnavailableError`` é levantado apenas quando todos os circuitos estão
+abertos — só então o ``OracleQuery`` recai na resposta simulada.
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from enum import Enum
+from typing import Any
+
+
+class PoolUnavailableError(RuntimeError):
+    """Nenhuma réplica disponível no pool (todos os circuitos abertos)."""
+
+
+class PoolSaturatedError(RuntimeError):
+    """Todas as réplicas disponíveis estão no limite de concorrência."""
+
+
+class CircuitState(Enum):
+    """Estado do disjuntor de uma réplica."""
+
+    CLOSED = "closed"  # Operação normal
+    OPEN = "open"  # Réplica ejetada
+    HALF_OPEN = "half_open"  # Sondagem em andamento
+
+
+class CircuitBreaker:
+    """Disjuntor por réplica (fechado → aberto → meio-aberto).
+
+    Args:
+        failure_threshold: falhas consecutivas que abrem o circuito
+        reset_timeout_s: tempo aberto antes de permitir uma sondagem
+        clock: relógio monotônico (injetável em testes)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+
+    def available(self) -> bool:
+        """Indica se a réplica pode receber uma chamada agora."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return self._clock() - self.opened_at >= self.reset_timeout_s
+        return False  # Meio-aberto: a sondagem já está em andamento.
+
+    def on_dispatch(self) -> None:
+        """Chamada despachada; um circuito vencido passa a meio-aberto."""
+        if self.state == CircuitState.OPEN:
+            self.state = CircuitState.HALF_OPEN
+
+    def record_success(self) -> None:
+        """Chamada bem-sucedida: fecha o circuito e zera as falhas."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+
+    def record_cancelled(self) -> None:
+        """Sondagem cancelada: volta a aberto sem reiniciar o tempo de ejeção."""
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.OPEN
+
+    def record_failure(self) -> None:
+        """Registra uma falha; abre o circuito no limite ou na sondagem."""
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or (
+            self.failures >= self.failure_threshold
+        ):
+            if self.state != CircuitState.OPEN:
+                self.trips += 1
+            self.state = CircuitState.OPEN
+            self.opened_at = self._clock()
+
+
+class Replica:
+    """Réplica de um endpoint com ocupação e disjuntor próprios."""
+
+    __slots__ = (
+        "breaker",
+        "calls",
+        "endpoint",
+        "failures",
+        "in_flight",
+        "max_concurrency",
+        "name",
+    )
+
+    def __init__(
+        self, endpoint: Any, name: str, max_concurrency: int, breaker: CircuitBreaker
+    ) -> None:
+        self.endpoint = endpoint
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.breaker = breaker
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+
+
+class EndpointPool:
+    """Pool de réplicas de um nível do oráculo.
+
+    Args:
+        endpoints: réplicas (objetos com ``generate``/``generate_async``)
+        max_concurrency: chamadas simultâneas por réplica
+        failure_threshold: falhas consecutivas que ejetam a réplica
+        reset_timeout_s: tempo de ejeção antes da sondagem
+        acquire_timeout_s: espera máxima por vaga quando todas estão cheias
+        clock: relógio monotônico dos disjuntores
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[Any],
+        max_concurrency: int = 16,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        acquire_timeout_s: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.replicas = [
+            Replica(
+                endpoint,
+                getattr(endpoint, "name", f"replica-{i}"),
+                max_concurrency,
+                CircuitBreaker(failure_threshold, reset_timeout_s, clock),
+            )
+            for i, endpoint in enumerate(endpoints)
+        ]
+        if not self.replicas:
+            raise ValueError("EndpointPool requer ao menos uma réplica")
+        self.acquire_timeout_s = acquire_timeout_s
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(
+        cls, endpoints: Iterable[Any], config: Mapping[str, Any]
+    ) -> EndpointPool:
+        """Constrói o pool a partir da seção ``endpoint_pool`` de bridge-config."""
+        return cls(
+            endpoints,
+            max_concurrency=int(config.get("max_concurrency_per_endpoint", 16)),
+            failure_threshold=int(config.get("failure_threshold", 5)),
+            reset_timeout_s=float(config.get("reset_timeout_seconds", 30)),
+            acquire_timeout_s=float(config.get("acquire_timeout_ms", 5000)) / 1000,
+        )
+
+    # -----------------------------------------------------------------------
+    # Interface de endpoint
+    # -----------------------------------------------------------------------
+
+    def generate(self, prompt: str) -> str:
+        """Invoca a réplica menos ocupada; em falha, tenta as demais.
+
+        Raises:
+            PoolUnavailableError: todos os circuitos abertos
+            PoolSaturatedError: sem vaga dentro de ``acquire_timeout_s``
+            Exception: última falha, se todas as réplicas falharam
+        """
+        tried: set[int] = set()
+        last_error: Exception | None = None
+        deadline = time.monotonic() + self.acquire_timeout_s
+        while True:
+            with self._cond:
+                replica = self._acquire_locked(tried, last_error)
+                while replica is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolSaturatedError("Todas as réplicas no limite")
+                    self._cond.wait(remaining)
+                    replica = self._acquire_locked(tried, last_error)
+            ok: bool | None = None
+            try:
+                raw: str = replica.endpoint.generate(prompt)
+                ok = True
+            except Exception as exc:
+                ok = False
+                tried.add(id(replica))
+                last_error = exc
+                continue
+            finally:
+                self._release(replica, ok)
+            return raw
+
+    async def generate_async(self, prompt: str) -> str:
+        """Variante assíncrona de ``generate``.
+
+        A espera por vaga é feita por sondagem curta, sem bloquear o loop.
+        """
+        tried: set[int] = set()
+        last_error: Exception | None = None
+        deadline = time.monotonic() + self.acquire_timeout_s
+        while True:
+            with self._cond:
+                replica = self._acquire_locked(tried, last_error)
+            if replica is None:
+                if time.monotonic() >= deadline:
+                    raise PoolSaturatedError("Todas as réplicas no limite")
+                await asyncio.sleep(0.005)
+                continue
+            ok: bool | None = None
+            try:
+                endpoint = replica.endpoint
+                raw: str
+                if hasattr(endpoint, "generate_async"):
+                    raw = await endpoint.generate_async(prompt)
+                else:
+                    raw = await asyncio.to_thread(endpoint.generate, prompt)
+                ok = True
+            except Exception as exc:
+                ok = False
+                tried.add(id(replica))
+                last_error = exc
+                continue
+            finally:
+                self._release(replica, ok)
+            return raw
+
+    # -----------------------------------------------------------------------
+    # Estado
+    # -----------------------------------------------------------------------
+
+    @property
+    def is_down(self) -> bool:
+        """Todas as réplicas ejetadas (circuitos abertos)."""
+        with self._cond:
+            return all(
+                r.breaker.state == CircuitState.OPEN and not r.breaker.available()
+                for r in self.replicas
+            )
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Ocupação, chamadas, falhas e estado do disjuntor por réplica."""
+        with self._cond:
+            return [
+                {
+                    "name": r.name,
+                    "in_flight": r.in_flight,
+                    "calls": r.calls,
+                    "failures": r.failures,
+                    "circuit": r.breaker.state.value,
+                    "trips": r.breaker.trips,
+                }
+                for r in self.replicas
+            ]
+
+    # -----------------------------------------------------------------------
+    # Métodos Internos
+    # -----------------------------------------------------------------------
+
+    def _acquire_locked(
+        self, tried: set[int], last_error: Exception | None
+    ) -> Replica | None:
+        """Reserva a réplica disponível menos ocupada (com o lock tomado).
+
+        Returns:
+            A réplica reservada, ou None se todas as disponíveis estão cheias
+            (ou se só restam sondagens meio-abertas em andamento)
+
+        Raises:
+            PoolUnavailableError: nenhuma réplica com circuito disponível
+            Exception: ``last_error`` quando as disponíveis já falharam nesta
+                chamada
+        """
+        available = [r for r in self.replicas if r.breaker.available()]
+        if not available and not any(
+            r.breaker.state == CircuitState.HALF_OPEN for r in self.replicas
+        ):
+            raise PoolUnavailableError(
+                "Todos os circuitos do pool estão abertos"
+            ) from last_error
+        candidates = [r for r in available if id(r) not in tried]
+        if not candidates:
+            if last_error is not None:
+                raise last_error
+            return None  # Apenas sondagens em andamento: aguarda o resultado.
+        free = [r for r in candidates if r.in_flight < r.max_concurrency]
+        if not free:
+            return None
+        replica = min(free, key=lambda r: r.in_flight)
+        replica.breaker.on_dispatch()
+        replica.in_flight += 1
+        replica.calls += 1
+        return replica
+
+    def _release(self, replica: Replica, ok: bool | None) -> None:
+        """Libera a vaga e registra o resultado no disjuntor.
+
+        ``ok`` None indica chamada interrompida (cancelamento ou
+        ``BaseException``): não conta como falha, mas uma sondagem interrompida
+        devolve o circuito a aberto para que outra sondagem possa ocorrer.
+        """
+        with self._cond:
+            replica.in_flight -= 1
+            if ok is True:
+                replica.breaker.record_success()
+            elif ok is False:
+                replica.failures += 1
+                replica.breaker.record_failure()
+            else:
+                replica.breaker.record_cancelled()
+            self._cond.notify_all()
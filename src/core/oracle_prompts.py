@@ -0,0 +1,115 @@
+"""oracle_prompts.py — Templates de Prompt com Prefixo Estável (NL-Agent Framework).
+
+Caches de prefixo (KV cache do provedor ou local) só reaproveitam o trecho
+inicial idêntico entre prompts. Os templates aqui seguem a ordem:
+
+    1. Prefixo estático — instruções e formato de resposta (igual sempre)
+    2. Bloco de contexto — igual para todas as perguntas sobre a mesma rede
+    3. Pergunta e restrições — a única parte que varia
+
+O trecho (prefixo + contexto) é internado por template: perguntas sobre o
+mesmo contexto reutilizam a mesma string, sem reconstruí-la a cada chamada.
+Em lote, o contexto aparece uma única vez para várias perguntas.
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+_ROLE = "Você é um oráculo epistêmico consultado pelo NL-Agent Framework."
+
+_RULES = """Regras:
+  - Responder apenas com base no contexto fornecido
+  - Indicar nível de confiança (0-1)
+  - Citar fontes quando aplicável"""
+
+QUERY_PREFIX = f"""{_ROLE}
+
+{_RULES}
+
+Formato de resposta (JSON):
+{{
+  "answer": "...",
+  "confidence": 0.X,
+  "sources": [...],
+  "caveats": [...]
+}}
+"""
+
+BATCH_QUERY_PREFIX = f"""{_ROLE}
+Responda a cada pergunta numerada de forma independente, usando o mesmo contexto.
+
+{_RULES}
+
+Formato de resposta (array JSON, um objeto por pergunta, na mesma ordem):
+[
+  {{"id": 0, "answer": "...", "confidence": 0.X, "sources": [...], "caveats": [...]}}
+]
+"""
+
+
+def render_constraints(constraints: Sequence[str]) -> str:
+    """Lista de restrições indentada, ou ``(nenhuma)``."""
+    if not constraints:
+        return "  (nenhuma)"
+    return "\n".join(f"  - {c}" for c in constraints)
+
+
+class PromptTemplate:
+    """Template de consulta com prefixo estático e contexto internado.
+
+    Args:
+        prefix: trecho estático inicial (instruções e formato)
+        max_contexts: cabeçalhos (prefixo + contexto) mantidos em LRU
+    """
+
+    def __init__(self, prefix: str, max_contexts: int = 256) -> None:
+        self.prefix = prefix
+        self.max_contexts = max_contexts
+        self._heads: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.context_hits = 0
+        self.context_misses = 0
+
+    def head(self, context: str) -> str:
+        """Prefixo estático seguido do bloco de contexto (internado)."""
+        with self._lock:
+            head = self._heads.get(context)
+            if head is not None:
+                self._heads.move_to_end(context)
+                self.context_hits += 1
+                return head
+            self.context_misses += 1
+            head = f"{self.prefix}\nContexto:\n{context}\n\n"
+            self._heads[context] = head
+            if len(self._heads) > self.max_contexts:
+                self._heads.popitem(last=False)
+            return head
+
+    def render(
+        self, question: str, context: str, constraints: Sequence[str] = ()
+    ) -> str:
+        """Prompt de uma pergunta."""
+        return (
+            f"{self.head(context)}Pergunta:\n{question}\n\n"
+            f"Restrições:\n{render_constraints(constraints)}"
+        )
+
+    def render_batch(
+        self,
+        questions: Sequence[str],
+        context: str,
+        constraints: Sequence[str] = (),
+    ) -> str:
+        """Prompt de várias perguntas numeradas sobre um único contexto."""
+        items = "\n\n".join(
+            f"Pergunta {i}:\n{question}" for i, question in enumerate(questions)
+        )
+        return (
+            f"{self.head(context)}{items}\n\n"
+            f"Restrições (todas as perguntas):\n{render_constraints(constraints)}"
+        )
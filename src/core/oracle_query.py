@@ -1,5 +1,4 @@
-"""
-oracle_query.py — Padrões de Consulta Oracular (NL-Agent Framework)
+"""oracle_query.py — Padrões de Consulta Oracular (NL-Agent Framework)
 
 Implementa padrões de invocação que maximizam a precisão das consultas
 a oráculos epistêmicos (LLMs/LRMs), conforme seção 4.3.2 da dissertação.
@@ -21,11 +20,44 @@ Autor: Framework NL-Agent, 2026
 
 from __future__ import annotations
 
+import asyncio
 import json
-from dataclasses import dataclass, field
+import random
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+from src.core.oracle_cache import (
+    AsyncSingleFlight,
+    OracleResponseCache,
+    SingleFlight,
+    make_cache_key,
+)
+from src.core.oracle_decode import (
+    Field,
+    OracleDecodeError,
+    Schema,
+    as_map_list,
+    as_str,
+    as_str_list,
+    as_str_map,
+    as_unit_float,
+    json_loads,
+)
+from src.core.oracle_metrics import OracleMetrics
+from src.core.oracle_pool import EndpointPool, PoolUnavailableError
+from src.core.oracle_prompts import BATCH_QUERY_PREFIX, QUERY_PREFIX, PromptTemplate
+from src.core.oracle_stream import IncrementalJSONParser
 
 # ---------------------------------------------------------------------------
 # Tipos
@@ -46,8 +78,7 @@ class OracleRole(Enum):
 
 
 class ModelTier(Enum):
-    """
-    Classificação do modelo conforme a dualidade LLM/LRM.
+    """Classificação do modelo conforme a dualidade LLM/LRM.
     System 1 = rápido, intuitivo (LLM)
     System 2 = lento, deliberativo (LRM)
     """
@@ -65,6 +96,7 @@ class OracleResponse:
     oracle_type: OracleType = OracleType.FIRST_ORDER
     model_tier: ModelTier = ModelTier.SYSTEM_1_LLM
     latency_ms: float = 0.0
+    routing: RoutingDecision | None = None   # Decisão do roteador adaptativo
 
     @property
     def is_high_confidence(self) -> bool:
@@ -75,6 +107,19 @@ class OracleResponse:
         return self.confidence < 0.70
 
 
+@dataclass(frozen=True)
+class StreamEvent:
+    """Evento de uma consulta em streaming (``stream_with_context``).
+
+    Eventos intermediários trazem um campo de topo recém-completado
+    (``field``/``value``); o evento final traz ``response`` e ``field=None``.
+    """
+    field: str | None
+    value: Any = None
+    elapsed_ms: float = 0.0                  # Desde o início da invocação
+    response: OracleResponse | None = None   # Apenas no evento final
+
+
 @dataclass
 class SemanticAlignmentQuery:
     """Consulta de alinhamento semântico entre protocolos."""
@@ -95,13 +140,533 @@ class AlignmentResponse:
     semantic_gaps: list[dict[str, str]] = field(default_factory=list)
 
 
+# Esquemas de decodificação tipada (ver oracle_decode.py)
+RESPONSE_SCHEMA = Schema(
+    target=OracleResponse,
+    fields=(
+        Field("answer", as_str, str),
+        Field("confidence", as_unit_float, lambda: 0.5),
+        Field("sources", as_str_list, list),
+        Field("caveats", as_str_list, list),
+    ),
+    notes_field="caveats",
+)
+
+ALIGNMENT_SCHEMA = Schema(
+    target=AlignmentResponse,
+    fields=(
+        Field("relation", as_str, lambda: "⊥"),
+        Field("confidence", as_unit_float, lambda: 0.0),
+        Field("mapping", as_str_map, dict),
+        Field("semantic_gaps", as_map_list, list),
+    ),
+)
+
+# Formato pedido nos prompts de alinhamento em lote.
+_BATCH_ALIGNMENT_FORMAT = (
+    '[{"id": 0, "relation": "...", "confidence": 0.X, '
+    '"mapping": {...}, "semantic_gaps": [...]}]'
+)
+
+
+# ---------------------------------------------------------------------------
+# Classificação de Tarefas (Heurística de Roteamento LLM/LRM)
+# ---------------------------------------------------------------------------
+
+DEFAULT_LRM_KEYWORDS: tuple[str, ...] = (
+    "calcul", "orçament", "fundeb", "pdde", "compliance",
+    "otimiz", "rota", "nutricional", "pnae", "lei", "legal",
+    "audit", "verific", "consistên",
+)
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex de alternação fatorada por prefixos comuns (trie).
+
+    ``["rota", "roteiro"]`` vira ``rot(?:a|eiro)``: o motor de regex percorre
+    o texto uma vez e, em cada posição, desce apenas o ramo compatível, de
+    modo que o custo não cresce com o número de palavras-chave.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        if "" in node:
+            # Casamento por substring: a palavra mais curta já basta.
+            return ""
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return build(trie) if trie else ""
+
+
+class TaskClassifier:
+    """Classificador LLM/LRM compilado em um único padrão (seção 7.1.3).
+
+    As palavras-chave (prefixos, casados como substring) são compiladas uma
+    vez em uma regex fatorada por trie; as decisões são memoizadas por
+    (pergunta, restrições).
+
+    Args:
+        keywords: palavras-chave que direcionam a tarefa ao LRM
+        memo_size: decisões memoizadas (LRU); 0 desativa
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str] = DEFAULT_LRM_KEYWORDS,
+        memo_size: int = 4096,
+    ) -> None:
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        pattern = _trie_pattern(self.keywords)
+        self._pattern = re.compile(pattern) if pattern else None
+        self._match = (
+            lru_cache(maxsize=memo_size)(self._match_uncached)
+            if memo_size else self._match_uncached
+        )
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> TaskClassifier:
+        """Constrói o classificador a partir da seção ``routing`` de bridge-config.
+
+        ``lrm_keywords`` substitui a lista padrão; ``extra_lrm_keywords`` a
+        estende (ex.: vocabulário SEDF por implantação).
+        """
+        keywords = list(config.get("lrm_keywords") or DEFAULT_LRM_KEYWORDS)
+        keywords += config.get("extra_lrm_keywords") or []
+        return cls(keywords, memo_size=int(config.get("memo_size", 4096)))
+
+    def classify(self, question: str, constraints: Sequence[str] = ()) -> ModelTier:
+        """Nível do modelo para a pergunta e suas restrições."""
+        if self.match(question, constraints) is None:
+            return ModelTier.SYSTEM_1_LLM
+        return ModelTier.SYSTEM_2_LRM
+
+    def match(self, question: str, constraints: Sequence[str] = ()) -> str | None:
+        """Primeira palavra-chave LRM encontrada, ou None."""
+        return self._match(question, tuple(constraints))
+
+    def _match_uncached(
+        self, question: str, constraints: tuple[str, ...]
+    ) -> str | None:
+        if self._pattern is None:
+            return None
+        # Separador explícito: palavras-chave não casam através da fronteira
+        # entre a pergunta e as restrições.
+        text = "\n".join((question, *constraints)).lower()
+        found = self._pattern.search(text)
+        return found.group() if found else None
+
+
+# ---------------------------------------------------------------------------
+# Política de Invocação (timeouts, retentativas, hedging)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class InvocationPolicy:
+    """Política de invocação assíncrona do oráculo.
+
+    Args:
+        timeouts_ms: timeout por nível do modelo (tentativa individual)
+        max_retries: retentativas após a primeira tentativa
+        backoff_base_ms: base do backoff exponencial entre tentativas
+        backoff_max_ms: teto do backoff
+        hedge: enviar requisição redundante para System 1 após o p95
+        hedge_min_samples: amostras de latência antes de usar o p95 observado
+        hedge_default_ms: atraso do hedge enquanto não há amostras suficientes
+        retry_on: exceções consideradas transitórias
+    """
+    timeouts_ms: Mapping[ModelTier, float] = field(default_factory=lambda: {
+        ModelTier.SYSTEM_1_LLM: 5000.0,
+        ModelTier.SYSTEM_2_LRM: 60000.0,
+    })
+    max_retries: int = 3
+    backoff_base_ms: float = 100.0
+    backoff_max_ms: float = 2000.0
+    hedge: bool = False
+    hedge_min_samples: int = 20
+    hedge_default_ms: float = 300.0
+    retry_on: tuple[type[BaseException], ...] = (OSError, asyncio.TimeoutError)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> InvocationPolicy:
+        """Constrói a política a partir do bridge-config completo.
+
+        Lê ``translation.oracle_semantic/oracle_reasoning.timeout_ms``,
+        ``validation.max_retries`` e a seção ``oracle_invocation``.
+        """
+        bridge = config.get("bridge", config)
+        translation = bridge.get("translation", {})
+        invocation = bridge.get("oracle_invocation", {})
+        defaults = cls()
+        return cls(
+            timeouts_ms={
+                ModelTier.SYSTEM_1_LLM: float(
+                    translation.get("oracle_semantic", {}).get("timeout_ms", 5000)
+                ),
+                ModelTier.SYSTEM_2_LRM: float(
+                    translation.get("oracle_reasoning", {}).get("timeout_ms", 60000)
+                ),
+            },
+            max_retries=int(bridge.get("validation", {}).get("max_retries", 3)),
+            backoff_base_ms=float(
+                invocation.get("retry_backoff_ms", defaults.backoff_base_ms)
+            ),
+            backoff_max_ms=float(
+                invocation.get("retry_backoff_max_ms", defaults.backoff_max_ms)
+            ),
+            hedge=bool(invocation.get("hedge", defaults.hedge)),
+            hedge_min_samples=int(
+                invocation.get("hedge_min_samples", defaults.hedge_min_samples)
+            ),
+            hedge_default_ms=float(
+                invocation.get("hedge_default_ms", defaults.hedge_default_ms)
+            ),
+        )
+
+    def timeout_s(self, model_tier: ModelTier) -> float:
+        """Timeout de uma tentativa, em segundos."""
+        return self.timeouts_ms.get(model_tier, 5000.0) / 1000
+
+    def backoff_s(self, attempt: int, rng: random.Random) -> float:
+        """Backoff exponencial com jitter completo para a tentativa ``attempt``."""
+        ceiling = min(self.backoff_max_ms, self.backoff_base_ms * 2 ** attempt)
+        return rng.uniform(0.0, ceiling) / 1000
+
+
+class LatencyWindow:
+    """Janela deslizante de latências (ms) para estimar percentis.
+
+    Mantém as amostras em ordem de chegada (para descartar a mais antiga) e
+    uma cópia ordenada atualizada com ``bisect``: ``percentile`` é uma
+    indexação, sem ordenar a janela a cada decisão de hedging.
+    """
+
+    __slots__ = ("_lock", "_ordered", "_samples")
+
+    def __init__(self, size: int = 512) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._ordered: list[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float) -> None:
+        """Registra uma amostra (ms)."""
+        with self._lock:
+            samples, ordered = self._samples, self._ordered
+            if len(samples) == samples.maxlen:
+                del ordered[bisect_left(ordered, samples[0])]
+            samples.append(latency_ms)
+            insort(ordered, latency_ms)
+
+    def percentile(self, q: float) -> float | None:
+        """Percentil ``q`` (entre 0 e 100) das amostras, ou None se vazia."""
+        with self._lock:
+            ordered = self._ordered
+            if not ordered:
+                return None
+            return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def __len__(self) -> int:
+        """Número de amostras na janela."""
+        return len(self._samples)
+
+
+# ---------------------------------------------------------------------------
+# Roteamento Adaptativo (latência e orçamento de erros)
+# ---------------------------------------------------------------------------
+
+DEFAULT_COMPLIANCE_KEYWORDS: tuple[str, ...] = (
+    "fundeb", "pdde", "pnae", "compliance", "lei", "legal", "audit", "orçament",
+)
+
+# Nível cuja vaga foi reservada pela consulta enfileirada em execução: as
+# chamadas feitas dentro dela já estão contadas em ``in_flight``.
+_RESERVED_SLOT: ContextVar[ModelTier | None] = ContextVar(
+    "oracle_reserved_slot", default=None
+)
+
+
+class RouteAction(Enum):
+    """Ação tomada pelo roteador adaptativo."""
+    ROUTE = "route"           # Nível da heurística de roteamento
+    DOWNGRADE = "downgrade"   # LRM sob pressão → LLM
+    QUEUE = "queue"           # Aguarda vaga no LRM (compliance)
+    SHED = "shed"             # Rejeitada: fila cheia
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Decisão de roteamento com motivo legível por máquina.
+
+    ``reason`` é um código estável: ``no_lrm_keyword``, ``lrm_keyword``,
+    ``latency_over_target``, ``error_rate_over_budget``, ``saturated``,
+    ``queue_full`` ou ``queue_timeout``.
+    """
+    tier: ModelTier
+    action: RouteAction
+    reason: str
+    keyword: str | None = None     # Palavra-chave LRM que casou
+    protected: bool = False        # Compliance: nunca rebaixada
+
+    def as_dict(self) -> dict[str, Any]:
+        """Decisão serializável (logs e telemetria)."""
+        return {
+            "tier": self.tier.value,
+            "action": self.action.value,
+            "reason": self.reason,
+            "keyword": self.keyword,
+            "protected": self.protected,
+        }
+
+
+class OracleOverloadedError(RuntimeError):
+    """Consulta rejeitada pelo roteador adaptativo (``decision.action`` SHED)."""
+
+    def __init__(self, decision: RoutingDecision) -> None:
+        super().__init__(
+            f"Oráculo {decision.tier.value} sobrecarregado: {decision.reason}"
+        )
+        self.decision = decision
+
+
+@dataclass
+class TierHealth:
+    """Saúde de um nível: EWMAs de latência e de erro, ocupação e fila."""
+    latency_ms: float | None = None
+    error_rate: float = 0.0
+    samples: int = 0
+    in_flight: int = 0
+    queued: int = 0
+
+
+class AdaptiveRouter:
+    """Roteador LLM/LRM sensível a latência e orçamento de erros.
+
+    Parte da Heurística de Roteamento (``TaskClassifier``) e compara EWMAs
+    de latência e de erro de cada nível com as metas de ``health.sli``. Com
+    o LRM sob pressão, consultas que não são de compliance são rebaixadas ao
+    LLM; as de compliance aguardam vaga (fila limitada) ou são rejeitadas.
+    Termos em ``never_downgrade`` (FUNDEB) nunca são rebaixados nem
+    rejeitados por fila cheia.
+
+    Args:
+        classifier: heurística de roteamento base
+        latency_targets_ms: meta de latência (EWMA) por nível
+        success_rate_target: taxa de sucesso mínima (orçamento = 1 - meta)
+        alpha: peso da amostra mais recente nas EWMAs
+        min_samples: amostras antes de avaliar pressão por latência/erro
+        lrm_max_in_flight: chamadas LRM simultâneas antes de saturar
+        max_queue: consultas aguardando vaga no LRM
+        compliance_keywords: termos que impedem o rebaixamento
+        never_downgrade: termos protegidos mesmo com a fila cheia
+    """
+
+    def __init__(
+        self,
+        classifier: TaskClassifier | None = None,
+        latency_targets_ms: Mapping[ModelTier, float] | None = None,
+        success_rate_target: float = 0.96,
+        alpha: float = 0.1,
+        min_samples: int = 5,
+        lrm_max_in_flight: int = 8,
+        max_queue: int = 32,
+        compliance_keywords: Iterable[str] = DEFAULT_COMPLIANCE_KEYWORDS,
+        never_downgrade: Iterable[str] = ("fundeb",),
+    ) -> None:
+        self.classifier = classifier or TaskClassifier()
+        self.latency_targets_ms = dict(latency_targets_ms or {
+            ModelTier.SYSTEM_1_LLM: 900.0,
+            ModelTier.SYSTEM_2_LRM: 30000.0,
+        })
+        self.error_budget = 1.0 - success_rate_target
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.lrm_max_in_flight = lrm_max_in_flight
+        self.max_queue = max_queue
+        never_downgrade = tuple(never_downgrade)
+        self._compliance = TaskClassifier(
+            (*compliance_keywords, *never_downgrade), memo_size=0
+        )
+        self._never_downgrade = TaskClassifier(never_downgrade, memo_size=0)
+        self.health = {tier: TierHealth() for tier in ModelTier}
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(
+        cls, config: Mapping[str, Any], classifier: TaskClassifier | None = None
+    ) -> AdaptiveRouter:
+        """Constrói o roteador a partir do bridge-config completo.
+
+        A meta de latência do LLM é ``health.sli.latency_p99_target_ms``; a do
+        LRM e os limites de ocupação vêm da seção ``routing``.
+        """
+        bridge = config.get("bridge", config)
+        sli = bridge.get("health", {}).get("sli", {})
+        routing = bridge.get("routing", {})
+        return cls(
+            classifier=classifier or TaskClassifier.from_config(routing),
+            latency_targets_ms={
+                ModelTier.SYSTEM_1_LLM: float(sli.get("latency_p99_target_ms", 900)),
+                ModelTier.SYSTEM_2_LRM: float(
+                    routing.get("lrm_latency_target_ms", 30000)
+                ),
+            },
+            success_rate_target=float(sli.get("success_rate_target", 0.96)),
+            alpha=float(routing.get("ewma_alpha", 0.1)),
+            min_samples=int(routing.get("min_samples", 5)),
+            lrm_max_in_flight=int(routing.get("lrm_max_in_flight", 8)),
+            max_queue=int(routing.get("max_queue", 32)),
+            compliance_keywords=routing.get(
+                "compliance_keywords", DEFAULT_COMPLIANCE_KEYWORDS
+            ),
+            never_downgrade=routing.get("never_downgrade_keywords", ("fundeb",)),
+        )
+
+    # -----------------------------------------------------------------------
+    # Decisão
+    # -----------------------------------------------------------------------
+
+    def decide(
+        self, question: str, constraints: Sequence[str] = ()
+    ) -> RoutingDecision:
+        """Decide o nível e a ação para a consulta."""
+        keyword = self.classifier.match(question, constraints)
+        if keyword is None:
+            return RoutingDecision(
+                ModelTier.SYSTEM_1_LLM, RouteAction.ROUTE, "no_lrm_keyword"
+            )
+
+        lrm = ModelTier.SYSTEM_2_LRM
+        pressure = self.pressure(lrm)
+        if pressure is None:
+            return RoutingDecision(lrm, RouteAction.ROUTE, "lrm_keyword", keyword)
+
+        if self._compliance.match(question, constraints) is None:
+            return RoutingDecision(
+                ModelTier.SYSTEM_1_LLM, RouteAction.DOWNGRADE, pressure, keyword
+            )
+        if self.health[lrm].queued < self.max_queue or (
+            self._never_downgrade.match(question, constraints) is not None
+        ):
+            return RoutingDecision(lrm, RouteAction.QUEUE, pressure, keyword, True)
+        return RoutingDecision(lrm, RouteAction.SHED, "queue_full", keyword, True)
+
+    def pressure(self, tier: ModelTier) -> str | None:
+        """Código do sinal de pressão do nível, ou None se saudável."""
+        health = self.health[tier]
+        lrm = tier == ModelTier.SYSTEM_2_LRM
+        if lrm and health.in_flight >= self.lrm_max_in_flight:
+            return "saturated"
+        if health.samples < self.min_samples:
+            return None
+        if health.error_rate > self.error_budget:
+            return "error_rate_over_budget"
+        if health.latency_ms is not None and (
+            health.latency_ms > self.latency_targets_ms.get(tier, float("inf"))
+        ):
+            return "latency_over_target"
+        return None
+
+    # -----------------------------------------------------------------------
+    # Observação e Fila
+    # -----------------------------------------------------------------------
+
+    def begin(self, tier: ModelTier) -> None:
+        """Registra o início de uma chamada ao nível."""
+        with self._cond:
+            self.health[tier].in_flight += 1
+
+    def end(
+        self,
+        tier: ModelTier,
+        latency_ms: float | None = None,
+        error: bool | None = None,
+    ) -> None:
+        """Registra o fim de uma chamada (iniciada com ``begin``)."""
+        with self._cond:
+            self.health[tier].in_flight -= 1
+            self._observe_locked(tier, latency_ms, error)
+            self._cond.notify_all()
+
+    def observe(
+        self,
+        tier: ModelTier,
+        latency_ms: float | None = None,
+        error: bool | None = None,
+    ) -> None:
+        """Atualiza as EWMAs do nível com uma amostra avulsa."""
+        with self._cond:
+            self._observe_locked(tier, latency_ms, error)
+
+    def wait_for_slot(self, tier: ModelTier, timeout: float | None = None) -> bool:
+        """Aguarda vaga no nível e a reserva; retorna False se o prazo expirar.
+
+        A verificação e a reserva ocorrem sob o mesmo lock, de modo que
+        esperas concorrentes nunca excedem ``lrm_max_in_flight``. A vaga
+        obtida já conta em ``in_flight`` e deve ser devolvida com
+        ``release_slot``.
+        """
+        with self._cond:
+            health = self.health[tier]
+            health.queued += 1
+            try:
+                if not self._cond.wait_for(
+                    lambda: health.in_flight < self.lrm_max_in_flight, timeout
+                ):
+                    return False
+                health.in_flight += 1
+                return True
+            finally:
+                health.queued -= 1
+
+    def release_slot(self, tier: ModelTier) -> None:
+        """Devolve a vaga reservada por ``wait_for_slot``."""
+        with self._cond:
+            self.health[tier].in_flight -= 1
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Estado corrente de cada nível (para logs e health checks)."""
+        with self._cond:
+            return {
+                tier.value: {
+                    "latency_ewma_ms": h.latency_ms,
+                    "error_rate_ewma": h.error_rate,
+                    "samples": h.samples,
+                    "in_flight": h.in_flight,
+                    "queued": h.queued,
+                    "pressure": self.pressure(tier),
+                }
+                for tier, h in self.health.items()
+            }
+
+    def _observe_locked(
+        self, tier: ModelTier, latency_ms: float | None, error: bool | None
+    ) -> None:
+        health = self.health[tier]
+        alpha = self.alpha
+        if latency_ms is not None:
+            health.latency_ms = latency_ms if health.latency_ms is None else (
+                alpha * latency_ms + (1 - alpha) * health.latency_ms
+            )
+        if error is not None:
+            health.error_rate = alpha * float(error) + (1 - alpha) * health.error_rate
+            health.samples += 1
+
+
 # ---------------------------------------------------------------------------
 # Motor de Consulta Oracular
 # ---------------------------------------------------------------------------
 
 class OracleQuery:
-    """
-    Consulta oracular com contexto e restrições.
+    """Consulta oracular com contexto e restrições.
 
     Implementa o padrão de Consulta Estruturada com Contexto (seção 4.3.2).
     Roteia automaticamente para o tipo de oráculo adequado conforme a
@@ -110,15 +675,92 @@ class OracleQuery:
     Args:
         llm_endpoint: endpoint do oráculo semântico (LLM)
         lrm_endpoint: endpoint do oráculo raciocinador (LRM)
+        response_cache: cache de respostas brutas; ``None`` desativa o cache
+        coalesce: coalescer consultas idênticas simultâneas em uma única
+            chamada ao endpoint (threads e asyncio)
+        policy: timeouts, retentativas e hedging das chamadas assíncronas
+        seed: semente do jitter do backoff (reprodutibilidade)
+        classifier: classificador LLM/LRM; padrão com as palavras-chave
+            de ``DEFAULT_LRM_KEYWORDS``
+        router: roteador adaptativo; ``None`` mantém o roteamento estático
+        metrics: histogramas de latência por nível, tipo e cache hit/miss
+            (compartilháveis entre instâncias)
+        strict_decoding: rejeitar respostas malformadas com
+            ``OracleDecodeError`` em vez de anotá-las em ``caveats``
     """
 
     def __init__(
         self,
         llm_endpoint: Any = None,
         lrm_endpoint: Any = None,
+        response_cache: OracleResponseCache | None = None,
+        coalesce: bool = True,
+        policy: InvocationPolicy | None = None,
+        seed: int | None = None,
+        classifier: TaskClassifier | None = None,
+        router: AdaptiveRouter | None = None,
+        metrics: OracleMetrics | None = None,
+        strict_decoding: bool = False,
     ) -> None:
         self.llm = llm_endpoint
         self.lrm = lrm_endpoint
+        self.cache = response_cache
+        self.flights = SingleFlight() if coalesce else None
+        self.async_flights = AsyncSingleFlight() if coalesce else None
+        self.batch_fallbacks = 0
+        self.pool_fallbacks = 0
+        self.policy = policy or InvocationPolicy()
+        self.latencies = {tier: LatencyWindow() for tier in ModelTier}
+        self.retries = 0
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+        self._rng = random.Random(seed)
+        self.classifier = classifier or (
+            router.classifier if router else TaskClassifier()
+        )
+        self.router = router
+        self.metrics = metrics or OracleMetrics()
+        self.strict_decoding = strict_decoding
+        self.query_template = PromptTemplate(QUERY_PREFIX)
+        self.batch_template = PromptTemplate(BATCH_QUERY_PREFIX)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, Any],
+        llm_endpoint: Any = None,
+        lrm_endpoint: Any = None,
+    ) -> OracleQuery:
+        """Constrói o motor a partir do bridge-config completo.
+
+        Configura o cache de respostas (``oracle_cache``), a política de
+        invocação (timeouts, ``max_retries`` e ``oracle_invocation``) e o
+        classificador de tarefas (``routing``); com ``routing.adaptive``
+        ativa também o ``AdaptiveRouter``. Listas de endpoints viram um
+        ``EndpointPool`` configurado por ``endpoint_pool``.
+        """
+        bridge = config.get("bridge", config)
+        pool_config = bridge.get("endpoint_pool", {})
+        if isinstance(llm_endpoint, (list, tuple)):
+            llm_endpoint = EndpointPool.from_config(llm_endpoint, pool_config)
+        if isinstance(lrm_endpoint, (list, tuple)):
+            lrm_endpoint = EndpointPool.from_config(lrm_endpoint, pool_config)
+        routing = bridge.get("routing", {})
+        classifier = TaskClassifier.from_config(routing)
+        router = (
+            AdaptiveRouter.from_config(config, classifier)
+            if routing.get("adaptive", False) else None
+        )
+        return cls(
+            llm_endpoint=llm_endpoint,
+            lrm_endpoint=lrm_endpoint,
+            response_cache=OracleResponseCache.from_config(
+                bridge.get("oracle_cache", {})
+            ),
+            policy=InvocationPolicy.from_config(config),
+            classifier=classifier,
+            router=router,
+        )
 
     # -----------------------------------------------------------------------
     # Consulta genérica com contexto
@@ -131,8 +773,7 @@ class OracleQuery:
         constraints: list[str] | None = None,
         oracle_type: OracleType = OracleType.FIRST_ORDER,
     ) -> OracleResponse:
-        """
-        Consulta oracular com contexto e restrições.
+        """Consulta oracular com contexto e restrições.
 
         Args:
             question: Pergunta em linguagem natural
@@ -142,42 +783,285 @@ class OracleQuery:
 
         Returns:
             OracleResponse com resposta estruturada e metadados epistêmicos
+
+        Raises:
+            OracleOverloadedError: roteador adaptativo rejeitou a consulta
         """
         constraints = constraints or []
 
         # Heurística de Roteamento: determinar o modelo adequado
-        model_tier = self._classify_task(question, constraints)
-        prompt = self._construct_prompt(question, context, constraints)
+        decision, model_tier, prompt = self._prepare_query(
+            question, context, constraints
+        )
+        return self._answer(question, decision, model_tier, prompt, oracle_type)
 
-        # Invocar o oráculo apropriado
-        if model_tier == ModelTier.SYSTEM_2_LRM and self.lrm:
-            raw = self._invoke_oracle(self.lrm, prompt)
-        elif self.llm:
-            raw = self._invoke_oracle(self.llm, prompt)
+    async def query_with_context_async(
+        self,
+        question: str,
+        context: str,
+        constraints: list[str] | None = None,
+        oracle_type: OracleType = OracleType.FIRST_ORDER,
+    ) -> OracleResponse:
+        """Variante assíncrona de ``query_with_context``."""
+        constraints = constraints or []
+        decision, model_tier, prompt = self._prepare_query(
+            question, context, constraints
+        )
+
+        endpoint = self._select_endpoint(model_tier)
+        latency_ms = 0.0
+        if endpoint is not None:
+            async with self._queued_slot_async(decision, model_tier):
+                raw, latency_ms = await self._cached_invoke_async(
+                    endpoint, prompt, model_tier, oracle_type.value
+                )
         else:
             raw = self._simulate_response(question)
 
-        return self._parse_response(raw, oracle_type, model_tier)
+        response = self._parse_response(raw, oracle_type, model_tier)
+        response.latency_ms = latency_ms
+        response.routing = decision
+        return response
+
+    def stream_with_context(
+        self,
+        question: str,
+        context: str,
+        constraints: list[str] | None = None,
+        oracle_type: OracleType = OracleType.FIRST_ORDER,
+    ) -> Iterator[StreamEvent]:
+        """Consulta oracular em streaming.
+
+        Com endpoints que expõem ``generate_stream``, cada campo de topo da
+        resposta JSON é emitido assim que se completa — ``confidence`` e
+        ``answer`` chegam antes do fim da geração. O último evento traz a
+        ``OracleResponse`` completa. Interromper a iteração (ex.: confiança
+        baixa) encerra o stream do endpoint.
+
+        Endpoints sem streaming, respostas em cache e a simulação produzem
+        os mesmos eventos a partir da resposta completa.
+
+        Yields:
+            StreamEvent por campo completado e um evento final com a resposta
+        """
+        constraints = constraints or []
+        decision, model_tier, prompt = self._prepare_query(
+            question, context, constraints
+        )
+        start = time.perf_counter_ns()
+        endpoint = self._select_endpoint(model_tier)
+        if endpoint is None:
+            chunks: Iterator[str] = iter((self._simulate_response(question),))
+        else:
+            chunks = self._stream_chunks(
+                endpoint, prompt, model_tier, oracle_type.value
+            )
+
+        parser = IncrementalJSONParser()
+        # A vaga fica reservada durante todo o stream, mas o contexto só é
+        # marcado enquanto um fragmento é produzido: entre os ``yield`` o
+        # contexto pertence ao consumidor.
+        with self._queued_slot(decision, model_tier, mark=False) as reserved:
+            try:
+                while (chunk := self._next_chunk(chunks, reserved)) is not None:
+                    for name, value in parser.feed(chunk):
+                        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+                        yield StreamEvent(name, value, elapsed_ms)
+            finally:
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+
+        response = self._parse_response(parser.text, oracle_type, model_tier)
+        if endpoint is not None:
+            response.latency_ms = (time.perf_counter_ns() - start) / 1e6
+        response.routing = decision
+        yield StreamEvent(None, elapsed_ms=response.latency_ms, response=response)
+
+    def query_batch(
+        self,
+        questions: Sequence[str],
+        context: str,
+        constraints: list[str] | None = None,
+        oracle_type: OracleType = OracleType.FIRST_ORDER,
+    ) -> list[OracleResponse]:
+        """Várias perguntas sobre o mesmo contexto, enviando o contexto uma vez.
+
+        As perguntas são agrupadas por nível do modelo; cada grupo com duas
+        ou mais perguntas fora do cache vira um único prompt numerado
+        (``batch_template``). Cada resposta é gravada no cache sob a chave da
+        pergunta individual. Itens ausentes ou inválidos, grupos unitários e
+        perguntas enfileiradas pelo roteador recaem em ``query_with_context``.
+
+        Uma pergunta rejeitada pelo roteador (SHED, inclusive por prazo de
+        fila esgotado) não interrompe o lote: sua resposta tem confiança 0.0
+        e ``routing`` com a decisão de rejeição.
+
+        Returns:
+            Respostas na mesma ordem das perguntas
+        """
+        constraints = constraints or []
+        kind = oracle_type.value
+        results: list[OracleResponse | None] = [None] * len(questions)
+        prepared: dict[int, tuple[RoutingDecision | None, ModelTier, str]] = {}
+        groups: dict[ModelTier, list[tuple[int, str, RoutingDecision | None]]] = {}
+
+        for i, question in enumerate(questions):
+            start = time.perf_counter_ns()
+            try:
+                decision, tier, prompt = self._prepare_query(
+                    question, context, constraints
+                )
+            except OracleOverloadedError as exc:
+                results[i] = self._shed_response(exc.decision)
+                continue
+            prepared[i] = (decision, tier, prompt)
+            if decision is not None and decision.action == RouteAction.QUEUE:
+                continue  # Aguarda vaga individualmente, após o lote.
+            key = make_cache_key(prompt, tier.value, kind)
+            raw = self.cache.get(key) if self.cache is not None else None
+            if raw is None:
+                groups.setdefault(tier, []).append((i, key, decision))
+                continue
+            response = self._parse_response(raw, oracle_type, tier)
+            response.latency_ms = self._record_latency(start, tier, kind, True)
+            response.routing = decision
+            results[i] = response
+
+        for tier, members in groups.items():
+            endpoint = self._select_endpoint(tier)
+            if endpoint is None or len(members) < 2:
+                continue
+            prompt = self.batch_template.render_batch(
+                [questions[i] for i, _, _ in members], context, constraints
+            )
+            start = time.perf_counter_ns()
+            try:
+                raw = self._invoke_oracle(endpoint, prompt)
+            except Exception:
+                # Falha do lote inteiro: cada pergunta recai na chamada individual.
+                raw = ""
+            latency_ms = self._record_latency(start, tier, f"{kind}_batch", False)
+            items = self._split_batch(raw, len(members), "answer")
+            for (i, key, decision), item in zip(members, items, strict=True):
+                if item is None:
+                    self.batch_fallbacks += 1
+                    continue
+                raw_item = json.dumps(item, ensure_ascii=False)
+                self._store(key, raw_item)
+                response = self._parse_response(raw_item, oracle_type, tier)
+                response.latency_ms = latency_ms
+                response.routing = decision
+                results[i] = response
+
+        answered: list[OracleResponse] = []
+        for i, result in enumerate(results):
+            if result is None:
+                try:
+                    result = self._answer(questions[i], *prepared[i], oracle_type)
+                except OracleOverloadedError as exc:
+                    result = self._shed_response(exc.decision)
+            answered.append(result)
+        return answered
 
     # -----------------------------------------------------------------------
     # Consulta de alinhamento semântico
     # -----------------------------------------------------------------------
 
     def query_alignment(self, query: SemanticAlignmentQuery) -> AlignmentResponse:
-        """
-        Consulta oracular para alinhamento semântico entre protocolos.
+        """Consulta oracular para alinhamento semântico entre protocolos.
 
         Implementa o Protocolo de Consulta Oracular (seção 4.2.2).
         """
         prompt = self._construct_alignment_prompt(query)
 
         if self.llm:
-            raw = self._invoke_oracle(self.llm, prompt)
+            raw, _ = self._cached_invoke(
+                self.llm, prompt, ModelTier.SYSTEM_1_LLM, "alignment"
+            )
+        else:
+            raw = self._simulate_alignment(query)
+
+        return self._parse_alignment(raw)
+
+    async def query_alignment_async(
+        self, query: SemanticAlignmentQuery
+    ) -> AlignmentResponse:
+        """Variante assíncrona de ``query_alignment``."""
+        prompt = self._construct_alignment_prompt(query)
+
+        if self.llm:
+            raw, _ = await self._cached_invoke_async(
+                self.llm, prompt, ModelTier.SYSTEM_1_LLM, "alignment"
+            )
         else:
             raw = self._simulate_alignment(query)
 
         return self._parse_alignment(raw)
 
+    def query_alignments(
+        self, queries: Sequence[SemanticAlignmentQuery]
+    ) -> list[AlignmentResponse]:
+        """Alinha várias consultas com uma única chamada ao oráculo.
+
+        Consultas já presentes no cache de respostas não entram no lote. A
+        resposta do lote é dividida por item e cada item é gravado no cache
+        sob a chave da consulta individual; itens ausentes ou inválidos
+        recaem em ``query_alignment`` individual.
+
+        Args:
+            queries: Consultas de alinhamento, em qualquer quantidade
+
+        Returns:
+            Respostas na mesma ordem das consultas
+        """
+        if not self.llm or len(queries) < 2:
+            return [self.query_alignment(q) for q in queries]
+
+        tier = ModelTier.SYSTEM_1_LLM.value
+        keys = [
+            make_cache_key(self._construct_alignment_prompt(q), tier, "alignment")
+            for q in queries
+        ]
+        results: list[AlignmentResponse | None] = [None] * len(queries)
+        pending: list[int] = []
+        for i, key in enumerate(keys):
+            raw = self.cache.get(key) if self.cache is not None else None
+            if raw is None:
+                pending.append(i)
+            else:
+                results[i] = self._parse_alignment(raw)
+
+        if len(pending) > 1:
+            prompt = self._construct_batch_alignment_prompt(
+                [queries[i] for i in pending]
+            )
+            start = time.perf_counter_ns()
+            try:
+                raw = self._invoke_oracle(self.llm, prompt)
+                self._record_latency(
+                    start, ModelTier.SYSTEM_1_LLM, "alignment_batch", False
+                )
+            except Exception:
+                # Falha do lote inteiro: cada item recai na chamada individual.
+                raw = ""
+            items = self._split_batch(raw, len(pending), "relation")
+            for i, item in zip(pending, items, strict=True):
+                if item is None:
+                    self.batch_fallbacks += 1
+                    continue
+                raw_item = json.dumps(item, ensure_ascii=False)
+                self._store(keys[i], raw_item)
+                results[i] = self._parse_alignment(raw_item)
+
+        # Itens rejeitados pelo lote e o pendente único (sem lote) vão um a um.
+        answered: list[AlignmentResponse] = []
+        for query, response in zip(queries, results, strict=True):
+            if response is None:
+                response = self.query_alignment(query)
+            answered.append(response)
+        return answered
+
     # -----------------------------------------------------------------------
     # Métodos Internos
     # -----------------------------------------------------------------------
@@ -185,55 +1069,36 @@ class OracleQuery:
     def _classify_task(
         self, question: str, constraints: list[str]
     ) -> ModelTier:
-        """
-        Heurística de Roteamento LLM/LRM (seção 7.1.3).
+        """Heurística de Roteamento LLM/LRM (seção 7.1.3).
 
         Classifica a tarefa para direcionar ao tipo de oráculo adequado:
         - LLM: tradução, resumo, formatação
         - LRM: cálculos, compliance, otimização
-        """
-        lrm_keywords = [
-            "calcul", "orçament", "fundeb", "pdde", "compliance",
-            "otimiz", "rota", "nutricional", "pnae", "lei", "legal",
-            "audit", "verific", "consistên",
-        ]
-
-        text = (question + " ".join(constraints)).lower()
-        for kw in lrm_keywords:
-            if kw in text:
-                return ModelTier.SYSTEM_2_LRM
 
-        return ModelTier.SYSTEM_1_LLM
+        Delegada ao ``TaskClassifier`` compilado (regras configuráveis).
+        """
+        return self.classifier.classify(question, constraints)
 
     def _construct_prompt(
         self, question: str, context: str, constraints: list[str]
     ) -> str:
-        """Constrói prompt estruturado para consulta oracular."""
-        constraints_text = "\n".join(f"  - {c}" for c in constraints) if constraints else "  (nenhuma)"
-
-        return f"""Contexto:
-{context}
+        """Constrói prompt estruturado para consulta oracular.
 
-Pergunta:
-{question}
-
-Restrições:
-{constraints_text}
-  - Responder apenas com base no contexto fornecido
-  - Indicar nível de confiança (0-1)
-  - Citar fontes quando aplicável
-
-Formato de resposta (JSON):
-{{
-  "answer": "...",
-  "confidence": 0.X,
-  "sources": [...],
-  "caveats": [...]
-}}"""
+        Ordem estável para caches de prefixo: instruções e formato de
+        resposta, depois o contexto (internado) e por fim a pergunta.
+        """
+        return self.query_template.render(question, context, constraints)
 
     def _construct_alignment_prompt(self, query: SemanticAlignmentQuery) -> str:
         """Constrói prompt para consulta de alinhamento semântico."""
-        return f"""Alinhe semanticamente os conceitos entre protocolos:
+        return f"""Alinhe semanticamente os conceitos entre protocolos.
+
+Determine:
+1. Relação semântica (≡ equivalente, ⊑ subsume, ⊒ superclasse, ⊥ disjunto)
+2. Mapeamento de campos
+3. Lacunas semânticas e resoluções propostas
+
+Responda em JSON.
 
 Origem:
   Protocolo: {query.source_protocol}
@@ -244,19 +1109,507 @@ Destino:
   Protocolo: {query.target_protocol}
   Conceito: {query.target_concept}
 
-Restrições: {', '.join(query.constraints) if query.constraints else 'nenhuma'}
+Restrições: {', '.join(query.constraints) if query.constraints else 'nenhuma'}"""
 
-Determine:
+    def _construct_batch_alignment_prompt(
+        self, queries: Sequence[SemanticAlignmentQuery]
+    ) -> str:
+        """Constrói um único prompt com vários pares de conceitos numerados."""
+        blocks = []
+        for i, q in enumerate(queries):
+            constraints = ", ".join(q.constraints) if q.constraints else "nenhuma"
+            blocks.append(
+                f"Item {i}:\n"
+                f"  Origem: {q.source_protocol}.{q.source_concept} — "
+                f"{q.source_definition}\n"
+                f"  Destino: {q.target_protocol}.{q.target_concept}\n"
+                f"  Restrições: {constraints}"
+            )
+        items = "\n\n".join(blocks)
+
+        return f"""Alinhe semanticamente cada par de conceitos entre protocolos.
+
+Para cada item, determine:
 1. Relação semântica (≡ equivalente, ⊑ subsume, ⊒ superclasse, ⊥ disjunto)
 2. Mapeamento de campos
 3. Lacunas semânticas e resoluções propostas
 
-Responda em JSON."""
+Responda com um array JSON, um objeto por item, na mesma ordem:
+{_BATCH_ALIGNMENT_FORMAT}
+
+{items}"""
+
+    @staticmethod
+    def _split_batch(
+        raw: str, size: int, required: str
+    ) -> list[dict[str, Any] | None]:
+        """Divide a resposta de um lote em objetos por item.
+
+        Aceita um array JSON ou um objeto ``{"items": [...]}``. O campo ``id``
+        posiciona o item quando válido; caso contrário vale a ordem. Itens sem
+        o campo ``required`` ficam como None (recaem na consulta individual).
+        """
+        items: list[dict[str, Any] | None] = [None] * size
+        try:
+            data = json_loads(raw)
+        except (ValueError, TypeError):
+            return items
+        if isinstance(data, dict):
+            data = data.get("items")
+        if not isinstance(data, list):
+            return items
+
+        for position, item in enumerate(data):
+            if not isinstance(item, dict) or required not in item:
+                continue
+            index = item.get("id", position)
+            if not isinstance(index, int) or not 0 <= index < size:
+                index = position
+            if index < size and items[index] is None:
+                items[index] = {k: v for k, v in item.items() if k != "id"}
+        return items
+
+    def _answer(
+        self,
+        question: str,
+        decision: RoutingDecision | None,
+        model_tier: ModelTier,
+        prompt: str,
+        oracle_type: OracleType,
+    ) -> OracleResponse:
+        """Invoca o oráculo para uma consulta já roteada (``_prepare_query``).
+
+        Consultas enfileiradas aguardam vaga no nível antes da invocação.
+
+        Raises:
+            OracleOverloadedError: a vaga não foi obtida no prazo do nível
+        """
+        endpoint = self._select_endpoint(model_tier)
+        latency_ms = 0.0
+        if endpoint is not None:
+            with self._queued_slot(decision, model_tier):
+                raw, latency_ms = self._cached_invoke(
+                    endpoint, prompt, model_tier, oracle_type.value
+                )
+        else:
+            raw = self._simulate_response(question)
+
+        response = self._parse_response(raw, oracle_type, model_tier)
+        response.latency_ms = latency_ms
+        response.routing = decision
+        return response
+
+    @staticmethod
+    def _shed_response(decision: RoutingDecision) -> OracleResponse:
+        """Resposta de uma pergunta rejeitada pelo roteador em um lote."""
+        return OracleResponse(
+            answer="",
+            confidence=0.0,
+            caveats=[f"Consulta rejeitada pelo roteador: {decision.reason}"],
+            model_tier=decision.tier,
+            routing=decision,
+        )
+
+    def _prepare_query(
+        self, question: str, context: str, constraints: list[str]
+    ) -> tuple[RoutingDecision | None, ModelTier, str]:
+        """Decisão de roteamento, nível do modelo e prompt da consulta."""
+        decision = self._route(question, constraints)
+        model_tier = (
+            decision.tier if decision else self._classify_task(question, constraints)
+        )
+        prompt = self._construct_prompt(question, context, constraints)
+        return decision, model_tier, prompt
+
+    @staticmethod
+    def _queue_timeout(decision: RoutingDecision) -> OracleOverloadedError:
+        """Erro para consulta enfileirada que não obteve vaga no prazo."""
+        return OracleOverloadedError(
+            replace(decision, action=RouteAction.SHED, reason="queue_timeout")
+        )
+
+    @contextmanager
+    def _queued_slot(
+        self,
+        decision: RoutingDecision | None,
+        model_tier: ModelTier,
+        mark: bool = True,
+    ) -> Iterator[ModelTier | None]:
+        """Reserva a vaga de uma consulta enfileirada (QUEUE) durante o bloco.
+
+        Sem decisão QUEUE não há espera. Com ``mark``, as chamadas ao
+        endpoint feitas no bloco ocupam a vaga reservada em vez de abrir
+        outra.
+
+        Yields:
+            O nível reservado, ou None se a consulta não foi enfileirada
+
+        Raises:
+            OracleOverloadedError: a vaga não foi obtida no prazo do nível
+        """
+        router = self.router
+        if router is None or decision is None or decision.action != RouteAction.QUEUE:
+            yield None
+            return
+        if not router.wait_for_slot(model_tier, self.policy.timeout_s(model_tier)):
+            raise self._queue_timeout(decision)
+        token = _RESERVED_SLOT.set(model_tier) if mark else None
+        try:
+            yield model_tier
+        finally:
+            if token is not None:
+                _RESERVED_SLOT.reset(token)
+            router.release_slot(model_tier)
+
+    @staticmethod
+    def _next_chunk(chunks: Iterator[str], reserved: ModelTier | None) -> str | None:
+        """Próximo fragmento, produzido dentro da vaga reservada (se houver)."""
+        token = _RESERVED_SLOT.set(reserved)
+        try:
+            return next(chunks, None)
+        finally:
+            _RESERVED_SLOT.reset(token)
+
+    @asynccontextmanager
+    async def _queued_slot_async(
+        self, decision: RoutingDecision | None, model_tier: ModelTier
+    ) -> AsyncIterator[None]:
+        """Variante assíncrona de ``_queued_slot`` (a espera roda em thread).
+
+        Se a consulta for cancelada durante a espera, a vaga obtida depois
+        pela thread é devolvida.
+        """
+        router = self.router
+        if router is None or decision is None or decision.action != RouteAction.QUEUE:
+            yield
+            return
+        wait = asyncio.ensure_future(
+            asyncio.to_thread(
+                router.wait_for_slot, model_tier, self.policy.timeout_s(model_tier)
+            )
+        )
+
+        def release_if_acquired(done: asyncio.Future[bool]) -> None:
+            if not done.cancelled() and done.exception() is None and done.result():
+                router.release_slot(model_tier)
+
+        try:
+            acquired = await asyncio.shield(wait)
+        except asyncio.CancelledError:
+            wait.add_done_callback(release_if_acquired)
+            raise
+        if not acquired:
+            raise self._queue_timeout(decision)
+        token = _RESERVED_SLOT.set(model_tier)
+        try:
+            yield
+        finally:
+            _RESERVED_SLOT.reset(token)
+            router.release_slot(model_tier)
+
+    def _route(
+        self, question: str, constraints: list[str]
+    ) -> RoutingDecision | None:
+        """Decisão do roteador adaptativo; rejeita a consulta se SHED."""
+        if self.router is None:
+            return None
+        decision = self.router.decide(question, constraints)
+        if decision.action == RouteAction.SHED:
+            raise OracleOverloadedError(decision)
+        return decision
+
+    def _endpoint_tier(self, endpoint: Any) -> ModelTier:
+        """Nível efetivamente carregado por uma chamada ao endpoint."""
+        if self.lrm and endpoint is self.lrm:
+            return ModelTier.SYSTEM_2_LRM
+        return ModelTier.SYSTEM_1_LLM
+
+    @contextmanager
+    def _observed(self, endpoint: Any) -> Iterator[None]:
+        """Reporta ao roteador ocupação, latência e erro de uma chamada.
+
+        Cancelamentos (hedge perdedor, timeout, stream interrompido) apenas
+        liberam a vaga; o timeout é contabilizado como erro em
+        ``_invoke_oracle_async``. Dentro de uma vaga reservada por
+        ``_queued_slot`` a chamada não abre outra: só alimenta as EWMAs.
+        """
+        router = self.router
+        if router is None:
+            yield
+            return
+        tier = self._endpoint_tier(endpoint)
+        reserved = _RESERVED_SLOT.get() is tier
+        finish = router.observe if reserved else router.end
+        if not reserved:
+            router.begin(tier)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            finish(tier, (time.perf_counter() - start) * 1000, error=True)
+            raise
+        except BaseException:
+            # Cancelamento ou stream encerrado pelo consumidor.
+            finish(tier)
+            raise
+        finish(tier, (time.perf_counter() - start) * 1000, error=False)
+
+    def _select_endpoint(self, model_tier: ModelTier) -> Any:
+        """Endpoint para o nível do modelo (LRM recai no LLM se ausente)."""
+        if model_tier == ModelTier.SYSTEM_2_LRM and self.lrm:
+            return self.lrm
+        return self.llm or None
+
+    def _cached_invoke(
+        self, endpoint: Any, prompt: str, model_tier: ModelTier, kind: str
+    ) -> tuple[str, float]:
+        """Invoca o oráculo consultando antes o cache de respostas.
+
+        Em caso de falta, chamadas idênticas simultâneas são coalescidas:
+        apenas a líder chega ao endpoint e grava o cache; as demais recebem
+        a mesma resposta bruta.
+
+        Returns:
+            Resposta bruta e latência da invocação (ms, relógio monotônico),
+            também registrada em ``self.metrics``
+        """
+        start = time.perf_counter_ns()
+        if self.cache is None and self.flights is None:
+            try:
+                raw = self._invoke_oracle(endpoint, prompt)
+            except PoolUnavailableError:
+                raw = self._pool_down_response(prompt, kind)
+            return raw, self._record_latency(start, model_tier, kind, False)
+
+        key = make_cache_key(prompt, model_tier.value, kind)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, self._record_latency(start, model_tier, kind, True)
+
+        def invoke() -> str:
+            try:
+                raw = self._invoke_oracle(endpoint, prompt)
+            except PoolUnavailableError:
+                return self._pool_down_response(prompt, kind)
+            self._store(key, raw)
+            return raw
+
+        raw = invoke() if self.flights is None else self.flights.do(key, invoke)
+        return raw, self._record_latency(start, model_tier, kind, False)
+
+    async def _cached_invoke_async(
+        self, endpoint: Any, prompt: str, model_tier: ModelTier, kind: str
+    ) -> tuple[str, float]:
+        """Variante assíncrona de ``_cached_invoke``."""
+        start = time.perf_counter_ns()
+        key = make_cache_key(prompt, model_tier.value, kind)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, self._record_latency(start, model_tier, kind, True)
+
+        async def invoke() -> str:
+            try:
+                raw = await self._invoke_oracle_async(endpoint, prompt, model_tier)
+            except PoolUnavailableError:
+                return self._pool_down_response(prompt, kind)
+            self._store(key, raw)
+            return raw
+
+        if self.async_flights is None:
+            raw = await invoke()
+        else:
+            raw = await self.async_flights.do(key, invoke)
+        return raw, self._record_latency(start, model_tier, kind, False)
+
+    def _record_latency(
+        self, start_ns: int, model_tier: ModelTier, kind: str, cache_hit: bool
+    ) -> float:
+        """Registra a latência desde ``start_ns`` e a retorna em ms."""
+        elapsed_us = (time.perf_counter_ns() - start_ns) // 1000
+        self.metrics.record(model_tier.value, kind, cache_hit, elapsed_us)
+        return elapsed_us / 1000
+
+    def _stream_chunks(
+        self, endpoint: Any, prompt: str, model_tier: ModelTier, kind: str
+    ) -> Iterator[str]:
+        """Fragmentos da resposta bruta para ``stream_with_context``.
+
+        Respostas em cache e endpoints sem ``generate_stream`` produzem um
+        único fragmento. O stream completo é gravado no cache; um stream
+        interrompido pelo consumidor não é gravado nem medido.
+        """
+        if not hasattr(endpoint, "generate_stream"):
+            raw, _ = self._cached_invoke(endpoint, prompt, model_tier, kind)
+            yield raw
+            return
+
+        start = time.perf_counter_ns()
+        key = make_cache_key(prompt, model_tier.value, kind)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._record_latency(start, model_tier, kind, True)
+                yield cached
+                return
+
+        stream = endpoint.generate_stream(prompt)
+        parts: list[str] = []
+        try:
+            with self._observed(endpoint):
+                for chunk in stream:
+                    parts.append(chunk)
+                    yield chunk
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        self._store(key, "".join(parts))
+        self._record_latency(start, model_tier, kind, False)
+
+    def _store(self, key: str, raw: str) -> None:
+        """Grava a resposta bruta no cache (negativa se não for JSON)."""
+        if self.cache is not None:
+            self.cache.put(key, raw, negative=not self._is_json_object(raw))
+
+    @staticmethod
+    def _is_json_object(raw: str) -> bool:
+        """Indica se a resposta bruta é um objeto JSON parseável."""
+        try:
+            return isinstance(json_loads(raw), dict)
+        except (ValueError, TypeError):
+            return False
 
     def _invoke_oracle(self, endpoint: Any, prompt: str) -> str:
         """Invoca o oráculo (LLM ou LRM) com o prompt construído."""
         if hasattr(endpoint, "generate"):
-            return endpoint.generate(prompt)
+            with self._observed(endpoint):
+                return endpoint.generate(prompt)
+        return self._simulate_response(prompt)
+
+    async def _invoke_oracle_async(
+        self,
+        endpoint: Any,
+        prompt: str,
+        model_tier: ModelTier = ModelTier.SYSTEM_1_LLM,
+    ) -> str:
+        """Invoca o oráculo aplicando a política de invocação.
+
+        Cada tentativa respeita o timeout do nível do modelo; falhas
+        transitórias (``policy.retry_on``) são retentadas até
+        ``max_retries`` vezes com backoff exponencial e jitter. Consultas
+        System 1 podem ser protegidas por hedging (``_hedged_call``).
+        Esgotadas as tentativas, a última exceção é propagada.
+        """
+        policy = self.policy
+        timeout = policy.timeout_s(model_tier)
+        hedge = policy.hedge and model_tier == ModelTier.SYSTEM_1_LLM
+        attempt = 0
+        while True:
+            try:
+                if hedge:
+                    return await self._hedged_call(
+                        endpoint, prompt, model_tier, timeout
+                    )
+                return await asyncio.wait_for(
+                    self._call_endpoint_async(endpoint, prompt, model_tier), timeout
+                )
+            except policy.retry_on as exc:
+                if self.router is not None and isinstance(exc, asyncio.TimeoutError):
+                    self.router.observe(self._endpoint_tier(endpoint), error=True)
+                if attempt >= policy.max_retries:
+                    raise
+            self.retries += 1
+            await asyncio.sleep(policy.backoff_s(attempt, self._rng))
+            attempt += 1
+
+    async def _hedged_call(
+        self, endpoint: Any, prompt: str, model_tier: ModelTier, timeout: float
+    ) -> str:
+        """Requisição com hedging, usando a primeira resposta que chegar.
+
+        Se a primeira requisição não responder até o p95 observado, dispara
+        uma segunda. Ambas compartilham o mesmo prazo (``timeout``); a perdedora é
+        cancelada.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + timeout
+        hedge_at = start + self._hedge_delay_ms(model_tier) / 1000
+        primary = asyncio.ensure_future(
+            self._call_endpoint_async(endpoint, prompt, model_tier)
+        )
+        pending = {primary}
+        hedged = False
+        try:
+            while True:
+                limit = deadline if hedged else min(hedge_at, deadline)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, limit - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                error: BaseException | None = None
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                if error is not None and not pending:
+                    raise error
+                if not done:
+                    if hedged or loop.time() >= deadline:
+                        raise asyncio.TimeoutError()
+                    hedged = True
+                    self.hedges_sent += 1
+                    pending.add(asyncio.ensure_future(
+                        self._call_endpoint_async(endpoint, prompt, model_tier)
+                    ))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _hedge_delay_ms(self, model_tier: ModelTier) -> float:
+        """p95 observado do nível, ou o atraso padrão com poucas amostras."""
+        window = self.latencies[model_tier]
+        if len(window) < self.policy.hedge_min_samples:
+            return self.policy.hedge_default_ms
+        return window.percentile(95) or self.policy.hedge_default_ms
+
+    async def _call_endpoint_async(
+        self, endpoint: Any, prompt: str, model_tier: ModelTier
+    ) -> str:
+        """Uma tentativa de chamada, sem bloquear o event loop.
+
+        Usa ``endpoint.generate_async`` quando disponível; caso contrário,
+        executa ``generate`` síncrono em uma thread de trabalho (o timeout
+        libera o chamador, mas não interrompe a thread).
+        """
+        start = time.perf_counter()
+        raw: str
+        if hasattr(endpoint, "generate_async"):
+            with self._observed(endpoint):
+                raw = await endpoint.generate_async(prompt)
+        else:
+            raw = await asyncio.to_thread(self._invoke_oracle, endpoint, prompt)
+        self.latencies[model_tier].record((time.perf_counter() - start) * 1000)
+        return raw
+
+    def _pool_down_response(self, prompt: str, kind: str) -> str:
+        """Resposta simulada quando todas as réplicas do pool estão ejetadas.
+
+        Não é gravada no cache: a próxima consulta volta a tentar o pool.
+        """
+        self.pool_fallbacks += 1
+        if kind == "alignment":
+            return json.dumps({
+                "relation": "⊥",
+                "confidence": 0.0,
+                "mapping": {},
+                "semantic_gaps": [],
+            })
         return self._simulate_response(prompt)
 
     def _simulate_response(self, question: str) -> str:
@@ -288,35 +1641,167 @@ Responda em JSON."""
     def _parse_response(
         self, raw: str, oracle_type: OracleType, model_tier: ModelTier
     ) -> OracleResponse:
-        """Parseia resposta do oráculo em estrutura tipada."""
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            data = {"answer": raw, "confidence": 0.5, "sources": [], "caveats": ["Parse falhou"]}
+        """Parseia resposta do oráculo em estrutura tipada (``RESPONSE_SCHEMA``).
 
-        return OracleResponse(
-            answer=data.get("answer", ""),
-            confidence=data.get("confidence", 0.5),
-            sources=data.get("sources", []),
-            caveats=data.get("caveats", []),
-            oracle_type=oracle_type,
-            model_tier=model_tier,
-        )
+        Raises:
+            OracleDecodeError: resposta malformada com ``strict_decoding``
+        """
+        try:
+            return RESPONSE_SCHEMA.decode(
+                raw,
+                self.strict_decoding,
+                oracle_type=oracle_type,
+                model_tier=model_tier,
+            )
+        except OracleDecodeError:
+            raise
+        except ValueError:
+            return OracleResponse(
+                answer=raw,
+                confidence=0.5,
+                caveats=["Parse falhou"],
+                oracle_type=oracle_type,
+                model_tier=model_tier,
+            )
 
     def _parse_alignment(self, raw: str) -> AlignmentResponse:
-        """Parseia resposta de alinhamento."""
+        """Parseia resposta de alinhamento (``ALIGNMENT_SCHEMA``).
+
+        Raises:
+            OracleDecodeError: resposta malformada com ``strict_decoding``
+        """
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            data = {"relation": "⊥", "confidence": 0.0, "mapping": {}, "semantic_gaps": []}
-
-        return AlignmentResponse(
-            relation=data.get("relation", "⊥"),
-            confidence=data.get("confidence", 0.0),
-            mapping=data.get("mapping", {}),
-            semantic_gaps=data.get("semantic_gaps", []),
+            return ALIGNMENT_SCHEMA.decode(raw, self.strict_decoding)
+        except OracleDecodeError:
+            raise
+        except ValueError:
+            return AlignmentResponse(relation="⊥", confidence=0.0)
+
+
+# ---------------------------------------------------------------------------
+# Micro-lotes de Alinhamento
+# ---------------------------------------------------------------------------
+
+class AlignmentBatcher:
+    """Agrupa consultas de alinhamento em micro-lotes (seção 14 — lote).
+
+    Consultas submetidas dentro de uma janela curta, ou até atingir o tamanho
+    máximo, são enviadas ao oráculo como um único prompt multi-item via
+    ``OracleQuery.query_alignments``. Cada chamador recebe um ``Future`` com
+    a sua resposta.
+
+    Args:
+        oracle: motor de consulta usado para despachar os lotes
+        max_batch_size: tamanho que dispara o envio imediato do lote
+        window_ms: espera máxima desde a primeira consulta do lote
+        max_concurrent_batches: lotes despachados em paralelo
+    """
+
+    def __init__(
+        self,
+        oracle: OracleQuery,
+        max_batch_size: int = 16,
+        window_ms: float = 20.0,
+        max_concurrent_batches: int = 4,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size deve ser >= 1")
+        self.oracle = oracle
+        self.max_batch_size = max_batch_size
+        self.window_ms = window_ms
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_batches, thread_name_prefix="oracle-batch"
+        )
+        self._lock = threading.Lock()
+        self._pending: list[
+            tuple[SemanticAlignmentQuery, Future[AlignmentResponse]]
+        ] = []
+        self._timer: threading.Timer | None = None
+        self.batches = 0
+        self.items = 0
+
+    @classmethod
+    def from_config(
+        cls, oracle: OracleQuery, config: Mapping[str, Any]
+    ) -> AlignmentBatcher | None:
+        """Constrói o agrupador a partir da seção ``oracle_batch`` de bridge-config.
+
+        Returns:
+            AlignmentBatcher configurado, ou None quando ``enabled`` é falso.
+        """
+        if not config.get("enabled", True):
+            return None
+        return cls(
+            oracle,
+            max_batch_size=int(config.get("max_batch_size", 16)),
+            window_ms=float(config.get("window_ms", 20.0)),
+            max_concurrent_batches=int(config.get("max_concurrent_batches", 4)),
         )
 
+    def submit(self, query: SemanticAlignmentQuery) -> Future[AlignmentResponse]:
+        """Enfileira a consulta no lote corrente e retorna o seu Future."""
+        future: Future[AlignmentResponse] = Future()
+        with self._lock:
+            self._pending.append((query, future))
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def align(self, query: SemanticAlignmentQuery) -> AlignmentResponse:
+        """Submete a consulta e bloqueia até a resposta do lote."""
+        return self.submit(query).result()
+
+    async def align_async(self, query: SemanticAlignmentQuery) -> AlignmentResponse:
+        """Submete a consulta e aguarda a resposta sem bloquear o event loop."""
+        return await asyncio.wrap_future(self.submit(query))
+
+    def flush(self) -> None:
+        """Despacha imediatamente o lote corrente, se houver."""
+        with self._lock:
+            self._dispatch_locked()
+
+    def close(self) -> None:
+        """Despacha o lote pendente e aguarda o término dos lotes em voo."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> AlignmentBatcher:
+        """Usa o batcher como contexto."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Envia os pendentes e encerra o executor."""
+        self.close()
+
+    def _dispatch_locked(self) -> None:
+        """Retira o lote pendente e o envia ao executor (com o lock tomado)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.items += len(batch)
+        self._executor.submit(self._run, batch)
+
+    def _run(
+        self, batch: list[tuple[SemanticAlignmentQuery, Future[AlignmentResponse]]]
+    ) -> None:
+        """Executa um lote e resolve os Futures dos chamadores."""
+        try:
+            responses = self.oracle.query_alignments([q for q, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), response in zip(batch, responses, strict=True):
+            future.set_result(response)
+
 
 # ---------------------------------------------------------------------------
 # Demonstração
@@ -0,0 +1,195 @@
+"""oracle_stream.py — Parsing Incremental de Respostas Oraculares (NL-Agent Framework).
+
+Respostas longas do LRM chegam em fragmentos (``generate_stream``). Em vez
+de esperar o texto completo para um ``json.loads``, o parser incremental
+acompanha o objeto JSON de topo e entrega cada campo assim que o seu valor
+termina — tipicamente ``confidence`` muito antes do fim de ``answer``.
+
+Escopo:
+    - Apenas o objeto de topo é acompanhado; valores aninhados são
+      entregues inteiros quando se fecham
+    - Texto antes do primeiro ``{`` (preâmbulo em prosa) é ignorado
+    - O parse final continua a cargo de ``OracleQuery._parse_response``
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Próximo caractere relevante dentro de uma string JSON.
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class IncrementalJSONParser:
+    """Parser incremental de um objeto JSON de topo.
+
+    Exemplo::
+
+        parser = IncrementalJSONParser()
+        for chunk in endpoint.generate_stream(prompt):
+            for name, value in parser.feed(chunk):
+                ...  # campo de topo completo
+        parser.done  # objeto fechado
+
+    Campos cujo valor não é JSON válido tornam ``failed`` verdadeiro e o
+    parser deixa de emitir (o chamador recai no parse do texto completo).
+    """
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {}
+        self.done = False
+        self.failed = False
+        # Fragmentos recebidos (``text`` os une sob demanda) e o trecho já
+        # recebido do token em andamento: cada fragmento é varrido uma única
+        # vez, sem concatenar o texto inteiro a cada ``feed``.
+        self._chunks: list[str] = []
+        self._partial: list[str] = []
+        self._skip = 0  # Caractere escapado que ficou para o próximo fragmento.
+        self._depth = 0
+        self._expect = "object"  # object | key | colon | value | comma
+        self._in_string = False
+        self._kind = ""  # Valor corrente: string | container | scalar
+        self._start = 0
+        self._key = ""
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Consome um fragmento e retorna os campos de topo recém-completados.
+
+        Returns:
+            Lista de pares (nome, valor), na ordem em que se completaram
+        """
+        if self.done or not chunk:
+            return []
+        self._chunks.append(chunk)  # Após uma falha, ``text`` segue completo.
+        if self.failed:
+            return []
+        completed: list[tuple[str, Any]] = []
+        text = chunk
+        i, self._skip = self._skip, 0
+        end = len(text)
+
+        while i < end:
+            if self._in_string:
+                found = _STRING_SPECIAL.search(text, i)
+                if found is None:
+                    i = end
+                    break
+                i = found.start()
+                if text[i] == "\\":
+                    if i + 1 >= end:
+                        self._skip = 1  # Escape dividido entre fragmentos.
+                        i = end
+                        break
+                    i += 2
+                    continue
+                self._in_string = False
+                if self._expect == "key":
+                    self._key = json.loads(self._token(text, i + 1))
+                    self._expect = "colon"
+                elif self._kind == "string":
+                    self._complete(self._token(text, i + 1), completed)
+                i += 1
+                continue
+
+            char = text[i]
+            expect = self._expect
+            if expect == "object":
+                if char == "{":
+                    self._depth = 1
+                    self._expect = "key"
+            elif expect == "key":
+                if char == '"':
+                    self._in_string = True
+                    self._start = i
+                elif char == "}":
+                    self.done = True
+                    break
+            elif expect == "colon":
+                if char == ":":
+                    self._expect = "value"
+                    self._kind = ""
+            elif expect == "value":
+                i = self._scan_value(text, i, completed)
+                if self.done or self.failed:
+                    break
+            elif expect == "comma":
+                if char == ",":
+                    self._expect = "key"
+                elif char == "}":
+                    self.done = True
+                    break
+            i += 1
+
+        if self._in_string or (self._expect == "value" and self._kind):
+            # Token aberto: guarda o trecho deste fragmento e continua do
+            # início do próximo.
+            self._partial.append(text[self._start :])
+            self._start = 0
+        return completed
+
+    def _token(self, text: str, stop: int) -> str:
+        """Texto do token corrente, inclusive trechos de fragmentos anteriores."""
+        if not self._partial:
+            return text[self._start : stop]
+        self._partial.append(text[self._start : stop])
+        token = "".join(self._partial)
+        self._partial.clear()
+        return token
+
+    def _scan_value(self, text: str, i: int, completed: list[tuple[str, Any]]) -> int:
+        """Avança um caractere dentro de um valor; retorna o índice corrente."""
+        char = text[i]
+        kind = self._kind
+        if not kind:
+            if char.isspace():
+                return i
+            self._start = i
+            if char == '"':
+                self._kind = "string"
+                self._in_string = True
+            elif char in "{[":
+                self._kind = "container"
+                self._depth += 1
+            else:
+                self._kind = "scalar"
+            return i
+
+        if kind == "container":
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._complete(self._token(text, i + 1), completed)
+        elif kind == "scalar" and (char in ",}" or char.isspace()):
+            self._complete(self._token(text, i), completed)
+            if char == ",":
+                self._expect = "key"
+            elif char == "}":
+                self.done = True
+        return i
+
+    def _complete(self, raw_value: str, completed: list[tuple[str, Any]]) -> None:
+        """Decodifica o valor de um campo de topo e o registra."""
+        try:
+            value = json.loads(raw_value)
+        except json.JSONDecodeError:
+            self.failed = True
+            return
+        self.fields[self._key] = value
+        completed.append((self._key, value))
+        self._expect = "comma"
+        self._kind = ""
+
+    @property
+    def text(self) -> str:
+        """Texto bruto acumulado até aqui."""
+        if len(self._chunks) > 1:
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
@@ -0,0 +1,459 @@
+"""oracle_stub.py — Oráculo Stub Determinístico (NL-Agent Framework).
+
+Substituto local do LLM/LRM para testes de carga e de latência. Ao
+contrário de ``OracleQuery._simulate_response`` (instantâneo), o stub
+reproduz o comportamento temporal de um oráculo real:
+
+    - Latência amostrada por nível (ex.: LLM lognormal ~180 ms, LRM ~30 s)
+    - Taxa de erros injetados (``StubOracleError``, um ``ConnectionError``,
+      que a ``InvocationPolicy`` trata como transitório)
+    - Respostas JSON fixas ou com marcadores (``{question}``, ``{call}``,
+      ``{tier}``), nos formatos individual, em lote e de alinhamento
+    - Semente: a mesma sequência de chamadas gera as mesmas latências,
+      erros e respostas; cada chamada deriva o seu gerador de (semente,
+      prompt, ocorrência), independente da ordem entre threads
+    - ``time_scale`` comprime o tempo (0.01 → LRM de 30 s em 300 ms)
+
+Disponível em processo (``StubOracle``) e como servidor HTTP em localhost
+(``StubOracleServer`` + cliente ``HTTPStubEndpoint``)::
+
+    python -m src.core.oracle_stub --port 8088 --seed 7 --time-scale 0.1
+
+Autor: Framework NL-Agent, 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class StubOracleError(ConnectionError):
+    """Falha injetada pelo stub (tratada como transitória pela política)."""
+
+
+# ---------------------------------------------------------------------------
+# Perfis de Latência e Erro
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Distribuição de latência de um nível do oráculo.
+
+    Args:
+        distribution: ``lognormal`` (mediana e sigma), ``uniform``
+            (entre ``min_ms`` e ``max_ms``) ou ``constant`` (mediana)
+        median_ms: mediana da distribuição
+        sigma: desvio do logaritmo (lognormal)
+        min_ms: piso da latência amostrada
+        max_ms: teto da latência amostrada (None = sem teto)
+    """
+
+    distribution: str = "lognormal"
+    median_ms: float = 180.0
+    sigma: float = 0.35
+    min_ms: float = 0.0
+    max_ms: float | None = None
+
+    def __post_init__(self) -> None:
+        """Valida o nome da distribuição."""
+        if self.distribution not in ("lognormal", "uniform", "constant"):
+            raise ValueError(f"Distribuição desconhecida: {self.distribution}")
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """Amostra uma latência (ms) com o gerador dado."""
+        if self.distribution == "lognormal":
+            value = rng.lognormvariate(math.log(self.median_ms), self.sigma)
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.min_ms, self.max_ms or self.median_ms * 2)
+        else:
+            value = self.median_ms
+        value = max(value, self.min_ms)
+        return value if self.max_ms is None else min(value, self.max_ms)
+
+
+@dataclass(frozen=True)
+class StubProfile:
+    """Latência e taxa de erro de um nível do oráculo stub."""
+
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> StubProfile:
+        """Constrói o perfil a partir de uma entrada de ``oracle_stub``."""
+        max_ms = config.get("max_ms")
+        return cls(
+            latency=LatencyModel(
+                distribution=config.get("distribution", "lognormal"),
+                median_ms=float(config.get("median_ms", 180)),
+                sigma=float(config.get("sigma", 0.35)),
+                min_ms=float(config.get("min_ms", 0)),
+                max_ms=float(max_ms) if max_ms is not None else None,
+            ),
+            error_rate=float(config.get("error_rate", 0.0)),
+        )
+
+
+LLM_PROFILE = StubProfile(
+    LatencyModel("lognormal", median_ms=180.0, sigma=0.35, min_ms=20.0),
+    error_rate=0.01,
+)
+LRM_PROFILE = StubProfile(
+    LatencyModel("lognormal", median_ms=30_000.0, sigma=0.25, min_ms=5_000.0),
+    error_rate=0.02,
+)
+
+DEFAULT_ANSWERS: tuple[Mapping[str, Any], ...] = (
+    {
+        "answer": "[stub {tier} #{call}] {question}",
+        "confidence": 0.85,
+        "sources": ["oracle_stub"],
+        "caveats": [],
+    },
+)
+
+DEFAULT_ALIGNMENTS: tuple[Mapping[str, Any], ...] = (
+    {"relation": "⊑", "confidence": 0.9, "mapping": {}, "semantic_gaps": []},
+    {"relation": "≡", "confidence": 0.8, "mapping": {}, "semantic_gaps": []},
+)
+
+_QUESTION = re.compile(r"^Pergunta:\n(.*?)(?:\n\n|\Z)", re.M | re.S)
+_NUMBERED_QUESTION = re.compile(r"^Pergunta (\d+):\n(.*?)(?:\n\n|\Z)", re.M | re.S)
+_NUMBERED_ITEM = re.compile(r"^Item (\d+):", re.M)
+_ALIGNMENT_MARK = "Alinhe semanticamente"
+
+
+# ---------------------------------------------------------------------------
+# Oráculo em Processo
+# ---------------------------------------------------------------------------
+
+
+class StubOracle:
+    """Endpoint stub com latência, erros e respostas determinísticos.
+
+    Implementa ``generate`` e ``generate_async``; pode ser passado ao
+    ``OracleQuery`` ou a um ``EndpointPool`` como uma réplica real.
+
+    Args:
+        profile: latência e taxa de erro (ex.: ``LLM_PROFILE``)
+        seed: semente das amostragens
+        tier: rótulo do nível usado nos marcadores das respostas
+        answers: objetos de resposta de consulta (um é sorteado por chamada)
+        alignments: objetos de resposta de alinhamento
+        time_scale: fator aplicado às latências amostradas
+        name: nome da réplica (usado pelo ``EndpointPool``)
+        latency_history: últimas latências amostradas mantidas em
+            ``latencies_ms`` (memória constante em testes de carga longos)
+    """
+
+    def __init__(
+        self,
+        profile: StubProfile = LLM_PROFILE,
+        seed: int = 0,
+        tier: str = "llm",
+        answers: Sequence[Mapping[str, Any]] = DEFAULT_ANSWERS,
+        alignments: Sequence[Mapping[str, Any]] = DEFAULT_ALIGNMENTS,
+        time_scale: float = 1.0,
+        name: str | None = None,
+        latency_history: int = 10_000,
+    ) -> None:
+        self.profile = profile
+        self.seed = seed
+        self.tier = tier
+        self.answers = tuple(answers)
+        self.alignments = tuple(alignments)
+        self.time_scale = time_scale
+        self.name = name or f"stub-{tier}"
+        self._lock = threading.Lock()
+        self._occurrences: dict[str, int] = {}
+        self.calls = 0
+        self.errors = 0
+        self.latencies_ms: deque[float] = deque(maxlen=latency_history)
+
+    @classmethod
+    def from_config(
+        cls, config: Mapping[str, Any], tier: str, seed: int | None = None
+    ) -> StubOracle:
+        """Constrói o stub de um nível a partir da seção ``oracle_stub``.
+
+        Args:
+            config: seção ``oracle_stub`` de bridge-config
+            tier: ``llm`` ou ``lrm``
+            seed: sobrepõe ``oracle_stub.seed``
+        """
+        default = LLM_PROFILE if tier == "llm" else LRM_PROFILE
+        tier_config = config.get(tier)
+        return cls(
+            profile=StubProfile.from_config(tier_config) if tier_config else default,
+            seed=int(config.get("seed", 0)) if seed is None else seed,
+            tier=tier,
+            time_scale=float(config.get("time_scale", 1.0)),
+        )
+
+    # -----------------------------------------------------------------------
+    # Interface de endpoint
+    # -----------------------------------------------------------------------
+
+    def generate(self, prompt: str) -> str:
+        """Responde após a latência amostrada (ou levanta a falha injetada)."""
+        delay_ms, fail, raw = self.plan(prompt)
+        time.sleep(delay_ms / 1000)
+        if fail:
+            raise StubOracleError(f"{self.name}: falha injetada")
+        return raw
+
+    async def generate_async(self, prompt: str) -> str:
+        """Variante assíncrona de ``generate`` (sem bloquear o loop)."""
+        delay_ms, fail, raw = self.plan(prompt)
+        await asyncio.sleep(delay_ms / 1000)
+        if fail:
+            raise StubOracleError(f"{self.name}: falha injetada")
+        return raw
+
+    def plan(self, prompt: str) -> tuple[float, bool, str]:
+        """Decide latência, falha e resposta de uma chamada, sem esperar.
+
+        Returns:
+            (atraso em ms já escalado, falha injetada, resposta bruta)
+        """
+        digest = hashlib.blake2b(prompt.encode(), digest_size=8).hexdigest()
+        with self._lock:
+            occurrence = self._occurrences.get(digest, 0)
+            self._occurrences[digest] = occurrence + 1
+            self.calls += 1
+            call = self.calls
+        rng = random.Random(f"{self.seed}:{digest}:{occurrence}")
+
+        delay_ms = self.profile.latency.sample_ms(rng) * self.time_scale
+        fail = rng.random() < self.profile.error_rate
+        raw = "" if fail else self.render(prompt, rng, call)
+        with self._lock:
+            self.latencies_ms.append(delay_ms)
+            if fail:
+                self.errors += 1
+        return delay_ms, fail, raw
+
+    def render(self, prompt: str, rng: random.Random, call: int) -> str:
+        """Resposta JSON no formato pedido pelo prompt."""
+        items = _NUMBERED_ITEM.findall(prompt)
+        if items:
+            return json.dumps(
+                [{"id": int(i), **rng.choice(self.alignments)} for i in items],
+                ensure_ascii=False,
+            )
+        questions = _NUMBERED_QUESTION.findall(prompt)
+        if questions:
+            return json.dumps(
+                [
+                    {"id": int(i), **self._fill(rng.choice(self.answers), q, call)}
+                    for i, q in questions
+                ],
+                ensure_ascii=False,
+            )
+        if prompt.startswith(_ALIGNMENT_MARK):
+            return json.dumps(rng.choice(self.alignments), ensure_ascii=False)
+        match = _QUESTION.search(prompt)
+        question = match.group(1) if match else prompt[:80]
+        return json.dumps(
+            self._fill(rng.choice(self.answers), question, call), ensure_ascii=False
+        )
+
+    def _fill(
+        self, template: Mapping[str, Any], question: str, call: int
+    ) -> dict[str, Any]:
+        """Substitui os marcadores nos valores textuais do modelo."""
+        values = {"question": question, "call": call, "tier": self.tier}
+        return {
+            key: value.format_map(values) if isinstance(value, str) else value
+            for key, value in template.items()
+        }
+
+
+# ---------------------------------------------------------------------------
+# Servidor HTTP em localhost
+# ---------------------------------------------------------------------------
+
+
+class StubOracleServer:
+    """Servidor HTTP local que expõe stubs por nível.
+
+    Rota: ``POST /v1/<nível>/generate`` com ``{"prompt": "..."}``; responde
+    ``200 {"text": "<resposta bruta>"}`` ou ``503`` em falha injetada.
+
+    Args:
+        oracles: stubs por nível (ex.: ``{"llm": ..., "lrm": ...}``)
+        host: endereço de escuta (apenas localhost por padrão)
+        port: porta; 0 escolhe uma porta livre
+    """
+
+    def __init__(
+        self,
+        oracles: Mapping[str, StubOracle],
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.oracles = dict(oracles)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor."""
+        host, port = self._httpd.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def endpoint(self, tier: str, timeout_s: float = 120.0) -> HTTPStubEndpoint:
+        """Cliente HTTP para o stub de um nível."""
+        return HTTPStubEndpoint(f"{self.url}/v1/{tier}/generate", timeout_s)
+
+    def start(self) -> StubOracleServer:
+        """Atende em uma thread de fundo."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="oracle-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Atende na thread corrente até ``stop``."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Encerra o servidor e a thread de fundo."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> StubOracleServer:
+        """Inicia o servidor em segundo plano."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Encerra o servidor."""
+        self.stop()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        oracles = self.oracles
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                parts = self.path.strip("/").split("/")
+                if len(parts) != 3 or parts[0] != "v1" or parts[2] != "generate":
+                    return self._reply(404, {"error": "rota desconhecida"})
+                oracle = oracles.get(parts[1])
+                if oracle is None:
+                    return self._reply(404, {"error": f"nível {parts[1]!r}"})
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    prompt = json.loads(self.rfile.read(length))["prompt"]
+                except (ValueError, KeyError, TypeError):
+                    return self._reply(400, {"error": 'esperado {"prompt": ...}'})
+                try:
+                    raw = oracle.generate(prompt)
+                except StubOracleError as exc:
+                    return self._reply(503, {"error": str(exc)})
+                self._reply(200, {"text": raw})
+
+            def _reply(self, status: int, body: Mapping[str, Any]) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # Silencioso: o servidor é usado em benchmarks.
+
+        return Handler
+
+
+class HTTPStubEndpoint:
+    """Cliente síncrono do ``StubOracleServer`` (apenas biblioteca padrão).
+
+    Respostas 503 viram ``StubOracleError``, como no stub em processo.
+    """
+
+    def __init__(self, url: str, timeout_s: float = 120.0) -> None:
+        self.url = url
+        self.timeout_s = timeout_s
+        self.name = url
+
+    def generate(self, prompt: str) -> str:
+        """Envia o prompt ao servidor e retorna a resposta bruta."""
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"prompt": prompt}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout_s) as reply:
+                text: str = json.loads(reply.read())["text"]
+                return text
+        except urllib.error.HTTPError as exc:
+            if exc.code == 503:
+                raise StubOracleError(exc.read().decode()) from None
+            raise
+
+
+# ---------------------------------------------------------------------------
+# Linha de comando
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Linha de comando: atende os stubs LLM e LRM em localhost."""
+    parser = argparse.ArgumentParser(description="Oráculo stub em localhost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--llm-error-rate", type=float, default=LLM_PROFILE.error_rate)
+    parser.add_argument("--lrm-error-rate", type=float, default=LRM_PROFILE.error_rate)
+    args = parser.parse_args(argv)
+
+    oracles = {
+        "llm": StubOracle(
+            StubProfile(LLM_PROFILE.latency, args.llm_error_rate),
+            seed=args.seed,
+            tier="llm",
+            time_scale=args.time_scale,
+        ),
+        "lrm": StubOracle(
+            StubProfile(LRM_PROFILE.latency, args.lrm_error_rate),
+            seed=args.seed,
+            tier="lrm",
+            time_scale=args.time_scale,
+        ),
+    }
+    server = StubOracleServer(oracles, args.host, args.port)
+    print(f"Oráculo stub em {server.url}/v1/<llm|lrm>/generate")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
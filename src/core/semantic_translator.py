@@ -1,5 +1,4 @@
-"""
-semantic_translator.py — Algoritmo de Tradução Semântica (NL-Agent Framework)
+"""semantic_translator.py — Algoritmo de Tradução Semântica (NL-Agent Framework).
 
 Implementação de referência do Algoritmo 5.1 descrito na seção 5.2 da dissertação.
 Traduz mensagens entre protocolos heterogêneos (MCP, A2A, ACP) preservando
@@ -14,9 +13,28 @@ Autor: Framework NL-Agent, 2026
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from importlib.metadata import entry_points
+from itertools import pairwise
+from pathlib import Path
+from typing import Any, NamedTuple, runtime_checkable
+from typing import Protocol as TypingProtocol
+
+import yaml
+
+DEFAULT_CONFIG_PATH = (
+    Path(__file__).resolve().parents[2] / "config" / "bridge-config.yaml"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -24,10 +42,21 @@ from typing import Any
 # ---------------------------------------------------------------------------
 
 class Protocol(Enum):
-    """Protocolos suportados pelo framework."""
+    """Protocolos suportados pelo framework (ANP via pivô ACP)."""
     MCP = "mcp"
     A2A = "a2a"
     ACP = "acp"
+    ANP = "anp"
+
+
+# Protocolos fora do enum (ex.: formatos internos) são identificados pelo nome
+# com que seu adaptador foi registrado.
+ProtocolLike = Protocol | str
+
+
+def protocol_name(protocol: ProtocolLike) -> str:
+    """Nome do protocolo usado como chave de adaptadores, planos e cache."""
+    return protocol.value if isinstance(protocol, Protocol) else protocol
 
 
 class AlignmentType(Enum):
@@ -45,9 +74,62 @@ class SemanticRelation(Enum):
     DISJOINT = "⊥"      # Disjunção (incompatível)
 
 
-@dataclass
+class TraceLevel(Enum):
+    """Nível de detalhe do registro de tradução."""
+    OFF = "off"          # Nenhum evento registrado
+    SUMMARY = "summary"  # Apenas as 5 etapas do Algoritmo 5.1
+    FULL = "full"        # Etapas + uma entrada por conceito
+
+
+# Modelos de texto dos eventos de trace; formatados apenas sob demanda.
+_TRACE_TEMPLATES: dict[str, str] = {
+    "extract": "[1/5] Extraindo semântica de {0}",
+    "align": "[2/5] Consultando oráculo para alinhamento → {0}",
+    "transform": "[3/5] Aplicando transformações conceituais",
+    "direct": "  ✓ Mapeamento direto: {0} → {1}",
+    "composite": "  ◐ Mapeamento composto: {0}",
+    "approximate": "  ⚠ Aproximação: {0} (perda: {1:.2f})",
+    "validate": "[4/5] Validando consistência via NL Reasoner",
+    "correct": "  ⚠ Inconsistência detectada — aplicando correções NL",
+    "done": "[5/5] Tradução concluída",
+    "line": "{0}",  # Linha já formatada (``TranslationResult.from_message``)
+}
+
+TraceEvent = tuple[str, tuple[Any, ...]]
+
+
+class TranslationTrace:
+    """Registro estruturado de eventos de uma tradução.
+
+    Cada evento é um par (nome, argumentos); o texto legível só é produzido
+    ao acessar ``lines()`` (ou ``TranslationResult.translation_log``).
+    """
+
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: list[TraceEvent] = []
+
+    def add(self, event: str, *args: Any) -> None:
+        """Registra um evento sem formatá-lo."""
+        self.events.append((event, args))
+
+    def lines(self) -> list[str]:
+        """Formata os eventos como linhas de log."""
+        return [_TRACE_TEMPLATES[name].format(*args) for name, args in self.events]
+
+    def __len__(self) -> int:
+        """Número de eventos registrados."""
+        return len(self.events)
+
+
+@dataclass(frozen=True, slots=True)
 class OntologyAlignment:
-    """Correspondência entre entidades de ontologias distintas (Definição 3)."""
+    """Correspondência entre entidades de ontologias distintas (Definição 3).
+
+    Imutável: a mesma instância é compartilhada pelo cache e pelos planos de
+    conceito de todas as mensagens que a utilizam.
+    """
     source_entity: str
     target_entity: str
     relation: SemanticRelation
@@ -60,7 +142,7 @@ class OntologyAlignment:
         return not self.is_direct and not self.is_composite
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticStructure:
     """Estrutura semântica extraída de uma mensagem."""
     conceitos: list[str] = field(default_factory=list)
@@ -69,7 +151,7 @@ class SemanticStructure:
     context: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SemanticLoss:
     """Registro de perda semântica durante tradução."""
     concept: str
@@ -78,15 +160,141 @@ class SemanticLoss:
     residual_loss: float  # 0.0 = sem perda, 1.0 = perda total
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class TranslatedComponent:
+    """Conceito traduzido (etapa 3) em representação compacta.
+
+    Substitui o dicionário por componente: instâncias são imutáveis e
+    compartilhadas entre mensagens; ``as_dict`` gera a forma pública.
+    """
+    original: str
+    translated: str
+    relation: SemanticRelation
+    confidence: float
+    type: AlignmentType
+    warning: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Forma de dicionário exposta em ``TranslationResult.message``."""
+        data: dict[str, Any] = {
+            "original": self.original,
+            "translated": self.translated,
+            "relation": self.relation.value,
+            "confidence": self.confidence,
+            "type": self.type.value,
+        }
+        if self.type is AlignmentType.COMPOSITE:
+            data["components"] = []
+        elif self.warning is not None:
+            data["warning"] = self.warning
+        return data
+
+
+def _materialize(obj: Any) -> Any:
+    """Converte o envelope compacto em dicionários/listas JSON puros."""
+    if isinstance(obj, dict):
+        return {key: _materialize(value) for key, value in obj.items()}
+    if isinstance(obj, tuple) and obj and isinstance(obj[0], TranslatedComponent):
+        return [component.as_dict() for component in obj]
+    if isinstance(obj, (list, tuple)):
+        return [_materialize(item) for item in obj]
+    return obj
+
+
+@dataclass(slots=True, init=False)
 class TranslationResult:
-    """Resultado completo de uma tradução semântica."""
-    message: dict[str, Any]
-    source_protocol: Protocol
-    target_protocol: Protocol
+    """Resultado completo de uma tradução semântica.
+
+    A mensagem traduzida é mantida em forma compacta (``envelope``, com os
+    componentes como tupla de ``TranslatedComponent``); a forma de dicionário
+    é gerada no primeiro acesso a ``message``.
+
+    O construtor continua aceitando a forma anterior: ``message=`` no lugar
+    de ``envelope`` (devolvida sem cópia por ``message``) e
+    ``translation_log=`` (ou uma lista de linhas na sexta posição), cujas
+    linhas são preservadas no trace.
+    """
+    envelope: dict[str, Any]
+    source_protocol: ProtocolLike
+    target_protocol: ProtocolLike
     semantic_losses: list[SemanticLoss]
     confidence: float
-    translation_log: list[str] = field(default_factory=list)
+    components: tuple[TranslatedComponent, ...]
+    trace: TranslationTrace | None
+    _message: dict[str, Any] | None = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        envelope: dict[str, Any] | None = None,
+        source_protocol: ProtocolLike | None = None,
+        target_protocol: ProtocolLike | None = None,
+        semantic_losses: list[SemanticLoss] | None = None,
+        confidence: float | None = None,
+        components: tuple[TranslatedComponent, ...] | list[str] = (),
+        trace: TranslationTrace | None = None,
+        *,
+        message: dict[str, Any] | None = None,
+        translation_log: Iterable[str] | None = None,
+    ) -> None:
+        if isinstance(components, list):  # Forma anterior: log na 6ª posição.
+            translation_log, components = components, ()
+        if envelope is None:
+            envelope = message
+        if (
+            envelope is None
+            or source_protocol is None
+            or target_protocol is None
+            or semantic_losses is None
+            or confidence is None
+        ):
+            raise TypeError(
+                "TranslationResult requer envelope (ou message), source_protocol, "
+                "target_protocol, semantic_losses e confidence"
+            )
+        if translation_log is not None and trace is None:
+            trace = TranslationTrace()
+            for line in translation_log:
+                trace.add("line", line)
+        self.envelope = envelope
+        self.source_protocol = source_protocol
+        self.target_protocol = target_protocol
+        self.semantic_losses = semantic_losses
+        self.confidence = confidence
+        self.components = components
+        self.trace = trace
+        self._message = message
+
+    @classmethod
+    def from_message(
+        cls,
+        message: dict[str, Any],
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+        semantic_losses: list[SemanticLoss],
+        confidence: float,
+        translation_log: Iterable[str] | None = None,
+    ) -> TranslationResult:
+        """Constrói o resultado a partir de uma mensagem já materializada."""
+        return cls(
+            message=message,
+            source_protocol=source_protocol,
+            target_protocol=target_protocol,
+            semantic_losses=semantic_losses,
+            confidence=confidence,
+            translation_log=translation_log,
+        )
+
+    @property
+    def message(self) -> dict[str, Any]:
+        """Mensagem traduzida no formato (dicionário) do protocolo de destino."""
+        if self._message is None:
+            self._message = _materialize(self.envelope)
+        return self._message
+
+    @property
+    def translation_log(self) -> list[str]:
+        """Log legível da tradução (vazio quando o trace está desligado)."""
+        return self.trace.lines() if self.trace is not None else []
 
     @property
     def has_losses(self) -> bool:
@@ -103,21 +311,566 @@ class TranslationResult:
         return 1.0 - avg_loss
 
 
+@dataclass
+class BatchTranslationError:
+    """Falha isolada de uma mensagem dentro de um lote de tradução."""
+    index: int
+    source_protocol: ProtocolLike
+    target_protocol: ProtocolLike
+    error: Exception
+
+
+@dataclass
+class StreamStats:
+    """Agregados de uma tradução em streaming (``translate_stream``)."""
+    records: int = 0
+    translated: int = 0
+    failed: int = 0
+    semantic_losses: int = 0
+    elapsed_seconds: float = 0.0
+    preservation_sum: float = 0.0
+    confidence_sum: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Registros processados por segundo."""
+        return self.records / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def mean_preservation_rate(self) -> float:
+        """Taxa de preservação média das traduções bem-sucedidas."""
+        return self.preservation_sum / self.translated if self.translated else 0.0
+
+    @property
+    def mean_confidence(self) -> float:
+        """Confiança média das traduções bem-sucedidas."""
+        return self.confidence_sum / self.translated if self.translated else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Resumo serializável em JSON."""
+        return {
+            "records": self.records,
+            "translated": self.translated,
+            "failed": self.failed,
+            "semantic_losses": self.semantic_losses,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "throughput_msg_s": round(self.throughput, 2),
+            "mean_preservation_rate": round(self.mean_preservation_rate, 6),
+            "mean_confidence": round(self.mean_confidence, 6),
+        }
+
+
+@dataclass
+class AlignmentStats:
+    """Origem dos alinhamentos resolvidos na etapa 2 (falhas de cache).
+
+    ``direct_hit_rate`` mede quantos conceitos foram resolvidos sem oráculo
+    (mapeamento direto ou ontologia indexada).
+    """
+    direct: int = 0
+    ontology: int = 0
+    oracle_queries: int = 0
+    approximations: int = 0
+
+    @property
+    def resolved(self) -> int:
+        """Total de conceitos resolvidos (direto + ontologia + aproximação)."""
+        return self.direct + self.ontology + self.approximations
+
+    @property
+    def direct_hit_rate(self) -> float:
+        """Fração de conceitos resolvidos localmente, sem oráculo."""
+        total = self.resolved
+        return (self.direct + self.ontology) / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Contadores serializáveis em JSON."""
+        return {
+            "direct": self.direct,
+            "ontology": self.ontology,
+            "oracle_queries": self.oracle_queries,
+            "approximations": self.approximations,
+            "direct_hit_rate": self.direct_hit_rate,
+        }
+
+
+BatchItem = dict[str, Any] | tuple[dict[str, Any], ProtocolLike, ProtocolLike]
+
+
+class _ConceptPlan(NamedTuple):
+    """Resultado pré-computado das etapas 2-3 para um conceito."""
+    alignment: OntologyAlignment
+    component: TranslatedComponent
+    loss: SemanticLoss | None
+    trace_event: TraceEvent
+
+
+# ---------------------------------------------------------------------------
+# Planejamento de Rotas entre Protocolos
+# ---------------------------------------------------------------------------
+
+def _resolve_path(mapping: Mapping[str, str], path: str) -> str | None:
+    """Traduz ``path`` pela tabela de mapeamentos, com casamento por prefixo.
+
+    Tenta o caminho completo e depois cada prefixo pontuado, do mais longo ao
+    mais curto; o sufixo não casado é preservado no destino
+    (``tool.inputSchema.query`` → ``skill.inputSchema.query``).
+    """
+    target = mapping.get(path)
+    if target:
+        return target
+    cut = path.rfind(".")
+    while cut > 0:
+        target = mapping.get(path[:cut])
+        if target:
+            return target + path[cut:]
+        cut = path.rfind(".", 0, cut)
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationPlan:
+    """Rota escolhida entre dois protocolos e sua tabela de mapeamento composta."""
+    route: tuple[str, ...]
+    mapping: Mapping[str, str]
+    confidence: float  # produto das confianças de cada salto
+
+    @property
+    def hops(self) -> int:
+        """Número de saltos da rota."""
+        return max(len(self.route) - 1, 0)
+
+    @property
+    def is_pivoted(self) -> bool:
+        """Indica se a rota passa por ao menos um protocolo pivô."""
+        return self.hops > 1
+
+
+class ProtocolGraph:
+    """Grafo de tradução entre protocolos (arestas = tabelas de mapeamento direto).
+
+    O planejador escolhe, entre a rota direta e as rotas via protocolos
+    intermediários (ex.: ACP como pivô), a de maior confiança e, em empate,
+    a de menor custo (número de saltos). Os mapeamentos de cada salto são
+    compostos em uma única tabela e o plano é mantido em cache, de modo que
+    uma rota de dois saltos custa uma consulta em tempo de execução.
+
+    Parâmetros:
+        mappings: tabelas de mapeamento por par (origem, destino)
+        hop_confidence: confiança de um mapeamento direto em um salto
+        max_hops: número máximo de saltos considerados
+    """
+
+    def __init__(
+        self,
+        mappings: Mapping[tuple[str, str], Mapping[str, str]],
+        hop_confidence: float = 0.95,
+        max_hops: int = 2,
+    ) -> None:
+        self.hop_confidence = hop_confidence
+        self.max_hops = max_hops
+        self._edges: dict[str, dict[str, tuple[Mapping[str, str], float]]] = {}
+        self._plans: dict[tuple[str, str], TranslationPlan] = {}
+        self.revision = 0  # Incrementada a cada ``add_mapping``
+        for (source, target), mapping in mappings.items():
+            self.add_mapping(source, target, mapping)
+
+    def add_mapping(
+        self,
+        source: str,
+        target: str,
+        mapping: Mapping[str, str],
+        confidence: float | None = None,
+    ) -> None:
+        """Adiciona (ou substitui) uma aresta e invalida os planos em cache."""
+        edge_confidence = self.hop_confidence if confidence is None else confidence
+        self._edges.setdefault(source, {})[target] = (mapping, edge_confidence)
+        self._plans.clear()
+        self.revision += 1
+
+    def plan(self, source: str, target: str) -> TranslationPlan:
+        """Plano em cache para o par; sem rota, retorna um plano vazio."""
+        key = (source, target)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._build_plan(source, target)
+            self._plans[key] = plan
+        return plan
+
+    def _build_plan(self, source: str, target: str) -> TranslationPlan:
+        """Busca em profundidade limitada a ``max_hops`` e compõe a melhor rota."""
+        best: tuple[str, ...] = ()
+        best_score = (0.0, 0)  # (confiança, -saltos)
+        stack: list[tuple[tuple[str, ...], float]] = [((source,), 1.0)]
+        while stack:
+            route, confidence = stack.pop()
+            for nxt, (_, edge_confidence) in self._edges.get(route[-1], {}).items():
+                if nxt in route:
+                    continue
+                candidate = (*route, nxt)
+                score = (confidence * edge_confidence, 1 - len(candidate))
+                if nxt == target:
+                    if score > best_score:
+                        best, best_score = candidate, score
+                elif len(candidate) <= self.max_hops:
+                    stack.append((candidate, score[0]))
+        if not best:
+            return TranslationPlan(route=(), mapping={}, confidence=0.0)
+
+        mapping = self._edges[best[0]][best[1]][0]
+        for hop_source, hop_target in pairwise(best[1:]):
+            hop = self._edges[hop_source][hop_target][0]
+            composed: dict[str, str] = {}
+            for key, intermediate in mapping.items():
+                final = _resolve_path(hop, intermediate)
+                if final is not None:
+                    composed[key] = final
+            mapping = composed
+        return TranslationPlan(route=best, mapping=mapping, confidence=best_score[0])
+
+
+# ---------------------------------------------------------------------------
+# Endpoints de Oráculo para Alinhamento
+# ---------------------------------------------------------------------------
+
+@runtime_checkable
+class AlignmentOracle(TypingProtocol):
+    """Oráculo síncrono consultado para conceitos sem mapeamento direto."""
+
+    def align(
+        self, concept: str, source_protocol: ProtocolLike, target_protocol: ProtocolLike
+    ) -> OntologyAlignment | None:
+        """Retorna o alinhamento do conceito, ou None se não houver resposta."""
+        ...
+
+
+@runtime_checkable
+class AsyncAlignmentOracle(TypingProtocol):
+    """Oráculo assíncrono usado por ``SemanticTranslator.translate_async``."""
+
+    async def align_async(
+        self, concept: str, source_protocol: ProtocolLike, target_protocol: ProtocolLike
+    ) -> OntologyAlignment | None:
+        """Retorna o alinhamento do conceito, ou None se não houver resposta."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Índice de Ontologias
+# ---------------------------------------------------------------------------
+
+WILDCARD = "*"
+
+
+class _TrieNode:
+    """Nó da trie de caminhos pontuados (um segmento por nível)."""
+
+    __slots__ = ("children", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # Alinhamentos de ``prefixo.*`` por protocolo de destino
+        self.wildcard: dict[str, OntologyAlignment] | None = None
+
+
+class OntologyIndex:
+    """Índice das ontologias registradas por protocolo (seção 14).
+
+    Construído uma única vez a partir do ``ontology_registry``:
+    - caminhos exatos (``tool.name``) em tabela hash — O(1);
+    - padrões com curinga (``tool.inputSchema.*``) em uma trie de segmentos,
+      percorrida em O(profundidade do caminho) com casamento pelo prefixo
+      mais longo.
+
+    Formato do registro::
+
+        {"mcp": [
+            {"path": "tool.name", "alignments": {"a2a": "skill.id"}},
+            {"path": "tool.inputSchema.*",
+             "alignments": {"a2a": {"entity": "skill.inputSchema.*",
+                                    "relation": "⊑", "confidence": 0.9}}},
+        ]}
+
+    Relação ``≡`` gera alinhamento direto; ``⊑``/``⊒`` geram alinhamento
+    composto; ``⊥`` registra explicitamente a ausência de correspondência
+    (alinhamento com ``relation`` DISJOINT, distinto de "desconhecido", que
+    é None). Um destino terminado em ``*`` recebe o sufixo do caminho
+    casado; sem curinga, todo o prefixo aponta para a mesma entidade.
+    """
+
+    DEFAULT_CONFIDENCE = 0.9
+
+    def __init__(self) -> None:
+        self._exact: dict[tuple[str, str, str], OntologyAlignment] = {}
+        self._tries: dict[str, _TrieNode] = {}
+        self.entities = 0
+
+    @classmethod
+    def from_registry(cls, registry: Mapping[str, Any]) -> OntologyIndex:
+        """Constrói o índice a partir do registro de ontologias por protocolo."""
+        index = cls()
+        for protocol, entities in registry.items():
+            for entity in entities:
+                index.add(protocol, entity["path"], entity.get("alignments", {}))
+        return index
+
+    def add(
+        self, protocol: str, path: str, alignments: Mapping[str, Any]
+    ) -> None:
+        """Registra uma entidade e seus alinhamentos por protocolo de destino."""
+        self.entities += 1
+        if path.endswith("." + WILDCARD) or path == WILDCARD:
+            prefix = path[: -len(WILDCARD)].rstrip(".")
+            node = self._tries.setdefault(protocol, _TrieNode())
+            for segment in prefix.split(".") if prefix else ():
+                node = node.children.setdefault(segment, _TrieNode())
+            if node.wildcard is None:
+                node.wildcard = {}
+            for target, spec in alignments.items():
+                node.wildcard[target] = self._make_alignment(path, spec)
+            return
+        for target, spec in alignments.items():
+            self._exact[(protocol, target, path)] = self._make_alignment(path, spec)
+
+    def lookup(
+        self, source_protocol: str, target_protocol: str, concept: str
+    ) -> OntologyAlignment | None:
+        """Busca exata e, em seguida, pelo padrão de prefixo mais longo."""
+        key = (source_protocol, target_protocol, concept)
+        if key in self._exact:
+            return self._exact[key]
+
+        node = self._tries.get(source_protocol)
+        if node is None:
+            return None
+        best: OntologyAlignment | None = None
+        matched = 0
+        depth = 0
+        segments = concept.split(".")
+        while True:
+            if node.wildcard is not None and target_protocol in node.wildcard:
+                best, matched = node.wildcard[target_protocol], depth
+            if depth == len(segments):
+                break
+            child = node.children.get(segments[depth])
+            if child is None:
+                break
+            node, depth = child, depth + 1
+
+        if best is None:
+            return None
+        target = best.target_entity
+        if target.endswith(WILDCARD):
+            suffix = ".".join(segments[matched:])
+            target_prefix = target[: -len(WILDCARD)].rstrip(".")
+            target = ".".join(p for p in (target_prefix, suffix) if p)
+        return OntologyAlignment(
+            source_entity=concept,
+            target_entity=target,
+            relation=best.relation,
+            confidence=best.confidence,
+            is_direct=best.is_direct,
+            is_composite=best.is_composite,
+        )
+
+    def __len__(self) -> int:
+        """Número de entidades indexadas."""
+        return self.entities
+
+    def _make_alignment(self, path: str, spec: Any) -> OntologyAlignment:
+        """Normaliza a especificação de alinhamento (str ou dict)."""
+        if isinstance(spec, str):
+            spec = {"entity": spec}
+        relation = SemanticRelation(
+            spec.get("relation", SemanticRelation.EQUIVALENT.value)
+        )
+        if relation is SemanticRelation.DISJOINT:
+            return OntologyAlignment(
+                source_entity=path,
+                target_entity=spec.get("entity", ""),
+                relation=relation,
+                confidence=float(spec.get("confidence", self.DEFAULT_CONFIDENCE)),
+                is_direct=False,
+            )
+        direct = relation is SemanticRelation.EQUIVALENT
+        return OntologyAlignment(
+            source_entity=path,
+            target_entity=spec["entity"],
+            relation=relation,
+            confidence=float(spec.get("confidence", self.DEFAULT_CONFIDENCE)),
+            is_direct=direct,
+            is_composite=not direct,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Cache de Alinhamentos
+# ---------------------------------------------------------------------------
+
+AlignmentKey = tuple[str, str, str]  # (protocolo origem, protocolo destino, conceito)
+
+
+class AlignmentCache:
+    """Cache LRU com expiração (TTL) para alinhamentos ontológicos.
+
+    Chaveado por (protocolo de origem, protocolo de destino, conceito).
+    Corresponde à seção ``bridge.cache`` de ``config/bridge-config.yaml``.
+
+    Parâmetros:
+        max_entries: número máximo de alinhamentos mantidos (LRU)
+        ttl_seconds: tempo de vida de cada entrada; ``None`` desativa expiração
+        negative_ttl_seconds: tempo de vida das aproximações (nenhum
+            alinhamento encontrado), para que o conceito volte a ser
+            resolvido em breve; ``None`` usa ``ttl_seconds``
+        clock: relógio monotônico usado para a expiração
+    """
+
+    SUPPORTED_STORAGE = ("memory",)
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float | None = 3600.0,
+        negative_ttl_seconds: float | None = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries deve ser positivo")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[AlignmentKey, tuple[float, OntologyAlignment]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> AlignmentCache | None:
+        """Constrói o cache a partir da seção ``cache`` da configuração do bridge.
+
+        Returns:
+            AlignmentCache configurado, ou None quando ``enabled`` é falso.
+
+        Raises:
+            ValueError: se ``storage`` não for suportado por este processo.
+        """
+        if not config.get("enabled", True):
+            return None
+        storage = config.get("storage", "memory")
+        if storage not in cls.SUPPORTED_STORAGE:
+            raise ValueError(
+                f"Armazenamento de cache não suportado: '{storage}' "
+                f"(suportados: {', '.join(cls.SUPPORTED_STORAGE)})"
+            )
+        ttl = config.get("ttl_seconds", 3600)
+        negative_ttl = config.get("negative_ttl_seconds", 60)
+        return cls(
+            max_entries=int(config.get("max_entries", 10000)),
+            ttl_seconds=float(ttl) if ttl is not None else None,
+            negative_ttl_seconds=(
+                float(negative_ttl) if negative_ttl is not None else None
+            ),
+        )
+
+    def get(self, key: AlignmentKey) -> OntologyAlignment | None:
+        """Retorna o alinhamento em cache (marcando-o como recente) ou None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, alignment = entry
+            if expires_at < self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return alignment
+
+    def put(self, key: AlignmentKey, alignment: OntologyAlignment) -> None:
+        """Armazena um alinhamento, descartando o menos recente se cheio.
+
+        Aproximações expiram após ``negative_ttl_seconds``.
+        """
+        ttl = self.ttl_seconds
+        if alignment.is_approximate and self.negative_ttl_seconds is not None:
+            ttl = self.negative_ttl_seconds
+        expires_at = self._clock() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, alignment)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove todas as entradas (contadores são preservados)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Número de entradas no cache."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração de consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Contadores de uso do cache."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def load_bridge_config(path: str | Path = DEFAULT_CONFIG_PATH) -> dict[str, Any]:
+    """Carrega a seção ``bridge`` de um arquivo YAML de configuração."""
+    with open(path, encoding="utf-8") as fh:
+        data = yaml.safe_load(fh) or {}
+    bridge: dict[str, Any] = data.get("bridge", {})
+    return bridge
+
+
+class _NoAlignmentCache:
+    """Marcador de tradutor sem cache de alinhamentos."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NO_ALIGNMENT_CACHE"
+
+
+NO_ALIGNMENT_CACHE = _NoAlignmentCache()
+
+
 # ---------------------------------------------------------------------------
 # Motor de Inferência em Lógica Natural (NL Reasoner)
 # ---------------------------------------------------------------------------
 
 class NaturalLogicReasoner:
-    """
-    Motor de inferência baseado em Lógica Natural.
+    """Motor de inferência baseado em Lógica Natural.
 
     Aplica axiomas epistêmicos (K1-K3) e inferências monotônicas/
     não-monotônicas para validar consistência de traduções.
     """
 
     def is_consistent(self, message: dict[str, Any]) -> bool:
-        """
-        Verifica se a mensagem traduzida satisfaz invariantes de consistência.
+        """Verifica se a mensagem traduzida satisfaz invariantes de consistência.
 
         Aplica:
         - K1 (Veracidade): dados referenciados existem
@@ -137,9 +890,7 @@ class NaturalLogicReasoner:
         return True
 
     def apply_corrections(self, message: dict[str, Any]) -> dict[str, Any]:
-        """
-        Aplica correções baseadas em inferência NL para restaurar consistência.
-        """
+        """Aplica correções baseadas em inferência NL para restaurar consistência."""
         corrected = dict(message)
 
         # Adicionar parâmetros vazios se ausentes
@@ -152,13 +903,293 @@ class NaturalLogicReasoner:
         return corrected
 
 
+# ---------------------------------------------------------------------------
+# Extração de Caminhos Pontuados
+# ---------------------------------------------------------------------------
+
+# Raiz ontológica de cada família de métodos MCP (tools/call → tool.*)
+_MCP_METHOD_ROOTS = {"tools": "tool", "resources": "resource", "prompts": "prompt"}
+
+# Segmentos renomeados para o vocabulário da ontologia (instância → esquema)
+_MCP_SEGMENT_ALIASES = {"arguments": "inputSchema"}
+
+# Campos de envelope que não são conceitos
+_A2A_ENVELOPE = frozenset({"role", "parts", "kind", "messageId"})
+_ACP_ENVELOPE = frozenset({"acp_version", "message_type", "payload"})
+_ANP_ENVELOPE = frozenset({"anp_version", "@context", "type", "did", "params"})
+
+
+def _flatten_paths(
+    obj: Any,
+    prefix: str,
+    out: list[str],
+    aliases: Mapping[str, str] | None = None,
+    exclude: frozenset[str] = frozenset(),
+) -> None:
+    """Emite em ``out`` o caminho pontuado de cada folha de ``obj``.
+
+    Percurso em pilha explícita (sem recursão), em ordem de inserção.
+    Dicionários são expandidos; listas e escalares são folhas. ``exclude``
+    filtra chaves do primeiro nível.
+    """
+    if not isinstance(obj, dict) or not obj:
+        if prefix:
+            out.append(prefix)
+        return
+    stack: list[tuple[str, Any]] = []
+    for key, value in reversed(obj.items()):
+        if key in exclude:
+            continue
+        if aliases:
+            key = aliases.get(key, key)
+        stack.append((f"{prefix}.{key}" if prefix else key, value))
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict) and value:
+            for key, child in reversed(value.items()):
+                if aliases:
+                    key = aliases.get(key, key)
+                stack.append((f"{path}.{key}", child))
+        else:
+            out.append(path)
+
+
+# ---------------------------------------------------------------------------
+# Adaptadores de Protocolo
+# ---------------------------------------------------------------------------
+
+ADAPTER_ENTRY_POINT_GROUP = "nlagent.protocol_adapters"
+
+Extractor = Callable[[dict[str, Any]], SemanticStructure]
+Composer = Callable[[tuple[TranslatedComponent, ...]], dict[str, Any]]
+
+
+class _ComponentsSlot:
+    """Marcador da posição dos componentes em um ``EnvelopeTemplate``."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "COMPONENTS"
+
+
+COMPONENTS = _ComponentsSlot()
+
+
+class EnvelopeTemplate:
+    """Envelope de destino pré-compilado a partir de um esqueleto declarativo.
+
+    O esqueleto é um dicionário JSON com ``COMPONENTS`` na posição dos
+    componentes traduzidos. Na compilação, os contêineres que precisam ser
+    copiados por mensagem são separados das folhas compartilhadas, de modo
+    que ``render`` apenas recria dicionários/listas e insere os componentes.
+    """
+
+    __slots__ = ("_build",)
+
+    def __init__(self, skeleton: dict[str, Any]) -> None:
+        self._build = self._compile(skeleton)
+
+    def render(self, components: tuple[TranslatedComponent, ...]) -> dict[str, Any]:
+        """Instancia o envelope com os componentes informados."""
+        result: dict[str, Any] = self._build(components)
+        return result
+
+    @classmethod
+    def _compile(cls, node: Any) -> Callable[[Any], Any]:
+        if node is COMPONENTS:
+            return lambda components: components
+        if isinstance(node, dict):
+            items = [(key, cls._compile(value)) for key, value in node.items()]
+            return lambda components: {k: build(components) for k, build in items}
+        if isinstance(node, list):
+            builders = [cls._compile(value) for value in node]
+            return lambda components: [build(components) for build in builders]
+        return lambda components: node
+
+
+@dataclass(frozen=True, slots=True)
+class ProtocolAdapter:
+    """Extrator (etapa 1) e compositor (etapa 4) de um protocolo.
+
+    ``compose`` pode ser omitido quando ``template`` é informado; nesse caso
+    o envelope é gerado a partir do template pré-compilado.
+    """
+    name: str
+    extract: Extractor
+    compose: Composer | None = None
+    template: EnvelopeTemplate | None = None
+
+    def __post_init__(self) -> None:
+        """Deriva ``compose`` do template quando não informado."""
+        if self.compose is None:
+            if self.template is None:
+                raise ValueError(
+                    f"Adaptador '{self.name}' precisa de compose ou template"
+                )
+            object.__setattr__(self, "compose", self.template.render)
+
+
+_ADAPTERS: dict[str, ProtocolAdapter] = {}
+
+
+def register_adapter(adapter: ProtocolAdapter, replace: bool = False) -> None:
+    """Registra o adaptador de um protocolo.
+
+    Raises:
+        ValueError: se já houver adaptador com o mesmo nome e ``replace`` for falso.
+    """
+    if adapter.name in _ADAPTERS and not replace:
+        raise ValueError(f"Adaptador já registrado para o protocolo '{adapter.name}'")
+    _ADAPTERS[adapter.name] = adapter
+
+
+def get_adapter(name: str) -> ProtocolAdapter:
+    """Retorna o adaptador do protocolo (uma consulta à tabela).
+
+    Na primeira falta, procura um entry point ``nlagent.protocol_adapters``
+    com esse nome e importa apenas ele. O objeto carregado pode ser um
+    ``ProtocolAdapter`` ou uma fábrica sem argumentos que o retorne.
+
+    Raises:
+        ValueError: se nenhum adaptador estiver disponível para o protocolo.
+    """
+    adapter = _ADAPTERS.get(name)
+    if adapter is None:
+        adapter = _load_adapter_entry_point(name)
+    return adapter
+
+
+def available_adapters() -> list[str]:
+    """Nomes dos protocolos registrados ou instaláveis via entry points."""
+    names = set(_ADAPTERS)
+    names.update(ep.name for ep in entry_points(group=ADAPTER_ENTRY_POINT_GROUP))
+    return sorted(names)
+
+
+def _load_adapter_entry_point(name: str) -> ProtocolAdapter:
+    for ep in entry_points(group=ADAPTER_ENTRY_POINT_GROUP, name=name):
+        loaded = ep.load()
+        adapter = loaded if isinstance(loaded, ProtocolAdapter) else loaded()
+        if adapter.name != name:
+            raise ValueError(
+                f"Entry point '{name}' forneceu adaptador '{adapter.name}'"
+            )
+        register_adapter(adapter, replace=True)
+        return adapter
+    raise ValueError(f"Nenhum adaptador registrado para o protocolo '{name}'")
+
+
+def _extract_mcp(message: dict[str, Any]) -> SemanticStructure:
+    structure = SemanticStructure()
+    method = message.get("method", "")
+    params = message.get("params", {})
+    structure.performative = "request" if "call" in method else "query"
+    structure.intent = method
+    family = method.split("/", 1)[0]
+    root = _MCP_METHOD_ROOTS.get(family, family)
+    if params:
+        _flatten_paths(params, root, structure.conceitos, _MCP_SEGMENT_ALIASES)
+    else:
+        structure.conceitos.append(method)
+    structure.context = params
+    return structure
+
+
+def _extract_a2a(message: dict[str, Any]) -> SemanticStructure:
+    structure = SemanticStructure()
+    structure.performative = message.get("role", "agent")
+    _flatten_paths(message, "", structure.conceitos, exclude=_A2A_ENVELOPE)
+    for part in message.get("parts", []):
+        ptype = part.get("type", "text")
+        if ptype == "data" and isinstance(part.get("data"), dict):
+            _flatten_paths(part["data"], "", structure.conceitos)
+        else:
+            structure.conceitos.append(ptype)
+    structure.intent = "a2a_message"
+    structure.context = message
+    return structure
+
+
+def _extract_acp(message: dict[str, Any]) -> SemanticStructure:
+    structure = SemanticStructure()
+    payload = message.get("payload", {})
+    structure.performative = message.get("message_type", "request")
+    structure.intent = payload.get("intent", "")
+    _flatten_paths(message, "", structure.conceitos, exclude=_ACP_ENVELOPE)
+    parameters = payload.get("parameters", {})
+    if parameters:
+        # Parâmetros ACP são endereçados como ``payload.<campo>``
+        _flatten_paths(parameters, "payload", structure.conceitos)
+    structure.context = payload.get("context", {})
+    return structure
+
+
+def _extract_anp(message: dict[str, Any]) -> SemanticStructure:
+    structure = SemanticStructure()
+    structure.performative = message.get("type", "request")
+    structure.intent = message.get("interface", {}).get("id", "")
+    _flatten_paths(message, "", structure.conceitos, exclude=_ANP_ENVELOPE)
+    params = message.get("params", {})
+    if params:
+        # Argumentos ANP instanciam o esquema da interface
+        _flatten_paths(params, "interface.inputSchema", structure.conceitos)
+    structure.context = {"did": message.get("did", "")}
+    return structure
+
+
+def _compose_mcp(components: tuple[TranslatedComponent, ...]) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {
+            "translated_components": components,
+        },
+        "id": 1,
+    }
+
+
+def _compose_a2a(components: tuple[TranslatedComponent, ...]) -> dict[str, Any]:
+    return {
+        "role": "agent",
+        "parts": [
+            {"type": "data", "data": {"components": components}}
+        ],
+    }
+
+
+def _compose_acp(components: tuple[TranslatedComponent, ...]) -> dict[str, Any]:
+    return {
+        "acp_version": "1.0",
+        "message_type": "request",
+        "payload": {
+            "intent": "translated_message",
+            "parameters": {"components": components},
+            "context": {},
+        },
+    }
+
+
+def _compose_anp(components: tuple[TranslatedComponent, ...]) -> dict[str, Any]:
+    return {
+        "anp_version": "1.0",
+        "type": "request",
+        "params": {"translated_components": components},
+    }
+
+
+register_adapter(ProtocolAdapter(Protocol.MCP.value, _extract_mcp, _compose_mcp))
+register_adapter(ProtocolAdapter(Protocol.A2A.value, _extract_a2a, _compose_a2a))
+register_adapter(ProtocolAdapter(Protocol.ACP.value, _extract_acp, _compose_acp))
+register_adapter(ProtocolAdapter(Protocol.ANP.value, _extract_anp, _compose_anp))
+
+
 # ---------------------------------------------------------------------------
 # Tradutor Semântico Principal
 # ---------------------------------------------------------------------------
 
 class SemanticTranslator:
-    """
-    Tradutor semântico central do framework NL-Agent.
+    """Tradutor semântico central do framework NL-Agent.
 
     Implementa o Algoritmo 5.1 (Tradução Semântica) com 5 etapas:
     1. EXTRAIR — Análise semântica da mensagem de origem
@@ -168,18 +1199,46 @@ class SemanticTranslator:
     5. RETORNAR — Mensagem traduzida com metadados
 
     Parâmetros:
-        oracle: endpoint do oráculo epistêmico (LLM/LRM)
-        ontology_registry: registro de ontologias por protocolo
+        oracle: endpoint do oráculo epistêmico (LLM/LRM); consultado na etapa 2
+            quando implementa ``AlignmentOracle`` e/ou ``AsyncAlignmentOracle``
+        ontology_registry: registro de ontologias por protocolo (ver
+            ``OntologyIndex``); indexado uma vez na construção
+        alignment_cache: cache de alinhamentos; ``None`` cria um
+            ``AlignmentCache`` em memória com os padrões e
+            ``NO_ALIGNMENT_CACHE`` desliga o cache. Use ``from_config`` para
+            a seção ``cache`` do ``bridge-config.yaml``. O cache é esvaziado
+            quando ``planner.add_mapping`` altera os mapeamentos.
+        oracle_concurrency: máximo de consultas oraculares simultâneas por
+            mensagem em ``translate_async``
+        trace_level: detalhe do ``translation_log`` (padrão: desligado)
     """
 
     def __init__(
         self,
         oracle: Any = None,
-        ontology_registry: dict[str, Any] | None = None,
+        ontology_registry: Mapping[str, Any] | OntologyIndex | None = None,
+        alignment_cache: AlignmentCache | _NoAlignmentCache | None = None,
+        oracle_concurrency: int = 8,
+        trace_level: TraceLevel | str = TraceLevel.OFF,
     ) -> None:
+        if oracle_concurrency <= 0:
+            raise ValueError("oracle_concurrency deve ser positivo")
         self.oracle = oracle
+        self.oracle_concurrency = oracle_concurrency
+        self.trace_level = TraceLevel(trace_level)
+        self.alignment_stats = AlignmentStats()
         self.ontology = ontology_registry or {}
+        self.ontology_index = (
+            self.ontology
+            if isinstance(self.ontology, OntologyIndex)
+            else OntologyIndex.from_registry(self.ontology)
+        )
         self.nl_reasoner = NaturalLogicReasoner()
+        if alignment_cache is None:
+            alignment_cache = AlignmentCache()
+        self.alignment_cache: AlignmentCache | None = (
+            None if isinstance(alignment_cache, _NoAlignmentCache) else alignment_cache
+        )
 
         # Mapeamentos diretos conhecidos (cache estático)
         self._direct_mappings: dict[tuple[str, str], dict[str, str]] = {
@@ -213,7 +1272,44 @@ class SemanticTranslator:
                 "action.description": "skill.description",
                 "correlation_id": "task.id",
             },
+            # ANP só se conecta ao ACP; demais pares usam o ACP como pivô
+            ("anp", "acp"): {
+                "interface.id": "action.id",
+                "interface.description": "action.description",
+                "interface.inputSchema": "payload",
+                "request.id": "correlation_id",
+            },
+            ("acp", "anp"): {
+                "action.id": "interface.id",
+                "action.description": "interface.description",
+                "payload": "interface.inputSchema",
+                "correlation_id": "request.id",
+            },
         }
+        self.planner = ProtocolGraph(self._direct_mappings)
+        self._planner_revision = self.planner.revision
+
+    @classmethod
+    def from_config(
+        cls,
+        path: str | Path = DEFAULT_CONFIG_PATH,
+        oracle: Any = None,
+        ontology_registry: Mapping[str, Any] | OntologyIndex | None = None,
+    ) -> SemanticTranslator:
+        """Cria o tradutor a partir de ``bridge-config.yaml``.
+
+        Usa a seção ``cache`` para o cache de alinhamentos e
+        ``logging.include_translation_log`` para ligar o trace completo.
+        """
+        config = load_bridge_config(path)
+        include_log = config.get("logging", {}).get("include_translation_log", False)
+        cache = AlignmentCache.from_config(config.get("cache", {}))
+        return cls(
+            oracle=oracle,
+            ontology_registry=ontology_registry,
+            alignment_cache=NO_ALIGNMENT_CACHE if cache is None else cache,
+            trace_level=TraceLevel.FULL if include_log else TraceLevel.OFF,
+        )
 
     # -----------------------------------------------------------------------
     # API Pública
@@ -222,11 +1318,10 @@ class SemanticTranslator:
     def translate(
         self,
         message: dict[str, Any],
-        source_protocol: Protocol,
-        target_protocol: Protocol,
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
     ) -> TranslationResult:
-        """
-        Traduz mensagem entre protocolos preservando semântica.
+        """Traduz mensagem entre protocolos preservando semântica.
 
         Implementa o Algoritmo 5.1 da dissertação (seção 5.2.1).
 
@@ -238,167 +1333,504 @@ class SemanticTranslator:
         Returns:
             TranslationResult com mensagem traduzida e metadados
         """
-        log: list[str] = []
+        return self._translate_planned(message, source_protocol, target_protocol, {})
+
+    async def translate_async(
+        self,
+        message: dict[str, Any],
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+        max_concurrency: int | None = None,
+    ) -> TranslationResult:
+        """Variante assíncrona de ``translate`` com alinhamento concorrente.
+
+        A etapa 2 consulta o oráculo para todos os conceitos ao mesmo tempo,
+        limitada por um semáforo; as etapas 3-5 só rodam após todos os
+        alinhamentos chegarem. A latência passa de n x T_oracle para
+        aproximadamente max(T_oracle).
+
+        Args:
+            message: Mensagem no formato do protocolo de origem
+            source_protocol: Protocolo de origem
+            target_protocol: Protocolo de destino
+            max_concurrency: Limite de consultas simultâneas
+                (padrão: ``oracle_concurrency``)
+
+        Returns:
+            TranslationResult equivalente ao de ``translate``
+        """
+        trace = TranslationTrace() if self.trace_level is not TraceLevel.OFF else None
 
         # Etapa 1: Extração semântica
-        log.append(f"[1/5] Extraindo semântica de {source_protocol.value}")
+        if trace is not None:
+            trace.add("extract", protocol_name(source_protocol))
         semantic_structure = self._extract_semantics(message, source_protocol)
 
-        # Etapa 2: Consulta oracular para alinhamento
-        log.append(f"[2/5] Consultando oráculo para alinhamento → {target_protocol.value}")
-        alignments = self._query_alignments(
-            concepts=semantic_structure.conceitos,
-            source_protocol=source_protocol,
-            target_protocol=target_protocol,
+        # Etapa 2: Alinhamentos concorrentes
+        if trace is not None:
+            trace.add("align", protocol_name(target_protocol))
+        concepts = list(dict.fromkeys(semantic_structure.conceitos))
+        alignments = await self._query_alignments_async(
+            concepts,
+            source_protocol,
+            target_protocol,
+            max_concurrency or self.oracle_concurrency,
+        )
+        plans = {
+            concept: self._plan_concept(concept, alignment)
+            for concept, alignment in zip(concepts, alignments, strict=True)
+        }
+
+        return self._transform_and_compose(
+            semantic_structure, source_protocol, target_protocol, plans, trace
+        )
+
+    def translate_batch(
+        self,
+        messages: Sequence[BatchItem],
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+    ) -> list[TranslationResult | BatchTranslationError]:
+        """Traduz um lote de mensagens reaproveitando o plano por par de protocolos.
+
+        As mensagens são agrupadas por par (origem, destino) e, dentro de cada
+        grupo, o alinhamento (etapa 2) e a transformação (etapa 3) de cada
+        conceito distinto são resolvidos uma única vez.
+
+        Args:
+            messages: Mensagens do lote. Um item pode ser a mensagem em si
+                (usa os protocolos padrão) ou uma tupla
+                ``(mensagem, origem, destino)`` que sobrepõe o par padrão.
+            source_protocol: Protocolo de origem padrão
+            target_protocol: Protocolo de destino padrão
+
+        Returns:
+            Lista na ordem de entrada; cada posição contém o TranslationResult
+            ou um BatchTranslationError quando aquela mensagem falhou.
+        """
+        results: dict[int, TranslationResult | BatchTranslationError] = {}
+        groups: dict[
+            tuple[ProtocolLike, ProtocolLike], list[tuple[int, dict[str, Any]]]
+        ] = {}
+        for index, item in enumerate(messages):
+            source, target = source_protocol, target_protocol
+            try:
+                if isinstance(item, tuple):
+                    message, source, target = item
+                else:
+                    message = item
+                group = groups.setdefault((source, target), [])
+            except (ValueError, TypeError) as exc:
+                # Tupla malformada ou protocolo não hashable: falha só deste item.
+                results[index] = BatchTranslationError(
+                    index=index,
+                    source_protocol=source,
+                    target_protocol=target,
+                    error=exc,
+                )
+                continue
+            group.append((index, message))
+
+        for (source, target), items in groups.items():
+            plans: dict[str, _ConceptPlan] = {}
+            for index, message in items:
+                try:
+                    results[index] = self._translate_planned(
+                        message, source, target, plans
+                    )
+                except Exception as exc:  # Isolamento por mensagem
+                    results[index] = BatchTranslationError(
+                        index=index,
+                        source_protocol=source,
+                        target_protocol=target,
+                        error=exc,
+                    )
+
+        return [results[index] for index in range(len(messages))]
+
+    # Limite de planos de conceito mantidos durante um stream (memória constante)
+    STREAM_PLAN_LIMIT = 4096
+
+    def translate_stream(
+        self,
+        lines: Iterable[str | bytes],
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+        stats: StreamStats | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Traduz um fluxo NDJSON (uma mensagem JSON por linha) sob demanda.
+
+        Cada linha é lida, traduzida e entregue antes da próxima ser
+        consumida, de modo que a memória não cresce com o tamanho do fluxo.
+        Linhas em branco são ignoradas; linhas inválidas geram um registro
+        de erro em vez de interromper o fluxo.
+
+        Args:
+            lines: Iterável de linhas (arquivo aberto, ``sys.stdin`` etc.)
+            source_protocol: Protocolo de origem
+            target_protocol: Protocolo de destino
+            stats: Agregados atualizados durante o consumo (opcional)
+
+        Yields:
+            ``{"line", "message", "confidence", "preservation_rate",
+            "semantic_losses"}`` por tradução ou ``{"line", "error"}``.
+        """
+        stats = stats if stats is not None else StreamStats()
+        plans: dict[str, _ConceptPlan] = {}
+        started = time.perf_counter()
+
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            stats.records += 1
+            try:
+                message = json.loads(line)
+                if len(plans) > self.STREAM_PLAN_LIMIT:
+                    plans.clear()
+                result = self._translate_planned(
+                    message, source_protocol, target_protocol, plans
+                )
+            except Exception as exc:
+                stats.failed += 1
+                stats.elapsed_seconds = time.perf_counter() - started
+                yield {"line": line_no, "error": f"{type(exc).__name__}: {exc}"}
+                continue
+
+            preservation = result.preservation_rate
+            stats.translated += 1
+            stats.semantic_losses += len(result.semantic_losses)
+            stats.preservation_sum += preservation
+            stats.confidence_sum += result.confidence
+            stats.elapsed_seconds = time.perf_counter() - started
+            yield {
+                "line": line_no,
+                "message": result.message,
+                "confidence": result.confidence,
+                "preservation_rate": preservation,
+                "semantic_losses": len(result.semantic_losses),
+            }
+
+        stats.elapsed_seconds = time.perf_counter() - started
+
+    # -----------------------------------------------------------------------
+    # Métodos Internos
+    # -----------------------------------------------------------------------
+
+    def _translate_planned(
+        self,
+        message: dict[str, Any],
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+        plans: dict[str, _ConceptPlan],
+    ) -> TranslationResult:
+        """Executa as 5 etapas reutilizando planos de conceitos já resolvidos.
+
+        ``plans`` é preenchido com os conceitos ainda não vistos, de modo que
+        chamadas sucessivas com o mesmo dicionário (mesmo par de protocolos)
+        só consultam o alinhamento dos conceitos novos.
+        """
+        trace = TranslationTrace() if self.trace_level is not TraceLevel.OFF else None
+
+        # Etapa 1: Extração semântica
+        if trace is not None:
+            trace.add("extract", protocol_name(source_protocol))
+        semantic_structure = self._extract_semantics(message, source_protocol)
+        concepts = semantic_structure.conceitos
+
+        # Etapa 2: Consulta oracular para alinhamento (somente conceitos novos)
+        if trace is not None:
+            trace.add("align", protocol_name(target_protocol))
+        missing = [c for c in dict.fromkeys(concepts) if c not in plans]
+        if missing:
+            alignments = self._query_alignments(
+                concepts=missing,
+                source_protocol=source_protocol,
+                target_protocol=target_protocol,
+            )
+            for concept, alignment in zip(missing, alignments, strict=True):
+                plans[concept] = self._plan_concept(concept, alignment)
+
+        return self._transform_and_compose(
+            semantic_structure, source_protocol, target_protocol, plans, trace
         )
 
+    def _transform_and_compose(
+        self,
+        semantic_structure: SemanticStructure,
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+        plans: dict[str, _ConceptPlan],
+        trace: TranslationTrace | None,
+    ) -> TranslationResult:
+        """Etapas 3-5 a partir de planos já resolvidos para todos os conceitos."""
         # Etapa 3: Aplicar transformações
-        log.append("[3/5] Aplicando transformações conceituais")
-        translated_components: list[dict[str, Any]] = []
+        if trace is not None:
+            trace.add("transform")
+        concept_events = (
+            trace.events
+            if trace is not None and self.trace_level is TraceLevel.FULL
+            else None
+        )
+        translated_components: list[TranslatedComponent] = []
         semantic_losses: list[SemanticLoss] = []
+        concept_alignments: list[OntologyAlignment] = []
 
-        for concept, alignment in zip(semantic_structure.conceitos, alignments):
-            if alignment.is_direct:
-                translated = self._apply_direct_mapping(concept, alignment)
-                log.append(f"  ✓ Mapeamento direto: {concept} → {alignment.target_entity}")
-            elif alignment.is_composite:
-                translated = self._apply_composite_mapping(concept, alignment)
-                log.append(f"  ◐ Mapeamento composto: {concept}")
-            else:
-                translated, loss = self._approximate(concept, alignment)
-                semantic_losses.append(loss)
-                log.append(f"  ⚠ Aproximação: {concept} (perda: {loss.residual_loss:.2f})")
-            translated_components.append(translated)
+        for concept in semantic_structure.conceitos:
+            plan = plans[concept]
+            translated_components.append(plan.component)
+            if plan.loss is not None:
+                semantic_losses.append(plan.loss)
+            concept_alignments.append(plan.alignment)
+            if concept_events is not None:
+                concept_events.append(plan.trace_event)
 
         # Etapa 4: Composição e validação via NL
-        log.append("[4/5] Validando consistência via NL Reasoner")
-        translated_message = self._compose(translated_components, target_protocol)
+        if trace is not None:
+            trace.add("validate")
+        components = tuple(translated_components)
+        translated_message = self._compose(components, target_protocol)
 
         if not self.nl_reasoner.is_consistent(translated_message):
-            log.append("  ⚠ Inconsistência detectada — aplicando correções NL")
+            if trace is not None:
+                trace.add("correct")
             translated_message = self.nl_reasoner.apply_corrections(translated_message)
 
         # Etapa 5: Retornar com metadados
-        log.append("[5/5] Tradução concluída")
-        confidence = self._compute_confidence(alignments)
+        if trace is not None:
+            trace.add("done")
+        confidence = self._compute_confidence(concept_alignments)
 
         return TranslationResult(
-            message=translated_message,
+            envelope=translated_message,
             source_protocol=source_protocol,
             target_protocol=target_protocol,
             semantic_losses=semantic_losses,
             confidence=confidence,
-            translation_log=log,
+            components=components,
+            trace=trace,
         )
 
-    # -----------------------------------------------------------------------
-    # Métodos Internos
-    # -----------------------------------------------------------------------
+    def _plan_concept(
+        self, concept: str, alignment: OntologyAlignment
+    ) -> _ConceptPlan:
+        """Etapa 3 para um único conceito: componente, perda e evento de trace."""
+        if alignment.is_direct:
+            component = self._apply_direct_mapping(concept, alignment)
+            return _ConceptPlan(
+                alignment, component, None,
+                ("direct", (concept, alignment.target_entity)),
+            )
+        if alignment.is_composite:
+            component = self._apply_composite_mapping(concept, alignment)
+            return _ConceptPlan(alignment, component, None, ("composite", (concept,)))
+        component, loss = self._approximate(concept, alignment)
+        return _ConceptPlan(
+            alignment, component, loss,
+            ("approximate", (concept, loss.residual_loss)),
+        )
 
     def _extract_semantics(
-        self, message: dict[str, Any], protocol: Protocol
+        self, message: dict[str, Any], protocol: ProtocolLike
     ) -> SemanticStructure:
-        """Etapa 1: Extrai estrutura semântica da mensagem de origem."""
-        structure = SemanticStructure()
-
-        if protocol == Protocol.MCP:
-            method = message.get("method", "")
-            params = message.get("params", {})
-            structure.performative = "request" if "call" in method else "query"
-            structure.intent = method
-            structure.conceitos = list(params.keys()) if params else [method]
-            structure.context = params
-
-        elif protocol == Protocol.A2A:
-            parts = message.get("parts", [])
-            structure.performative = message.get("role", "agent")
-            for part in parts:
-                ptype = part.get("type", "text")
-                structure.conceitos.append(ptype)
-            structure.intent = "a2a_message"
-            structure.context = message
-
-        elif protocol == Protocol.ACP:
-            payload = message.get("payload", {})
-            structure.performative = message.get("message_type", "request")
-            structure.intent = payload.get("intent", "")
-            structure.conceitos = list(payload.get("parameters", {}).keys())
-            structure.context = payload.get("context", {})
-
-        return structure
+        """Etapa 1: Extrai estrutura semântica da mensagem de origem.
+
+        Delega ao extrator do adaptador registrado para o protocolo. Os
+        conceitos são caminhos pontuados totalmente qualificados no
+        vocabulário de ``_direct_mappings`` (ex.: ``tool.name``,
+        ``tool.inputSchema.query``, ``payload.dataset_uri``).
+        """
+        return get_adapter(protocol_name(protocol)).extract(message)
+
+    def _current_alignment_cache(self) -> AlignmentCache | None:
+        """Cache de alinhamentos, esvaziado se os mapeamentos mudaram."""
+        cache = self.alignment_cache
+        if self._planner_revision != self.planner.revision:
+            self._planner_revision = self.planner.revision
+            if cache is not None:
+                cache.clear()
+        return cache
 
     def _query_alignments(
         self,
         concepts: list[str],
-        source_protocol: Protocol,
-        target_protocol: Protocol,
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
     ) -> list[OntologyAlignment]:
         """Etapa 2: Consulta oráculo para correspondências ontológicas."""
-        key = (source_protocol.value, target_protocol.value)
-        direct_map = self._direct_mappings.get(key, {})
+        source = protocol_name(source_protocol)
+        target = protocol_name(target_protocol)
+        plan = self.planner.plan(source, target)
+        cache = self._current_alignment_cache()
 
         alignments: list[OntologyAlignment] = []
         for concept in concepts:
-            # Buscar mapeamento direto
-            direct_target = direct_map.get(concept)
-            if direct_target:
-                alignments.append(OntologyAlignment(
-                    source_entity=concept,
-                    target_entity=direct_target,
-                    relation=SemanticRelation.EQUIVALENT,
-                    confidence=0.95,
-                    is_direct=True,
-                ))
+            if cache is not None:
+                cache_key = (source, target, concept)
+                alignment = cache.get(cache_key)
+                if alignment is None:
+                    alignment = self._align_concept(
+                        concept, plan, source_protocol, target_protocol
+                    )
+                    cache.put(cache_key, alignment)
             else:
-                # Sem mapeamento direto → aproximação
-                alignments.append(OntologyAlignment(
-                    source_entity=concept,
-                    target_entity=f"~{concept}",
-                    relation=SemanticRelation.SUBSUMES,
-                    confidence=0.72,
-                    is_direct=False,
-                    is_composite=False,
-                ))
+                alignment = self._align_concept(
+                    concept, plan, source_protocol, target_protocol
+                )
+            alignments.append(alignment)
 
         return alignments
 
+    async def _query_alignments_async(
+        self,
+        concepts: list[str],
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+        max_concurrency: int,
+    ) -> list[OntologyAlignment]:
+        """Etapa 2 assíncrona: resolve todos os conceitos concorrentemente."""
+        source = protocol_name(source_protocol)
+        target = protocol_name(target_protocol)
+        plan = self.planner.plan(source, target)
+        cache = self._current_alignment_cache()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def resolve(concept: str) -> OntologyAlignment:
+            cache_key = (source, target, concept)
+            if cache is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            alignment = self._local_alignment(concept, plan, source, target)
+            if alignment is None:
+                async with semaphore:
+                    alignment = await self._ask_oracle_async(
+                        concept, source_protocol, target_protocol
+                    )
+            if alignment is None:
+                alignment = self._approximate_alignment(concept)
+            if cache is not None:
+                cache.put(cache_key, alignment)
+            return alignment
+
+        return list(await asyncio.gather(*(resolve(c) for c in concepts)))
+
+    async def _ask_oracle_async(
+        self, concept: str, source_protocol: ProtocolLike, target_protocol: ProtocolLike
+    ) -> OntologyAlignment | None:
+        """Consulta o oráculo sem bloquear o event loop."""
+        oracle = self.oracle
+        if isinstance(oracle, (AsyncAlignmentOracle, AlignmentOracle)):
+            self.alignment_stats.oracle_queries += 1
+        if isinstance(oracle, AsyncAlignmentOracle):
+            return await oracle.align_async(concept, source_protocol, target_protocol)
+        if isinstance(oracle, AlignmentOracle):
+            return await asyncio.to_thread(
+                oracle.align, concept, source_protocol, target_protocol
+            )
+        return None
+
+    def _align_concept(
+        self,
+        concept: str,
+        plan: TranslationPlan,
+        source_protocol: ProtocolLike,
+        target_protocol: ProtocolLike,
+    ) -> OntologyAlignment:
+        """Resolve o alinhamento de um conceito (sem cache)."""
+        source_name = protocol_name(source_protocol)
+        target_name = protocol_name(target_protocol)
+        alignment = self._local_alignment(concept, plan, source_name, target_name)
+        if alignment is None and isinstance(self.oracle, AlignmentOracle):
+            self.alignment_stats.oracle_queries += 1
+            alignment = self.oracle.align(concept, source_protocol, target_protocol)
+        if alignment is None:
+            alignment = self._approximate_alignment(concept)
+        return alignment
+
+    def _local_alignment(
+        self, concept: str, plan: TranslationPlan, source: str, target: str
+    ) -> OntologyAlignment | None:
+        """Alinhamento sem oráculo: plano de rota, depois ontologia indexada."""
+        alignment = self._direct_alignment(concept, plan)
+        if alignment is not None:
+            self.alignment_stats.direct += 1
+            return alignment
+        if self.ontology_index:
+            alignment = self.ontology_index.lookup(source, target, concept)
+            if alignment is not None:
+                self.alignment_stats.ontology += 1
+                if alignment.relation is SemanticRelation.DISJOINT:
+                    # ⊥ registrado: não há equivalente, o oráculo não é consultado.
+                    return self._approximate_alignment(concept)
+        return alignment
+
+    def _direct_alignment(
+        self, concept: str, plan: TranslationPlan
+    ) -> OntologyAlignment | None:
+        """Busca o conceito na tabela (direta ou composta) do plano de rota.
+
+        Aceita casamento por prefixo pontuado (ver ``_resolve_path``); a
+        confiança é a da rota (0,95 por salto).
+        """
+        direct_target = _resolve_path(plan.mapping, concept)
+        if direct_target is None:
+            return None
+        return OntologyAlignment(
+            source_entity=concept,
+            target_entity=direct_target,
+            relation=SemanticRelation.EQUIVALENT,
+            confidence=plan.confidence,
+            is_direct=True,
+        )
+
+    def _approximate_alignment(self, concept: str) -> OntologyAlignment:
+        """Sem mapeamento direto nem resposta oracular → aproximação."""
+        self.alignment_stats.approximations += 1
+        return OntologyAlignment(
+            source_entity=concept,
+            target_entity=f"~{concept}",
+            relation=SemanticRelation.SUBSUMES,
+            confidence=0.72,
+            is_direct=False,
+            is_composite=False,
+        )
+
     def _apply_direct_mapping(
         self, concept: str, alignment: OntologyAlignment
-    ) -> dict[str, Any]:
+    ) -> TranslatedComponent:
         """Aplica mapeamento direto (1:1) entre conceitos."""
-        return {
-            "original": concept,
-            "translated": alignment.target_entity,
-            "relation": alignment.relation.value,
-            "confidence": alignment.confidence,
-            "type": AlignmentType.DIRECT.value,
-        }
+        return TranslatedComponent(
+            original=concept,
+            translated=alignment.target_entity,
+            relation=alignment.relation,
+            confidence=alignment.confidence,
+            type=AlignmentType.DIRECT,
+        )
 
     def _apply_composite_mapping(
         self, concept: str, alignment: OntologyAlignment
-    ) -> dict[str, Any]:
+    ) -> TranslatedComponent:
         """Aplica mapeamento composto (decomposição e tradução)."""
-        return {
-            "original": concept,
-            "translated": alignment.target_entity,
-            "relation": alignment.relation.value,
-            "confidence": alignment.confidence,
-            "type": AlignmentType.COMPOSITE.value,
-            "components": [],
-        }
+        return TranslatedComponent(
+            original=concept,
+            translated=alignment.target_entity,
+            relation=alignment.relation,
+            confidence=alignment.confidence,
+            type=AlignmentType.COMPOSITE,
+        )
 
     def _approximate(
         self, concept: str, alignment: OntologyAlignment
-    ) -> tuple[dict[str, Any], SemanticLoss]:
+    ) -> tuple[TranslatedComponent, SemanticLoss]:
         """Gera aproximação com aviso de perda semântica."""
-        translated = {
-            "original": concept,
-            "translated": alignment.target_entity,
-            "relation": alignment.relation.value,
-            "confidence": alignment.confidence,
-            "type": AlignmentType.APPROXIMATE.value,
-            "warning": f"Sem correspondência direta para '{concept}'",
-        }
+        translated = TranslatedComponent(
+            original=concept,
+            translated=alignment.target_entity,
+            relation=alignment.relation,
+            confidence=alignment.confidence,
+            type=AlignmentType.APPROXIMATE,
+            warning=f"Sem correspondência direta para '{concept}'",
+        )
 
         loss = SemanticLoss(
             concept=concept,
@@ -411,37 +1843,13 @@ class SemanticTranslator:
 
     def _compose(
         self,
-        components: list[dict[str, Any]],
-        target_protocol: Protocol,
+        components: tuple[TranslatedComponent, ...],
+        target_protocol: ProtocolLike,
     ) -> dict[str, Any]:
-        """Compõe mensagem final no formato do protocolo de destino."""
-        if target_protocol == Protocol.MCP:
-            return {
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "params": {
-                    "translated_components": components,
-                },
-                "id": 1,
-            }
-        elif target_protocol == Protocol.A2A:
-            return {
-                "role": "agent",
-                "parts": [
-                    {"type": "data", "data": {"components": components}}
-                ],
-            }
-        elif target_protocol == Protocol.ACP:
-            return {
-                "acp_version": "1.0",
-                "message_type": "request",
-                "payload": {
-                    "intent": "translated_message",
-                    "parameters": {"components": components},
-                    "context": {},
-                },
-            }
-        return {"components": components}
+        """Compõe o envelope da mensagem final no formato do protocolo de destino."""
+        compose = get_adapter(protocol_name(target_protocol)).compose
+        assert compose is not None  # Derivado do template em __post_init__.
+        return compose(components)
 
     def _compute_confidence(self, alignments: list[OntologyAlignment]) -> float:
         """Calcula confiança global da tradução."""
@@ -451,11 +1859,12 @@ class SemanticTranslator:
 
 
 # ---------------------------------------------------------------------------
-# Ponto de entrada para demonstração
+# Ponto de entrada (demonstração e streaming NDJSON)
 # ---------------------------------------------------------------------------
 
-if __name__ == "__main__":
-    translator = SemanticTranslator()
+def _run_demo() -> None:
+    """Demonstração: tradução MCP → A2A de uma única mensagem."""
+    translator = SemanticTranslator(trace_level=TraceLevel.FULL)
 
     # Exemplo: Traduzir mensagem MCP → A2A
     mcp_message = {
@@ -480,3 +1889,55 @@ if __name__ == "__main__":
     for entry in result.translation_log:
         print(f"    {entry}")
     print()
+
+
+def _run_stream(args: argparse.Namespace) -> int:
+    """Traduz NDJSON de arquivo/stdin para arquivo/stdout incrementalmente."""
+    translator = SemanticTranslator()
+    stats = StreamStats()
+    source, target = args.source, args.target
+
+    with ExitStack() as stack:
+        src = (
+            sys.stdin
+            if args.input == "-"
+            else stack.enter_context(open(args.input, encoding="utf-8"))
+        )
+        dst = (
+            sys.stdout
+            if args.output == "-"
+            else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+        )
+        for record in translator.translate_stream(src, source, target, stats):
+            dst.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    print(json.dumps(stats.as_dict(), ensure_ascii=False), file=sys.stderr)
+    return 1 if stats.failed and not stats.translated else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI: ``demo`` (padrão) ou ``stream`` para tradução NDJSON em lote."""
+    parser = argparse.ArgumentParser(
+        prog="python src/core/semantic_translator.py",
+        description="Tradutor semântico NL-Agent (MCP, A2A, ACP).",
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("demo", help="tradução de exemplo MCP → A2A")
+    stream = commands.add_parser(
+        "stream", help="traduz NDJSON com memória constante"
+    )
+    protocols = available_adapters()
+    stream.add_argument("input", nargs="?", default="-", help="arquivo NDJSON ou '-'")
+    stream.add_argument("-o", "--output", default="-", help="destino NDJSON ou '-'")
+    stream.add_argument("--source", required=True, choices=protocols)
+    stream.add_argument("--target", required=True, choices=protocols)
+    args = parser.parse_args(argv)
+
+    if args.command == "stream":
+        return _run_stream(args)
+    _run_demo()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
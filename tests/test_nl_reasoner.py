@@ -0,0 +1,146 @@
+"""test_nl_reasoner.py — Testes unitários para o Motor de Inferência NL."""
+
+import json
+import tracemalloc
+
+from src.core.nl_reasoner import (
+    InferenceMode,
+    KnowledgeBase,
+    NLReasoner,
+    Proposition,
+)
+
+
+def test_knowledge_base_monotonic_updates_deduplicate_by_content():
+    """Adições monotônicas ignoram proposições já conhecidas pelo conteúdo."""
+    kb = KnowledgeBase()
+
+    assert kb.add(Proposition("rota R-042 ativa", source="rota"))
+    assert not kb.add(Proposition("rota R-042 ativa", confidence=0.5, source="outra"))
+    assert kb.add(Proposition("50 alunos", source="rota"))
+
+    assert len(kb) == 2
+    assert "rota R-042 ativa" in kb
+    assert kb.get("rota R-042 ativa").confidence == 1.0
+    assert [p.content for p in kb.from_source("rota")] == [
+        "rota R-042 ativa",
+        "50 alunos",
+    ]
+
+
+def test_knowledge_base_revision_retracts_only_defeasible_same_source():
+    """A revisão retrai só as derrotáveis da mesma fonte."""
+    kb = KnowledgeBase()
+    kb.add(Proposition("cardápio A", source="cardapio", defeasible=True))
+    kb.add(Proposition("cardápio fixo", source="cardapio"))
+    kb.add(Proposition("cardápio B", source="outra_fonte", defeasible=True))
+
+    retracted = kb.revise(Proposition("cardápio C", source="cardapio"))
+
+    assert [p.content for p in retracted] == ["cardápio A"]
+    assert [p.content for p in kb] == ["cardápio fixo", "cardápio B", "cardápio C"]
+    assert kb.discard("cardápio B").source == "outra_fonte"
+    assert kb.from_source("outra_fonte") == []
+
+
+def test_reasoner_learn_mutates_internal_base_and_snapshot_is_stable():
+    """``learn`` altera a base interna; o snapshot anterior permanece estável."""
+    reasoner = NLReasoner()
+    reasoner.learn(Proposition("status=planejado", source="s", defeasible=True))
+    snapshot = reasoner.knowledge_base.snapshot()
+
+    retracted = reasoner.learn(
+        Proposition("status=executado", source="s"), InferenceMode.NON_MONOTONIC
+    )
+
+    assert [p.content for p in retracted] == ["status=planejado"]
+    assert [p.content for p in snapshot] == ["status=planejado"]
+    assert [p.content for p in reasoner.knowledge_base] == ["status=executado"]
+    for i in range(10_000):
+        reasoner.learn(Proposition(f"fato {i % 5_000}", source=f"s{i % 7}"))
+    assert len(reasoner.knowledge_base) == 5_001
+
+
+def test_proposition_extraction_handles_deep_payloads_without_recursion():
+    """Cargas profundas são percorridas sem recursão nem memória quadrática."""
+    message = leaf = {}
+    for _ in range(20_000):
+        leaf["n"] = {}
+        leaf = leaf["n"]
+    leaf["route_id"] = "R-042"
+    leaf["students"] = [{"count": 50}]
+
+    tracemalloc.start()
+    try:
+        report = NLReasoner().validate_message(message)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Caminhos montados só ao emitir: sem O(profundidade²) em memória.
+    assert peak < 20_000_000
+    assert report.original_propositions == 2
+    assert report.level.value == "consistent"
+    depth = "n." * 20_000
+    sources = [p.source for p in NLReasoner()._iter_propositions(message)]
+    assert sources == [f"{depth}route_id", f"{depth}students[0].count"]
+
+
+def test_validate_message_can_stop_once_inconsistent():
+    """``early_exit`` interrompe a validação após o limite de inconsistências."""
+    message = {"blobs": [{"json": "{quebrado"} for _ in range(1_000)]}
+    reasoner = NLReasoner()
+
+    full = reasoner.validate_message(message)
+    early = reasoner.validate_message(message, early_exit=True)
+
+    assert full.level == early.level
+    assert full.level.value == "inconsistent"
+    assert not full.truncated and full.original_propositions == 1_000
+    assert early.truncated
+    assert early.original_propositions == len(early.issues) == 6
+
+
+def test_distribution_check_prefilters_and_memoizes_blob_verdicts():
+    """Blobs truncados são rejeitados antes do parse e os repetidos memoizados."""
+    template = json.dumps({"aluno": "Ana", "notas": [9, 8], "obs": "chave } solta"})
+    message = {
+        "alunos": [{"ficha": template} for _ in range(50)],
+        "quebrados": [{"ficha": '{"aluno": "Bia", "notas": [7'} for _ in range(3)],
+        "aspas": {"ficha": '{"texto": "sem fim}'},
+        "texto": {"ficha": '{"ok": "sim", "chaves": "{[]}"} '},
+    }
+    reasoner = NLReasoner(distribution_memo_size=8)
+
+    report = reasoner.validate_message(message)
+
+    assert len(report.issues) == 4
+    assert report.valid_propositions == 51
+    # Um parse por blob distinto; os truncados são rejeitados antes do parse.
+    assert reasoner.distribution_parses == 3
+    assert reasoner.distribution_memo_hits == 49
+
+    reasoner.validate_message({"blobs": [{"b": f'{{"id": {i}}}'} for i in range(20)]})
+    assert len(reasoner._distribution_memo) == 8
+
+
+class _CollidingText(str):
+    """Texto com hash constante: força colisões no memo de distribuição."""
+
+    def __hash__(self) -> int:
+        return 0
+
+
+def test_distribution_memo_is_not_fooled_by_hash_collisions():
+    """Blobs com o mesmo hash mantêm veredictos distintos no memo."""
+    reasoner = NLReasoner()
+    valid = Proposition(_CollidingText('{"ok": true}'))
+    broken = Proposition(_CollidingText('{"ok": tru}'))
+
+    assert reasoner._check_distribution(valid)
+    assert not reasoner._check_distribution(broken)
+    assert reasoner._check_distribution(valid)
+    assert reasoner.distribution_parses == 2
+    assert reasoner.distribution_memo_hits == 1
+    # Chaves são digests de tamanho fixo, não o texto dos blobs.
+    assert all(len(key) == 16 for key in reasoner._distribution_memo)
@@ -0,0 +1,1167 @@
+"""test_oracle_query.py — Testes unitários para Consulta Oracular."""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+
+import pytest
+
+from src.core.oracle_cache import OracleResponseCache, make_cache_key
+from src.core.oracle_decode import OracleDecodeError
+from src.core.oracle_metrics import LatencyHistogram, OracleMetrics
+from src.core.oracle_pool import (
+    CircuitState,
+    EndpointPool,
+    PoolSaturatedError,
+    PoolUnavailableError,
+)
+from src.core.oracle_prompts import QUERY_PREFIX
+from src.core.oracle_query import (
+    AdaptiveRouter,
+    AlignmentBatcher,
+    InvocationPolicy,
+    LatencyWindow,
+    ModelTier,
+    OracleOverloadedError,
+    OracleQuery,
+    OracleType,
+    RouteAction,
+    SemanticAlignmentQuery,
+    TaskClassifier,
+)
+from src.core.oracle_stream import IncrementalJSONParser
+from src.core.oracle_stub import (
+    LatencyModel,
+    StubOracle,
+    StubOracleError,
+    StubOracleServer,
+    StubProfile,
+)
+
+
+class CountingEndpoint:
+    """Endpoint síncrono que conta chamadas e devolve uma resposta fixa."""
+
+    def __init__(self, raw=None):
+        self.calls = 0
+        self.raw = raw or json.dumps(
+            {"answer": "ok", "confidence": 0.9, "sources": [], "caveats": []}
+        )
+
+    def generate(self, prompt):
+        """Conta a chamada e devolve a resposta fixa."""
+        self.calls += 1
+        return self.raw
+
+
+class SlowEndpoint(CountingEndpoint):
+    """Endpoint lento (síncrono e assíncrono) para forçar consultas em voo."""
+
+    def __init__(self, delay=0.05):
+        super().__init__()
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        """Conta a chamada e responde após ``delay``."""
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.raw
+
+    async def generate_async(self, prompt):
+        """Variante assíncrona de ``generate``."""
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.raw
+
+
+class BatchEndpoint:
+    """Responde prompts multi-item com um array; ``drop`` omite itens."""
+
+    def __init__(self, drop=()):
+        self.prompts = []
+        self.drop = set(drop)
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        """Responde cada item do prompt, exceto os de ``drop``."""
+        with self._lock:
+            self.prompts.append(prompt)
+        ids = [int(i) for i in re.findall(r"^Item (\d+):", prompt, re.M)]
+        if not ids:
+            return json.dumps({"relation": "≡", "confidence": 0.6})
+        return json.dumps(
+            [
+                {"id": i, "relation": "⊑", "confidence": 0.9, "mapping": {"n": str(i)}}
+                for i in reversed(ids)
+                if i not in self.drop
+            ]
+        )
+
+
+class ScriptedAsyncEndpoint:
+    """Endpoint assíncrono cujas chamadas seguem um roteiro de atrasos/erros."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+
+    async def generate_async(self, prompt):
+        """Executa o próximo passo do roteiro (atraso ou exceção)."""
+        step = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        if isinstance(step, BaseException):
+            raise step
+        await asyncio.sleep(step)
+        return json.dumps({"answer": f"chamada {self.calls}", "confidence": 0.9})
+
+
+def _fast_policy(**overrides):
+    options = dict(
+        timeouts_ms={ModelTier.SYSTEM_1_LLM: 50.0, ModelTier.SYSTEM_2_LRM: 200.0},
+        backoff_base_ms=1.0,
+        backoff_max_ms=2.0,
+    )
+    options.update(overrides)
+    return InvocationPolicy(**options)
+
+
+class QuestionBatchEndpoint:
+    """Responde prompts com perguntas numeradas com um array JSON."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt):
+        """Responde as perguntas numeradas com um array JSON."""
+        self.prompts.append(prompt)
+        ids = [int(i) for i in re.findall(r"^Pergunta (\d+):", prompt, re.M)]
+        if not ids:
+            return json.dumps({"answer": "individual", "confidence": 0.7})
+        return json.dumps(
+            [{"id": i, "answer": f"resposta {i}", "confidence": 0.9} for i in ids]
+        )
+
+
+class StreamingEndpoint:
+    """Gera a resposta JSON em fragmentos; registra consumo e encerramento."""
+
+    def __init__(self, confidence=0.9, chunk_size=8):
+        raw = json.dumps(
+            {
+                "confidence": confidence,
+                "answer": "Resposta longa do raciocinador " * 4,
+                "sources": ["Lei 14.113/2020"],
+                "caveats": [],
+            },
+            ensure_ascii=False,
+        )
+        self.chunks = [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+        self.calls = 0
+        self.consumed = 0
+        self.closed = False
+
+    def generate_stream(self, prompt):
+        """Emite os fragmentos e marca o encerramento do gerador."""
+        self.calls += 1
+        try:
+            for chunk in self.chunks:
+                self.consumed += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+class FakeClock:
+    """Relógio manual para os disjuntores do pool."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        """Devolve o instante atual."""
+        return self.now
+
+
+def _alignment_query(concept="tool"):
+    return SemanticAlignmentQuery(
+        source_protocol="MCP",
+        source_concept=concept,
+        source_definition="An executable capability",
+        target_protocol="A2A",
+        target_concept="skill",
+    )
+
+
+def test_cache_key_normalizes_whitespace_and_separates_tier_and_type():
+    """A chave normaliza espaços e distingue nível e tipo de consulta."""
+    key = make_cache_key("Qual  é\n o status?", "llm", "first_order")
+    assert key == make_cache_key("Qual é o status?", "llm", "first_order")
+    assert key != make_cache_key("Qual é o status?", "lrm", "first_order")
+    assert key != make_cache_key("Qual é o status?", "llm", "second_order")
+
+
+def test_identical_queries_hit_the_response_cache():
+    """Consultas idênticas são atendidas pelo cache de respostas."""
+    endpoint = CountingEndpoint()
+    oracle = OracleQuery(llm_endpoint=endpoint, response_cache=OracleResponseCache())
+
+    for _ in range(3):
+        response = oracle.query_with_context("Status do A2A?", "contexto")
+    oracle.query_alignment(_alignment_query())
+    oracle.query_alignment(_alignment_query())
+
+    assert endpoint.calls == 2
+    assert response.answer == "ok"
+    assert oracle.cache.hits == 3
+    assert oracle.cache.hit_ratio == pytest.approx(3 / 5)
+
+
+def test_cache_ttl_and_negative_caching_of_parse_failures():
+    """Entradas expiram pelo TTL e falhas de parse usam TTL negativo."""
+    clock = FakeClock()
+    cache = OracleResponseCache(ttl_seconds=100, negative_ttl_seconds=10, clock=clock)
+    endpoint = CountingEndpoint(raw="texto livre, sem JSON")
+    oracle = OracleQuery(llm_endpoint=endpoint, response_cache=cache)
+
+    oracle.query_with_context("Pergunta?", "ctx")
+    oracle.query_with_context("Pergunta?", "ctx")
+    assert endpoint.calls == 1
+    assert cache.negative_hits == 1
+
+    clock.now += 11
+    oracle.query_with_context("Pergunta?", "ctx")
+    assert endpoint.calls == 2
+    assert cache.expirations == 1
+
+
+def test_cache_lru_size_limit():
+    """O cache descarta as entradas menos usadas além do limite."""
+    cache = OracleResponseCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, "{}")
+    assert cache.get("a") is None
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+
+def test_sqlite_backend_survives_restart(tmp_path):
+    """O backend SQLite preserva as respostas entre instâncias."""
+    path = tmp_path / "oracle.sqlite3"
+    first = OracleQuery(
+        llm_endpoint=CountingEndpoint(), response_cache=OracleResponseCache(path=path)
+    )
+    first.query_with_context(
+        "Status do A2A?", "ctx", oracle_type=OracleType.SECOND_ORDER
+    )
+    first.cache.close()
+
+    endpoint = CountingEndpoint()
+    second = OracleQuery(
+        llm_endpoint=endpoint, response_cache=OracleResponseCache(path=path)
+    )
+    response = second.query_with_context(
+        "Status do A2A?", "ctx", oracle_type=OracleType.SECOND_ORDER
+    )
+
+    assert endpoint.calls == 0
+    assert second.cache.disk_hits == 1
+    assert response.model_tier == ModelTier.SYSTEM_1_LLM
+    assert response.oracle_type == OracleType.SECOND_ORDER
+
+
+def test_concurrent_identical_queries_from_threads_coalesce():
+    """Consultas idênticas simultâneas em threads viram uma só chamada."""
+    endpoint = SlowEndpoint()
+    oracle = OracleQuery(llm_endpoint=endpoint)
+    barrier = threading.Barrier(8)
+    answers = []
+
+    def worker():
+        barrier.wait()
+        answers.append(oracle.query_with_context("Status do A2A?", "ctx").answer)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert endpoint.calls == 1
+    assert answers == ["ok"] * 8
+    assert oracle.flights.coalesced == 7
+    assert oracle.flights.in_flight() == 0
+
+
+def test_concurrent_identical_queries_from_asyncio_coalesce():
+    """Consultas idênticas simultâneas no asyncio viram uma só chamada."""
+    endpoint = SlowEndpoint()
+    cache = OracleResponseCache()
+    oracle = OracleQuery(llm_endpoint=endpoint, response_cache=cache)
+
+    async def run():
+        return await asyncio.gather(
+            *(oracle.query_alignment_async(_alignment_query()) for _ in range(16))
+        )
+
+    responses = asyncio.run(run())
+
+    assert endpoint.calls == 1
+    assert {r.relation for r in responses} == {responses[0].relation}
+    assert oracle.async_flights.coalesced == 15
+    # A resposta da líder foi gravada: nova consulta sai do cache.
+    asyncio.run(oracle.query_alignment_async(_alignment_query()))
+    assert endpoint.calls == 1
+    assert cache.hits == 1
+
+
+def test_coalescing_can_be_disabled_and_errors_reach_followers():
+    """Sem coalescência cada chamada vai ao endpoint; erros chegam aos seguidores."""
+    endpoint = SlowEndpoint()
+    oracle = OracleQuery(llm_endpoint=endpoint, coalesce=False)
+
+    async def run():
+        await asyncio.gather(
+            *(oracle.query_with_context_async("Status?", "ctx") for _ in range(4))
+        )
+
+    asyncio.run(run())
+    assert endpoint.calls == 4
+
+    class FailingEndpoint:
+        def generate(self, prompt):
+            time.sleep(0.05)
+            raise ConnectionError("endpoint indisponível")
+
+    failing = OracleQuery(llm_endpoint=FailingEndpoint())
+    errors = []
+
+    def worker():
+        try:
+            failing.query_with_context("Status?", "ctx")
+        except ConnectionError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(errors) == 4
+    assert failing.flights.in_flight() == 0
+
+
+def test_query_alignments_splits_batch_and_falls_back_per_item():
+    """Lotes de alinhamento são divididos e itens ausentes refeitos um a um."""
+    endpoint = BatchEndpoint(drop={1})
+    oracle = OracleQuery(llm_endpoint=endpoint, response_cache=OracleResponseCache())
+    queries = [_alignment_query(f"tool_{i}") for i in range(3)]
+
+    responses = oracle.query_alignments(queries)
+
+    # Um prompt de lote + uma chamada individual para o item omitido.
+    assert len(endpoint.prompts) == 2
+    assert [r.mapping.get("n") for r in responses] == ["0", None, "2"]
+    assert responses[1].relation == "≡"
+    assert oracle.batch_fallbacks == 1
+
+    # Os itens divididos ficam em cache sob a chave da consulta individual.
+    assert oracle.query_alignment(queries[2]).mapping == {"n": "2"}
+    assert len(endpoint.prompts) == 2
+
+    # Um único item fora do cache não forma lote nem conta como recaída.
+    oracle.query_alignments([queries[0], _alignment_query("tool_novo")])
+    assert len(endpoint.prompts) == 3
+    assert oracle.batch_fallbacks == 1
+
+
+def test_query_alignments_unparseable_batch_falls_back_to_individual_calls():
+    """Resposta de lote ilegível recai em chamadas individuais."""
+    endpoint = CountingEndpoint(raw="não é JSON")
+    oracle = OracleQuery(llm_endpoint=endpoint)
+
+    responses = oracle.query_alignments([_alignment_query(f"c{i}") for i in range(4)])
+
+    assert endpoint.calls == 1 + 4
+    assert oracle.batch_fallbacks == 4
+    assert all(r.relation == "⊥" for r in responses)
+
+
+def test_alignment_batcher_groups_by_size_and_window():
+    """O agrupador despacha por tamanho de lote ou por janela de tempo."""
+    endpoint = BatchEndpoint()
+    oracle = OracleQuery(llm_endpoint=endpoint)
+
+    with AlignmentBatcher(oracle, max_batch_size=4, window_ms=1000) as batcher:
+        futures = [batcher.submit(_alignment_query(f"c{i}")) for i in range(4)]
+        responses = [f.result(timeout=5) for f in futures]
+    assert batcher.batches == 1
+    assert [r.mapping["n"] for r in responses] == ["0", "1", "2", "3"]
+
+    with AlignmentBatcher(oracle, max_batch_size=100, window_ms=10) as batcher:
+
+        async def run():
+            return await asyncio.gather(
+                *(batcher.align_async(_alignment_query(f"d{i}")) for i in range(5))
+            )
+
+        responses = asyncio.run(run())
+    assert batcher.batches == 1
+    assert len(responses) == 5
+    assert len(endpoint.prompts) == 2
+
+
+def test_async_invocation_enforces_timeout_and_retries_transient_failures():
+    """A invocação assíncrona aplica timeout e repete falhas transitórias."""
+    endpoint = ScriptedAsyncEndpoint([5.0, ConnectionError("reset"), 0.0])
+    oracle = OracleQuery(llm_endpoint=endpoint, policy=_fast_policy(), seed=7)
+
+    start = time.perf_counter()
+    response = asyncio.run(oracle.query_with_context_async("Status?", "ctx"))
+
+    assert time.perf_counter() - start < 1.0
+    assert response.answer == "chamada 3"
+    assert endpoint.calls == 3
+    assert oracle.retries == 2
+
+
+def test_async_invocation_gives_up_after_max_retries():
+    """A invocação desiste após ``max_retries`` tentativas."""
+    endpoint = ScriptedAsyncEndpoint([5.0])
+    oracle = OracleQuery(llm_endpoint=endpoint, policy=_fast_policy(max_retries=2))
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(oracle.query_with_context_async("Status?", "ctx"))
+    assert endpoint.calls == 3
+
+    # Erros não transitórios não são retentados.
+    failing = ScriptedAsyncEndpoint([ValueError("bug")])
+    oracle = OracleQuery(llm_endpoint=failing, policy=_fast_policy())
+    with pytest.raises(ValueError):
+        asyncio.run(oracle.query_with_context_async("Status?", "ctx"))
+    assert failing.calls == 1
+
+
+def test_system1_hedging_takes_the_first_response():
+    """O hedging do Sistema 1 aproveita a primeira resposta."""
+    endpoint = ScriptedAsyncEndpoint([1.0, 0.0])
+    policy = _fast_policy(
+        timeouts_ms={ModelTier.SYSTEM_1_LLM: 2000.0}, hedge=True, hedge_default_ms=20
+    )
+    oracle = OracleQuery(llm_endpoint=endpoint, policy=policy)
+
+    start = time.perf_counter()
+    response = asyncio.run(oracle.query_with_context_async("Status?", "ctx"))
+
+    assert time.perf_counter() - start < 0.5
+    assert response.answer == "chamada 2"
+    assert (oracle.hedges_sent, oracle.hedge_wins) == (1, 1)
+
+    # Com amostras suficientes, o atraso do hedge passa a ser o p95 observado.
+    oracle = OracleQuery(policy=policy)
+    assert oracle._hedge_delay_ms(ModelTier.SYSTEM_1_LLM) == 20
+    for latency in range(1, 101):
+        oracle.latencies[ModelTier.SYSTEM_1_LLM].record(float(latency))
+    assert oracle._hedge_delay_ms(ModelTier.SYSTEM_1_LLM) == 96.0
+
+
+def test_latency_window_percentiles_follow_the_sliding_window():
+    """Percentis refletem só as amostras da janela, com repetições."""
+    window = LatencyWindow(size=4)
+    assert window.percentile(95) is None
+    for latency in (50.0, 10.0, 50.0, 30.0, 20.0, 20.0):
+        window.record(latency)
+
+    # Restam 50, 30, 20, 20: o primeiro 50 e o 10 saíram da janela.
+    assert len(window) == 4
+    assert [window.percentile(q) for q in (0, 50, 75, 100)] == [20.0, 30.0, 50.0, 50.0]
+
+
+def test_invocation_policy_from_bridge_config():
+    """A política de invocação é lida do bridge-config."""
+    from src.core.semantic_translator import load_bridge_config
+
+    config = load_bridge_config()
+    policy = InvocationPolicy.from_config(config)
+
+    assert policy.timeout_s(ModelTier.SYSTEM_1_LLM) == 5.0
+    assert policy.timeout_s(ModelTier.SYSTEM_2_LRM) == 60.0
+    assert policy.max_retries == 3
+    assert policy.hedge is True
+    rng = random.Random(1)
+    assert all(0 <= policy.backoff_s(a, rng) <= 2.0 for a in range(10))
+
+    oracle = OracleQuery.from_config(config)
+    assert oracle.policy == policy
+    assert oracle.cache is not None
+
+
+def test_task_classifier_single_pass_rules_and_boundary():
+    """O classificador aplica as regras em uma passada, incluindo o limiar."""
+    classifier = TaskClassifier()
+
+    assert classifier.classify("Calcule o orçamento") == ModelTier.SYSTEM_2_LRM
+    assert classifier.classify("Resuma", ["Verificar fontes"]) == ModelTier.SYSTEM_2_LRM
+    assert classifier.classify("Traduza o cartão") == ModelTier.SYSTEM_1_LLM
+    # A pergunta e as restrições não se concatenam sem separador.
+    assert classifier.match("Quem é o ca", ["lcular"]) is None
+
+    custom = TaskClassifier.from_config(
+        {"lrm_keywords": ["merenda"], "extra_lrm_keywords": ["SGTE"], "memo_size": 8}
+    )
+    assert custom.classify("Status do sgte") == ModelTier.SYSTEM_2_LRM
+    assert custom.classify("Calcule") == ModelTier.SYSTEM_1_LLM
+    assert TaskClassifier([]).classify("Calcule") == ModelTier.SYSTEM_1_LLM
+
+    custom.classify("Status do sgte")
+    assert custom._match.cache_info().hits == 1
+
+
+def test_oracle_query_routes_with_configured_classifier():
+    """O ``OracleQuery`` roteia com o classificador configurado."""
+    llm, lrm = CountingEndpoint(), CountingEndpoint()
+    oracle = OracleQuery(
+        llm_endpoint=llm,
+        lrm_endpoint=lrm,
+        classifier=TaskClassifier(["cardápio"]),
+    )
+
+    assert oracle.query_with_context("Revise o cardápio", "ctx").model_tier == (
+        ModelTier.SYSTEM_2_LRM
+    )
+    assert oracle.query_with_context("Calcule", "ctx").model_tier == (
+        ModelTier.SYSTEM_1_LLM
+    )
+    assert (llm.calls, lrm.calls) == (1, 1)
+
+
+LRM = ModelTier.SYSTEM_2_LRM
+
+
+def test_adaptive_router_downgrades_queues_and_sheds_under_lrm_pressure():
+    """Sob pressão no LRM o roteador rebaixa, enfileira e descarta."""
+    router = AdaptiveRouter(min_samples=3, max_queue=0)
+    assert router.decide("Traduza o cartão").reason == "no_lrm_keyword"
+    assert router.decide("Otimize a rota").as_dict() == {
+        "tier": "lrm",
+        "action": "route",
+        "reason": "lrm_keyword",
+        "keyword": "otimiz",
+        "protected": False,
+    }
+
+    for _ in range(3):
+        router.observe(LRM, latency_ms=45000, error=False)
+    assert router.pressure(LRM) == "latency_over_target"
+
+    downgraded = router.decide("Otimize a rota")
+    assert downgraded.tier == ModelTier.SYSTEM_1_LLM
+    assert downgraded.action == RouteAction.DOWNGRADE
+    assert downgraded.reason == "latency_over_target"
+
+    shed = router.decide("Verifique a lei de licitações")
+    assert (shed.action, shed.reason) == (RouteAction.SHED, "queue_full")
+    assert shed.protected
+
+    # FUNDEB nunca é rebaixado nem rejeitado por fila cheia.
+    fundeb = router.decide("Valide a prestação", ["Regra de 70% do FUNDEB"])
+    assert (fundeb.tier, fundeb.action) == (LRM, RouteAction.QUEUE)
+
+
+def test_adaptive_router_error_budget_and_saturation():
+    """O roteador considera orçamento de erros e saturação."""
+    router = AdaptiveRouter(min_samples=1, lrm_max_in_flight=1, alpha=0.5)
+    router.observe(LRM, latency_ms=100, error=True)
+    assert router.pressure(LRM) == "error_rate_over_budget"
+    for _ in range(10):
+        router.observe(LRM, latency_ms=100, error=False)
+    assert router.pressure(LRM) is None
+
+    router.begin(LRM)
+    assert router.pressure(LRM) == "saturated"
+    assert router.wait_for_slot(LRM, timeout=0.01) is False
+    threading.Timer(0.02, router.end, args=(LRM, 100.0, False)).start()
+    assert router.wait_for_slot(LRM, timeout=2) is True
+    # A vaga obtida já está reservada até ``release_slot``.
+    assert router.snapshot()["lrm"]["in_flight"] == 1
+    router.release_slot(LRM)
+    assert router.snapshot()["lrm"]["in_flight"] == 0
+
+
+def test_queued_queries_never_exceed_lrm_max_in_flight():
+    """Consultas enfileiradas concorrentes respeitam ``lrm_max_in_flight``."""
+    lrm = SlowEndpoint(delay=0.02)
+    router = AdaptiveRouter(min_samples=1, lrm_max_in_flight=2, max_queue=64)
+    oracle = OracleQuery(
+        llm_endpoint=CountingEndpoint(), lrm_endpoint=lrm, router=router
+    )
+    peak = 0
+    lock = threading.Lock()
+    generate = lrm.generate
+
+    def counting_generate(prompt):
+        nonlocal peak
+        with lock:
+            peak = max(peak, router.health[LRM].in_flight)
+        return generate(prompt)
+
+    lrm.generate = counting_generate
+    router.begin(LRM)
+    router.begin(LRM)  # Saturado: as consultas de compliance entram na fila.
+
+    def ask(i):
+        response = oracle.query_with_context(f"Audite o PDDE {i}", "ctx")
+        assert response.routing.action == RouteAction.QUEUE
+
+    threads = [threading.Thread(target=ask, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    router.end(LRM)
+    router.end(LRM)
+    for thread in threads:
+        thread.join()
+
+    assert lrm.calls == 8
+    assert peak <= 2
+    snapshot = router.snapshot()["lrm"]
+    assert (snapshot["in_flight"], snapshot["queued"]) == (0, 0)
+
+    async def ask_async(i):
+        return await oracle.query_with_context_async(f"Audite o PNAE {i}", "ctx")
+
+    async def saturated_then_cancelled():
+        router.begin(LRM)
+        router.begin(LRM)
+        waiting = asyncio.ensure_future(ask_async(0))
+        await asyncio.sleep(0.02)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        router.end(LRM)
+        router.end(LRM)
+        await asyncio.sleep(0.05)  # A thread da espera devolve a vaga obtida.
+
+    asyncio.run(saturated_then_cancelled())
+    assert router.snapshot()["lrm"]["in_flight"] == 0
+
+
+def test_oracle_query_applies_router_decisions_and_feeds_health():
+    """As decisões do roteador são aplicadas e a saúde é realimentada."""
+    llm, lrm = CountingEndpoint(), CountingEndpoint()
+    router = AdaptiveRouter(min_samples=1, max_queue=0)
+    oracle = OracleQuery(llm_endpoint=llm, lrm_endpoint=lrm, router=router)
+
+    response = oracle.query_with_context("Otimize a rota", "ctx")
+    assert response.routing.reason == "lrm_keyword"
+    assert lrm.calls == 1
+    assert router.snapshot()["lrm"]["samples"] == 1
+
+    router.observe(LRM, error=True)
+    response = oracle.query_with_context("Otimize a rota 2", "ctx")
+    assert response.model_tier == ModelTier.SYSTEM_1_LLM
+    assert response.routing.action == RouteAction.DOWNGRADE
+    assert llm.calls == 1
+
+    with pytest.raises(OracleOverloadedError) as excinfo:
+        oracle.query_with_context("Audite o PDDE", "ctx")
+    assert excinfo.value.decision.reason == "queue_full"
+    assert lrm.calls == 1
+
+
+def test_latency_histogram_quantiles_within_hdr_precision():
+    """Os quantis do histograma respeitam a precisão HDR."""
+    histogram = LatencyHistogram()
+    for value_us in range(1, 100_001):
+        histogram.record_us(value_us)
+
+    assert histogram.count == 100_000
+    assert histogram.quantile_us(0.5) == pytest.approx(50_000, rel=0.02)
+    assert histogram.quantile_us(0.99) == pytest.approx(99_000, rel=0.02)
+    assert histogram.quantile_us(1.0) == 100_000
+    assert len(histogram.counts) < 1000
+
+
+def test_invocations_populate_latency_and_per_series_histograms(tmp_path):
+    """Invocações alimentam a janela de latência e os histogramas por série."""
+    endpoint = SlowEndpoint(delay=0.02)
+    metrics = OracleMetrics()
+    oracle = OracleQuery(
+        llm_endpoint=endpoint, response_cache=OracleResponseCache(), metrics=metrics
+    )
+
+    miss = oracle.query_with_context("Status do A2A?", "ctx")
+    hit = oracle.query_with_context("Status do A2A?", "ctx")
+    oracle.query_alignment(_alignment_query())
+
+    assert miss.latency_ms >= 20
+    assert hit.latency_ms < miss.latency_ms
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {
+        "llm|first_order|miss",
+        "llm|first_order|hit",
+        "llm|alignment|miss",
+    }
+    assert snapshot["llm|first_order|miss"]["count"] == 1
+    assert snapshot["llm|first_order|miss"]["quantiles_ms"]["0.5"] >= 20
+
+    prom = metrics.dump(tmp_path / "oracle.prom").read_text(encoding="utf-8")
+    assert "# TYPE nlagent_oracle_latency_ms summary" in prom
+    assert (
+        'nlagent_oracle_latency_ms_count{tier="llm",oracle_type="first_order",'
+        'cache="hit"} 1'
+    ) in prom
+    dumped = json.loads(metrics.dump(tmp_path / "oracle.json").read_text("utf-8"))
+    assert dumped == json.loads(metrics.to_json())
+
+
+def test_streaming_surfaces_confidence_and_answer_before_the_end():
+    """O streaming expõe confiança e resposta antes do fim."""
+    endpoint = StreamingEndpoint()
+    oracle = OracleQuery(llm_endpoint=endpoint, response_cache=OracleResponseCache())
+
+    events = []
+    consumed_at = {}
+    for event in oracle.stream_with_context("Status do A2A?", "ctx"):
+        events.append(event)
+        if event.field:
+            consumed_at[event.field] = endpoint.consumed
+
+    assert [e.field for e in events] == [
+        "confidence",
+        "answer",
+        "sources",
+        "caveats",
+        None,
+    ]
+    assert consumed_at["confidence"] < consumed_at["answer"] < len(endpoint.chunks)
+    response = events[-1].response
+    assert response.confidence == 0.9
+    assert response.sources == ["Lei 14.113/2020"]
+    assert response.latency_ms > 0
+
+    # O stream completo foi gravado: a repetição sai do cache.
+    replay = list(oracle.stream_with_context("Status do A2A?", "ctx"))
+    assert endpoint.calls == 1
+    assert replay[-1].response.answer == response.answer
+
+
+def test_streaming_short_circuit_closes_endpoint_stream():
+    """O curto-circuito do streaming encerra o stream do endpoint."""
+    endpoint = StreamingEndpoint(confidence=0.4)
+    router = AdaptiveRouter()
+    oracle = OracleQuery(
+        llm_endpoint=endpoint, response_cache=OracleResponseCache(), router=router
+    )
+
+    for event in oracle.stream_with_context("Status do A2A?", "ctx"):
+        if event.field == "confidence" and event.value < 0.7:
+            break
+
+    assert endpoint.closed
+    assert endpoint.consumed < len(endpoint.chunks)
+    assert router.snapshot()["llm"]["in_flight"] == 0
+    assert len(oracle.cache) == 0
+
+
+def test_streaming_falls_back_for_non_streaming_endpoints():
+    """Endpoints sem streaming usam a chamada completa."""
+    events = list(
+        OracleQuery(llm_endpoint=CountingEndpoint()).stream_with_context("Oi?", "ctx")
+    )
+    assert [e.field for e in events][:2] == ["answer", "confidence"]
+    assert events[-1].response.answer == "ok"
+
+    simulated = list(OracleQuery().stream_with_context("Oi?", "ctx"))
+    assert simulated[-1].response.confidence == 0.75
+
+
+def test_incremental_parser_is_chunking_independent():
+    """O parser incremental independe da fragmentação."""
+    doc = {
+        "confidence": 0.82,
+        "answer": 'Texto "citado", barra \\ e acentuação ' * 3,
+        "sources": ["a", {"b": [1, 2]}],
+        "ok": True,
+        "vazio": None,
+    }
+    raw = "Segue a resposta: " + json.dumps(doc, ensure_ascii=False, indent=1)
+    rng = random.Random(3)
+
+    for _ in range(50):
+        parser = IncrementalJSONParser()
+        fields, i = [], 0
+        while i < len(raw):
+            step = rng.randint(1, 6)
+            fields += parser.feed(raw[i : i + step])
+            i += step
+        assert dict(fields) == doc
+        assert [name for name, _ in fields] == list(doc)
+        assert parser.done and not parser.failed
+        assert parser.text == raw
+
+    broken = IncrementalJSONParser()
+    broken.feed('{"confidence": 0.x,')
+    broken.feed(' "answer": "resto"}')
+    assert broken.failed
+    assert broken.text == '{"confidence": 0.x, "answer": "resto"}'
+
+
+def test_typed_decoding_coerces_or_rejects_malformed_fields():
+    """A decodificação tipada converte ou rejeita campos malformados."""
+    oracle = OracleQuery()
+    parse = oracle._parse_response
+
+    coerced = parse(
+        json.dumps({"answer": 42, "confidence": "85%", "sources": "Lei 14.113"}),
+        OracleType.FIRST_ORDER,
+        ModelTier.SYSTEM_2_LRM,
+    )
+    assert coerced.answer == "42"
+    assert coerced.confidence == pytest.approx(0.85)
+    assert coerced.is_high_confidence
+    assert coerced.sources == ["Lei 14.113"]
+    assert coerced.caveats == [
+        "Campo 'confidence' convertido de texto",
+        "Campo 'sources' convertido de texto",
+    ]
+    assert coerced.model_tier == ModelTier.SYSTEM_2_LRM
+
+    rejected = parse(
+        '{"confidence": "alta", "caveats": [1]}',
+        OracleType.FIRST_ORDER,
+        ModelTier.SYSTEM_1_LLM,
+    )
+    assert rejected.confidence == 0.5
+    assert len(rejected.caveats) == 2
+    assert rejected.caveats[0].startswith("Campo 'confidence' rejeitado")
+
+    # JSON que não é objeto recai no fallback em vez de quebrar.
+    fallback = parse("[1, 2]", OracleType.FIRST_ORDER, ModelTier.SYSTEM_1_LLM)
+    assert fallback.caveats == ["Parse falhou"]
+
+    alignment = oracle._parse_alignment('{"relation": "≡", "mapping": ["x"]}')
+    assert (alignment.relation, alignment.mapping) == ("≡", {})
+
+
+def test_strict_decoding_raises_on_malformed_responses():
+    """O modo estrito levanta erro em respostas malformadas."""
+    oracle = OracleQuery(
+        llm_endpoint=CountingEndpoint(raw='{"answer": "ok", "confidence": 1.7}'),
+        strict_decoding=True,
+    )
+    with pytest.raises(OracleDecodeError, match="confidence"):
+        oracle.query_with_context("Status?", "ctx")
+    with pytest.raises(OracleDecodeError):
+        oracle._parse_alignment("não é JSON")
+
+
+def test_prompts_keep_static_prefix_then_interned_context():
+    """Prompts mantêm o prefixo estático antes do contexto internado."""
+    oracle = OracleQuery()
+    context = "Rede SEDF: 680 escolas, 14 regionais de ensino."
+
+    first = oracle._construct_prompt("Quantas escolas?", context, [])
+    second = oracle._construct_prompt("Quantas regionais?", context, ["Citar fonte"])
+    other = oracle._construct_prompt("Quantas escolas?", "Outro contexto", [])
+
+    assert first.startswith(QUERY_PREFIX) and other.startswith(QUERY_PREFIX)
+    shared = oracle.query_template.head(context)
+    assert first.startswith(shared) and second.startswith(shared)
+    assert first.index(context) < first.index("Quantas escolas?")
+    assert oracle.query_template.context_misses == 2
+    assert oracle.query_template.context_hits == 2
+
+
+def test_query_batch_sends_shared_context_once_per_tier():
+    """O contexto compartilhado vai uma vez por nível no lote."""
+    endpoint = QuestionBatchEndpoint()
+    oracle = OracleQuery(
+        llm_endpoint=endpoint,
+        lrm_endpoint=endpoint,
+        response_cache=OracleResponseCache(),
+    )
+    context = "Contexto extenso da rede escolar. " * 200
+    questions = [
+        "Resuma o cardápio",
+        "Calcule o orçamento",
+        "Traduza o cartão",
+        "Verifique a lei",
+        "Liste as regionais",
+    ]
+
+    responses = oracle.query_batch(questions, context)
+
+    assert len(endpoint.prompts) == 2
+    assert all(p.count(context) == 1 for p in endpoint.prompts)
+    assert [r.model_tier for r in responses] == [
+        ModelTier.SYSTEM_1_LLM,
+        ModelTier.SYSTEM_2_LRM,
+        ModelTier.SYSTEM_1_LLM,
+        ModelTier.SYSTEM_2_LRM,
+        ModelTier.SYSTEM_1_LLM,
+    ]
+    assert [r.answer for r in responses] == [
+        "resposta 0",
+        "resposta 0",
+        "resposta 1",
+        "resposta 1",
+        "resposta 2",
+    ]
+    batched_chars = sum(len(p) for p in endpoint.prompts)
+    individual_chars = sum(
+        len(oracle._construct_prompt(q, context, [])) for q in questions
+    )
+    assert batched_chars < individual_chars / 2
+
+    # Cada resposta ficou em cache sob a chave da pergunta individual.
+    assert oracle.query_with_context("Traduza o cartão", context).answer == "resposta 1"
+    assert len(endpoint.prompts) == 2
+
+
+def test_query_batch_waits_for_queued_items_and_records_shed_per_item():
+    """Itens enfileirados aguardam vaga; rejeições ficam no próprio item."""
+    llm, lrm = CountingEndpoint(), CountingEndpoint()
+    router = AdaptiveRouter(min_samples=1, lrm_max_in_flight=1, max_queue=0)
+    oracle = OracleQuery(llm_endpoint=llm, lrm_endpoint=lrm, router=router)
+    router.begin(LRM)  # Saturado: compliance é rejeitada, FUNDEB enfileirada.
+    threading.Timer(0.05, router.end, args=(LRM,)).start()
+
+    responses = oracle.query_batch(
+        ["Resuma o cardápio", "Audite o PDDE", "Valide a regra do FUNDEB"], "ctx"
+    )
+
+    assert [r.routing.action for r in responses] == [
+        RouteAction.ROUTE,
+        RouteAction.SHED,
+        RouteAction.QUEUE,
+    ]
+    assert responses[1].confidence == 0.0
+    assert responses[1].routing.reason == "queue_full"
+    assert responses[2].answer == "ok"
+    assert (llm.calls, lrm.calls) == (1, 1)
+    assert router.snapshot()["lrm"]["in_flight"] == 0
+
+
+class FlakyEndpoint(CountingEndpoint):
+    """Réplica que falha enquanto ``down`` for verdadeiro."""
+
+    def __init__(self, name, down=False):
+        super().__init__()
+        self.name = name
+        self.down = down
+
+    def generate(self, prompt):
+        """Falha enquanto ``down``; caso contrário responde."""
+        self.calls += 1
+        if self.down:
+            raise ConnectionError(f"{self.name} fora do ar")
+        return self.raw
+
+
+def test_endpoint_pool_balances_by_outstanding_requests_and_limits_concurrency():
+    """O pool escolhe a réplica menos ocupada e limita a concorrência."""
+    replicas = [SlowEndpoint(delay=0.05) for _ in range(3)]
+    pool = EndpointPool(replicas, max_concurrency=2, acquire_timeout_s=0.01)
+    results = []
+
+    def call():
+        try:
+            results.append(pool.generate("p"))
+        except PoolSaturatedError as exc:
+            results.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 3 réplicas x 2 vagas: seis chamadas atendidas, duas rejeitadas.
+    assert sum(isinstance(r, PoolSaturatedError) for r in results) == 2
+    assert [r.calls for r in replicas] == [2, 2, 2]
+    assert all(s["in_flight"] == 0 for s in pool.snapshot())
+
+
+def test_endpoint_pool_fails_over_and_ejects_failing_replica():
+    """O pool troca de réplica na falha e ejeta a réplica defeituosa."""
+    clock = FakeClock()
+    bad, good = FlakyEndpoint("a", down=True), FlakyEndpoint("b")
+    pool = EndpointPool(
+        [bad, good], failure_threshold=2, reset_timeout_s=30, clock=clock
+    )
+
+    for _ in range(4):
+        assert json.loads(pool.generate("p"))["answer"] == "ok"
+    # Duas falhas abrem o circuito; depois disso só a réplica boa é chamada.
+    assert bad.calls == 2
+    assert pool.replicas[0].breaker.state == CircuitState.OPEN
+
+    # Após o tempo de ejeção, uma sondagem bem-sucedida fecha o circuito.
+    bad.down = False
+    clock.now += 31
+    for _ in range(4):
+        pool.generate("p")
+    assert pool.replicas[0].breaker.state == CircuitState.CLOSED
+    assert bad.calls > 2
+
+
+def test_endpoint_pool_cancelled_probe_reopens_circuit():
+    """Sondagem cancelada devolve o circuito a aberto e permite nova sondagem."""
+    clock = FakeClock()
+    replica = SlowEndpoint(delay=5.0)
+    pool = EndpointPool([replica], failure_threshold=1, reset_timeout_s=30, clock=clock)
+    breaker = pool.replicas[0].breaker
+    breaker.record_failure()
+    opened_at = breaker.opened_at
+    clock.now += 31
+
+    async def cancel_probe():
+        probe = asyncio.create_task(pool.generate_async("p"))
+        await asyncio.sleep(0.01)
+        assert breaker.state == CircuitState.HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(cancel_probe())
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened_at == opened_at
+    assert pool.replicas[0].in_flight == 0
+    # A próxima chamada sonda de novo (sem PoolSaturatedError).
+    replica.delay = 0.0
+    assert json.loads(pool.generate("p"))["answer"] == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_endpoint_pool_releases_slot_on_base_exception():
+    """Interrupções fora de ``Exception`` também liberam a vaga da réplica."""
+
+    class InterruptingEndpoint:
+        def generate(self, prompt):
+            """Simula uma interrupção do usuário durante a chamada."""
+            raise KeyboardInterrupt
+
+    pool = EndpointPool([InterruptingEndpoint()])
+
+    with pytest.raises(KeyboardInterrupt):
+        pool.generate("p")
+
+    assert pool.replicas[0].in_flight == 0
+    assert pool.replicas[0].breaker.state == CircuitState.CLOSED
+
+
+def test_oracle_query_simulates_only_when_whole_pool_is_down():
+    """A resposta simulada só é usada com o pool inteiro fora do ar."""
+    clock = FakeClock()
+    replicas = [FlakyEndpoint("a"), FlakyEndpoint("b", down=True)]
+    pool = EndpointPool(replicas, failure_threshold=1, clock=clock)
+    oracle = OracleQuery(llm_endpoint=pool, response_cache=OracleResponseCache())
+
+    # Uma réplica fora: a consulta é atendida pela outra, sem simulação.
+    assert oracle.query_with_context("Resuma", "ctx").answer == "ok"
+    assert oracle.pool_fallbacks == 0
+
+    replicas[0].down = True
+    with pytest.raises(PoolUnavailableError):
+        pool.generate("p")
+    assert pool.is_down
+
+    response = oracle.query_with_context("Resuma de novo", "ctx")
+    assert "simulada" in response.answer
+    assert oracle.pool_fallbacks == 1
+    # A resposta simulada não fica em cache: recuperado o pool, volta o real.
+    for replica in replicas:
+        replica.down = False
+    clock.now += 60
+    assert oracle.query_with_context("Resuma de novo", "ctx").answer == "ok"
+
+
+def test_oracle_query_from_config_builds_pools_from_endpoint_lists():
+    """``from_config`` cria pools a partir de listas de endpoints."""
+    config = {
+        "bridge": {
+            "endpoint_pool": {
+                "max_concurrency_per_endpoint": 3,
+                "failure_threshold": 2,
+            }
+        }
+    }
+    oracle = OracleQuery.from_config(
+        config, llm_endpoint=[CountingEndpoint(), CountingEndpoint()]
+    )
+
+    assert isinstance(oracle.llm, EndpointPool)
+    assert len(oracle.llm.replicas) == 2
+    assert oracle.llm.replicas[0].max_concurrency == 3
+    assert oracle.llm.replicas[0].breaker.failure_threshold == 2
+    assert asyncio.run(oracle.llm.generate_async("p")) == CountingEndpoint().raw
+
+
+def test_stub_oracle_is_seeded_and_follows_latency_profile():
+    """O oráculo stub é determinístico e segue o perfil de latência."""
+    profile = StubProfile(LatencyModel("lognormal", median_ms=180, sigma=0.35))
+    prompts = [f"Pergunta:\nQ{i}\n\nRestrições:\n  (nenhuma)" for i in range(400)]
+
+    first, second = StubOracle(profile, seed=3), StubOracle(profile, seed=3)
+    plans = [first.plan(p) for p in prompts]
+    assert plans == [second.plan(p) for p in prompts]
+    assert plans != [StubOracle(profile, seed=4).plan(p) for p in prompts]
+
+    delays = sorted(delay for delay, _, _ in plans)
+    assert 150 < delays[len(delays) // 2] < 215
+    assert json.loads(plans[0][2])["answer"].endswith("Q0")
+
+    bounded = StubOracle(profile, seed=3, latency_history=50)
+    for p in prompts:
+        bounded.plan(p)
+    assert list(bounded.latencies_ms) == [delay for delay, _, _ in plans[-50:]]
+
+
+def test_stub_oracle_injects_errors_that_the_policy_retries():
+    """Erros injetados pelo stub são repetidos pela política."""
+    stub = StubOracle(
+        StubProfile(LatencyModel("constant", median_ms=1), error_rate=0.3),
+        seed=1,
+        time_scale=0.5,
+    )
+    oracle = OracleQuery(
+        llm_endpoint=stub, response_cache=None, policy=_fast_policy(max_retries=10)
+    )
+
+    for i in range(20):
+        response = asyncio.run(oracle.query_with_context_async(f"Q{i}", "ctx"))
+        assert response.answer.endswith(f"Q{i}")
+    assert stub.errors > 0
+    assert oracle.retries == stub.errors
+
+
+def test_stub_oracle_answers_batches_and_alignments():
+    """O stub responde lotes de perguntas e de alinhamentos."""
+    stub = StubOracle(StubProfile(LatencyModel("constant", median_ms=0)), seed=2)
+    oracle = OracleQuery(llm_endpoint=stub, lrm_endpoint=stub)
+
+    answers = oracle.query_batch(["Resuma A", "Resuma B"], "ctx")
+    assert [r.answer.split("] ")[1] for r in answers] == ["Resuma A", "Resuma B"]
+    alignments = oracle.query_alignments([_alignment_query(c) for c in "abc"])
+    assert {a.relation for a in alignments} <= {"⊑", "≡"}
+    assert stub.calls == 2
+
+
+def test_stub_oracle_http_server_roundtrip():
+    """O servidor HTTP do stub atende o cliente de ida e volta."""
+    profile = StubProfile(LatencyModel("constant", median_ms=0), error_rate=0.0)
+    failing = StubProfile(LatencyModel("constant", median_ms=0), error_rate=1.0)
+    oracles = {"llm": StubOracle(profile, seed=5), "lrm": StubOracle(failing)}
+
+    with StubOracleServer(oracles) as server:
+        oracle = OracleQuery(llm_endpoint=server.endpoint("llm"))
+        assert oracle.query_with_context("Olá", "ctx").answer.endswith("Olá")
+        with pytest.raises(StubOracleError):
+            server.endpoint("lrm").generate("p")
+    assert oracles["llm"].calls == 1
@@ -2,8 +2,34 @@
 test_semantic_translator.py — Testes unitários para o Tradutor Semântico.
 """
 
+import asyncio
+import json
+import time
+
 import pytest
-from src.core.semantic_translator import SemanticTranslator, Protocol, TranslationResult
+import src.core.semantic_translator as st
+from src.core.semantic_translator import (
+    COMPONENTS,
+    NO_ALIGNMENT_CACHE,
+    AlignmentCache,
+    BatchTranslationError,
+    EnvelopeTemplate,
+    OntologyAlignment,
+    OntologyIndex,
+    Protocol,
+    ProtocolAdapter,
+    ProtocolGraph,
+    SemanticRelation,
+    SemanticStructure,
+    SemanticTranslator,
+    StreamStats,
+    TraceLevel,
+    TranslationResult,
+    available_adapters,
+    get_adapter,
+    main,
+    register_adapter,
+)
 
 def test_translator_initialization():
     translator = SemanticTranslator()
@@ -29,3 +55,645 @@ def test_mcp_to_a2a_translation_structure():
     assert result.target_protocol == Protocol.A2A
     assert "role" in result.message
     assert result.confidence >= 0.0
+
+
+def _mcp_call(name, **arguments):
+    return {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+        "id": 1,
+    }
+
+
+def test_translate_batch_matches_translate_in_input_order():
+    """``translate_batch`` equivale a ``translate`` e preserva a ordem."""
+    translator = SemanticTranslator()
+    messages = [_mcp_call(f"tool_{i}", key=i) for i in range(5)]
+
+    batch = translator.translate_batch(messages, Protocol.MCP, Protocol.A2A)
+    single = [translator.translate(m, Protocol.MCP, Protocol.A2A) for m in messages]
+
+    assert len(batch) == len(messages)
+    for got, expected in zip(batch, single, strict=True):
+        assert isinstance(got, TranslationResult)
+        assert got.message == expected.message
+        assert got.confidence == expected.confidence
+
+
+def test_translate_batch_groups_by_protocol_pair_and_resolves_concepts_once():
+    """O lote agrupa por par de protocolos e resolve cada conceito uma vez."""
+    translator = SemanticTranslator()
+    calls = []
+    original = translator._query_alignments
+
+    def counting(concepts, source_protocol, target_protocol):
+        calls.append((tuple(concepts), source_protocol, target_protocol))
+        return original(concepts, source_protocol, target_protocol)
+
+    translator._query_alignments = counting
+    acp_message = {"payload": {"intent": "x", "parameters": {"route_id": "R-1"}}}
+    messages = [
+        _mcp_call("a"),
+        (acp_message, Protocol.ACP, Protocol.MCP),
+        _mcp_call("b"),
+    ]
+
+    results = translator.translate_batch(messages, Protocol.MCP, Protocol.A2A)
+
+    assert [r.target_protocol for r in results] == [
+        Protocol.A2A,
+        Protocol.MCP,
+        Protocol.A2A,
+    ]
+    assert calls == [
+        (("tool.name", "tool.inputSchema"), Protocol.MCP, Protocol.A2A),
+        (("payload.route_id",), Protocol.ACP, Protocol.MCP),
+    ]
+
+
+def test_translate_batch_isolates_per_message_errors():
+    """Erros de uma mensagem não afetam as demais do lote."""
+    translator = SemanticTranslator()
+    messages = [
+        _mcp_call("ok"),
+        ["not", "a", "message"],
+        (_mcp_call("sem destino"), Protocol.MCP),
+        _mcp_call("depois"),
+        (_mcp_call("protocolo dict"), {"nome": "mcp"}, Protocol.A2A),
+    ]
+
+    results = translator.translate_batch(messages, Protocol.MCP, Protocol.A2A)
+
+    assert isinstance(results[0], TranslationResult)
+    assert isinstance(results[1], BatchTranslationError)
+    assert results[1].index == 1
+    assert isinstance(results[1].error, AttributeError)
+    # Tupla malformada falha só no próprio item.
+    assert isinstance(results[2], BatchTranslationError)
+    assert isinstance(results[2].error, ValueError)
+    assert isinstance(results[3], TranslationResult)
+    # Protocolo não hashable também falha só no próprio item.
+    assert isinstance(results[4], BatchTranslationError)
+    assert isinstance(results[4].error, TypeError)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _alignment(concept):
+    return OntologyAlignment(concept, f"~{concept}", SemanticRelation.SUBSUMES, 0.7)
+
+
+def test_alignment_cache_lru_eviction_and_counters():
+    """O cache de alinhamentos é LRU e mantém contadores."""
+    cache = AlignmentCache(max_entries=2, ttl_seconds=None)
+    cache.put(("mcp", "a2a", "a"), _alignment("a"))
+    cache.put(("mcp", "a2a", "b"), _alignment("b"))
+    assert cache.get(("mcp", "a2a", "a")) is not None  # "a" passa a ser recente
+    cache.put(("mcp", "a2a", "c"), _alignment("c"))
+
+    assert cache.get(("mcp", "a2a", "b")) is None
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_alignment_cache_ttl_expiry():
+    """Entradas do cache de alinhamentos expiram pelo TTL."""
+    clock = _FakeClock()
+    cache = AlignmentCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.put(("mcp", "a2a", "a"), _alignment("a"))
+    clock.now = 59.0
+    assert cache.get(("mcp", "a2a", "a")) is not None
+    clock.now = 61.0
+    assert cache.get(("mcp", "a2a", "a")) is None
+    assert cache.expirations == 1
+
+
+def test_alignment_cache_expires_approximations_with_negative_ttl():
+    """Aproximações expiram pelo TTL negativo, bem antes do TTL normal."""
+    clock = _FakeClock()
+    cache = AlignmentCache(ttl_seconds=3600, negative_ttl_seconds=10, clock=clock)
+    approximate = OntologyAlignment(
+        "x", "~x", SemanticRelation.SUBSUMES, 0.72, is_direct=False
+    )
+    cache.put(("mcp", "a2a", "x"), approximate)
+    cache.put(("mcp", "a2a", "a"), _alignment("a"))
+
+    clock.now = 11.0
+    assert cache.get(("mcp", "a2a", "x")) is None
+    assert cache.get(("mcp", "a2a", "a")) is not None
+
+
+def test_default_translator_cache_is_in_memory_and_can_be_disabled(
+    tmp_path, monkeypatch
+):
+    """O padrão não lê o bridge-config; ``NO_ALIGNMENT_CACHE`` desliga o cache."""
+    monkeypatch.setattr(st, "DEFAULT_CONFIG_PATH", tmp_path / "ausente.yaml")
+    default = SemanticTranslator().alignment_cache
+    assert (default.max_entries, default.negative_ttl_seconds) == (
+        AlignmentCache().max_entries,
+        AlignmentCache().negative_ttl_seconds,
+    )
+    empty = AlignmentCache(max_entries=3)
+    assert SemanticTranslator(alignment_cache=empty).alignment_cache is empty
+    disabled = SemanticTranslator(alignment_cache=NO_ALIGNMENT_CACHE)
+    assert disabled.alignment_cache is None
+
+    config = tmp_path / "bridge-config.yaml"
+    config.write_text(
+        "bridge:\n  cache:\n    max_entries: 7\n    negative_ttl_seconds: 5\n",
+        encoding="utf-8",
+    )
+    cache = SemanticTranslator.from_config(config).alignment_cache
+    assert (cache.max_entries, cache.negative_ttl_seconds) == (7, 5.0)
+
+    config.write_text("bridge:\n  cache:\n    enabled: false\n", encoding="utf-8")
+    assert SemanticTranslator.from_config(config).alignment_cache is None
+
+
+def test_alignment_cache_is_invalidated_when_mappings_change():
+    """``planner.add_mapping`` esvazia os alinhamentos em cache."""
+    translator = SemanticTranslator()
+    message = {"method": "tools/call", "params": {"name": "busca", "extra": 1}}
+
+    before = translator.translate(message, Protocol.MCP, Protocol.A2A)
+    translator.planner.add_mapping(
+        "mcp", "a2a", {"tool.name": "skill.id", "tool.extra": "skill.extra"}
+    )
+    after = translator.translate(message, Protocol.MCP, Protocol.A2A)
+
+    assert "skill.extra" not in [c.translated for c in before.components]
+    assert "skill.extra" in [c.translated for c in after.components]
+
+
+def test_alignment_cache_from_config():
+    """O cache de alinhamentos é criado a partir da configuração."""
+    cache = AlignmentCache.from_config(
+        {"enabled": True, "ttl_seconds": 10, "max_entries": 5, "storage": "memory"}
+    )
+    assert cache is not None
+    assert (cache.max_entries, cache.ttl_seconds) == (5, 10.0)
+    assert AlignmentCache.from_config({"enabled": False}) is None
+    with pytest.raises(ValueError):
+        AlignmentCache.from_config({"storage": "redis"})
+
+
+def test_translator_from_bridge_config_uses_alignment_cache():
+    """O tradutor do bridge-config usa o cache de alinhamentos."""
+    translator = SemanticTranslator.from_config()
+    cache = translator.alignment_cache
+    assert cache is not None
+    assert (cache.max_entries, cache.ttl_seconds) == (10000, 3600.0)
+
+    translator.translate(_mcp_call("a"), Protocol.MCP, Protocol.A2A)
+    translator.translate(_mcp_call("b"), Protocol.MCP, Protocol.A2A)
+
+    assert cache.misses == 2
+    assert cache.hits == 2
+
+
+class _SlowAsyncOracle:
+    def __init__(self, delay):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def align_async(self, concept, source_protocol, target_protocol):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return OntologyAlignment(
+            concept, f"oracle.{concept}", SemanticRelation.EQUIVALENT, 0.9
+        )
+
+
+def _acp_request(*params):
+    return {
+        "message_type": "request",
+        "payload": {"intent": "x", "parameters": {p: 1 for p in params}},
+    }
+
+
+def test_translate_async_resolves_concepts_concurrently():
+    """``translate_async`` resolve os conceitos concorrentemente."""
+    oracle = _SlowAsyncOracle(delay=0.05)
+    translator = SemanticTranslator(oracle=oracle)
+    translator.alignment_cache = None
+    message = _acp_request("a", "b", "c", "d", "e", "f")
+
+    start = time.perf_counter()
+    result = asyncio.run(
+        translator.translate_async(message, Protocol.ACP, Protocol.MCP)
+    )
+    elapsed = time.perf_counter() - start
+
+    assert oracle.peak == 6
+    assert elapsed < 6 * 0.05
+    components = result.message["params"]["translated_components"]
+    assert [c["translated"] for c in components] == [
+        f"oracle.payload.{p}" for p in "abcdef"
+    ]
+    assert result.confidence == pytest.approx(0.9)
+
+
+def test_translate_async_respects_concurrency_limit_and_matches_sync():
+    """``translate_async`` respeita o limite e equivale à versão síncrona."""
+    oracle = _SlowAsyncOracle(delay=0.01)
+    translator = SemanticTranslator(oracle=oracle)
+    message = _acp_request("a", "b", "c", "d")
+
+    result = asyncio.run(
+        translator.translate_async(
+            message, Protocol.ACP, Protocol.MCP, max_concurrency=2
+        )
+    )
+
+    assert oracle.peak == 2
+    plain = SemanticTranslator().translate(message, Protocol.ACP, Protocol.MCP)
+    assert result.message.keys() == plain.message.keys()
+
+
+def test_trace_is_off_by_default():
+    """O rastreamento vem desligado por padrão."""
+    result = SemanticTranslator().translate(_mcp_call("a"), Protocol.MCP, Protocol.A2A)
+    assert result.trace is None
+    assert result.translation_log == []
+
+
+def test_trace_levels_summary_and_full():
+    """Os níveis de rastreamento ``summary`` e ``full``."""
+    message = _mcp_call("a")
+    summary = SemanticTranslator(trace_level="summary").translate(
+        message, Protocol.MCP, Protocol.A2A
+    )
+    full = SemanticTranslator(trace_level=TraceLevel.FULL).translate(
+        message, Protocol.MCP, Protocol.A2A
+    )
+
+    assert [line[:5] for line in summary.translation_log] == [
+        "[1/5]",
+        "[2/5]",
+        "[3/5]",
+        "[4/5]",
+        "[5/5]",
+    ]
+    assert len(full.trace) == len(summary.trace) + 2
+    assert "  ✓ Mapeamento direto: tool.name → skill.id" in full.translation_log
+    assert full.trace.events[0] == ("extract", ("mcp",))
+
+
+def test_translate_stream_is_lazy_and_aggregates():
+    """``translate_stream`` é preguiçoso e agrega estatísticas."""
+    translator = SemanticTranslator()
+    consumed = []
+
+    def lines():
+        for i in range(3):
+            consumed.append(i)
+            yield json.dumps(_mcp_call(f"t{i}"))
+        yield ""
+        yield "{not json"
+
+    stats = StreamStats()
+    stream = translator.translate_stream(lines(), Protocol.MCP, Protocol.A2A, stats)
+
+    first = next(stream)
+    assert consumed == [0]
+    assert first["line"] == 1
+    assert first["message"]["role"] == "agent"
+
+    rest = list(stream)
+    assert rest[-1]["line"] == 5
+    assert rest[-1]["error"].startswith("JSONDecodeError")
+    assert (stats.records, stats.translated, stats.failed) == (4, 3, 1)
+    assert stats.mean_preservation_rate == pytest.approx(1.0)
+    assert stats.throughput > 0
+
+
+def test_stream_cli_writes_ndjson_and_reports_stats(tmp_path, capsys):
+    """A CLI de streaming grava NDJSON e reporta estatísticas."""
+    source = tmp_path / "in.ndjson"
+    target = tmp_path / "out.ndjson"
+    source.write_text(
+        "\n".join(json.dumps(_mcp_call(f"t{i}")) for i in range(4)) + "\n",
+        encoding="utf-8",
+    )
+
+    code = main(
+        ["stream", str(source), "-o", str(target), "--source", "mcp", "--target", "acp"]
+    )
+
+    assert code == 0
+    records = [json.loads(line) for line in target.read_text().splitlines()]
+    assert [r["line"] for r in records] == [1, 2, 3, 4]
+    summary = json.loads(capsys.readouterr().err)
+    assert summary["translated"] == 4
+
+
+def test_compact_components_are_shared_and_materialized_on_demand():
+    """Componentes compactos são compartilhados e materializados sob demanda."""
+    translator = SemanticTranslator()
+    messages = [{"method": "tools/list", "params": {"cursor": c}} for c in ("a", "b")]
+    first, second = translator.translate_batch(messages, Protocol.MCP, Protocol.A2A)
+
+    assert first.components[0] is second.components[0]
+    assert first.semantic_losses[0] is second.semantic_losses[0]
+    component = first.message["parts"][0]["data"]["components"][0]
+    assert component == {
+        "original": "tool.cursor",
+        "translated": "~tool.cursor",
+        "relation": "⊑",
+        "confidence": 0.72,
+        "type": "approximate",
+        "warning": "Sem correspondência direta para 'tool.cursor'",
+    }
+    assert first.message is first.message
+
+
+def test_translation_result_accepts_previous_constructor_arguments():
+    """O construtor aceita ``message=``/``translation_log=`` da forma anterior."""
+    message = {"role": "agent", "parts": []}
+    result = TranslationResult(
+        message=message,
+        source_protocol=Protocol.MCP,
+        target_protocol=Protocol.A2A,
+        semantic_losses=[],
+        confidence=0.9,
+        translation_log=["[1/5] etapa", "[5/5] fim"],
+    )
+
+    assert result.message is message
+    assert result.envelope is message
+    assert result.translation_log == ["[1/5] etapa", "[5/5] fim"]
+    assert result.preservation_rate == 1.0
+    positional = TranslationResult(
+        message, Protocol.MCP, Protocol.A2A, [], 0.9, ["[5/5] fim"]
+    )
+    assert positional.translation_log == ["[5/5] fim"]
+    assert positional.components == ()
+    bare = TranslationResult.from_message(message, Protocol.MCP, Protocol.A2A, [], 0.9)
+    assert bare.translation_log == []
+    with pytest.raises(TypeError):
+        TranslationResult(source_protocol=Protocol.MCP)
+
+
+_REGISTRY = {
+    "mcp": [
+        {"path": "prompt.name", "alignments": {"a2a": "skill.examples"}},
+        {
+            "path": "prompt.legacy",
+            "alignments": {"a2a": {"entity": "x", "relation": "⊥"}},
+        },
+        {
+            "path": "tool.*",
+            "alignments": {
+                "a2a": {"entity": "skill.*", "relation": "⊑", "confidence": 0.8}
+            },
+        },
+        {"path": "tool.inputSchema.*", "alignments": {"a2a": "skill.inputSchema.*"}},
+    ]
+}
+
+
+def test_ontology_index_exact_and_longest_prefix_lookup():
+    """O índice de ontologias resolve exatos e o prefixo mais longo."""
+    index = OntologyIndex.from_registry(_REGISTRY)
+
+    exact = index.lookup("mcp", "a2a", "prompt.name")
+    assert exact.target_entity == "skill.examples"
+    assert exact.is_direct
+
+    nested = index.lookup("mcp", "a2a", "tool.inputSchema.properties.query")
+    assert nested.target_entity == "skill.inputSchema.properties.query"
+    assert nested.relation is SemanticRelation.EQUIVALENT
+
+    shallow = index.lookup("mcp", "a2a", "tool.annotations")
+    assert shallow.target_entity == "skill.annotations"
+    assert shallow.is_composite
+    assert shallow.confidence == 0.8
+
+    # ⊥ é distinto de "desconhecido" (None).
+    disjoint = index.lookup("mcp", "a2a", "prompt.legacy")
+    assert disjoint.relation is SemanticRelation.DISJOINT
+    assert index.lookup("mcp", "acp", "prompt.name") is None
+    assert index.lookup("a2a", "mcp", "tool.name") is None
+    assert len(index) == 4
+
+
+def test_ontology_index_wildcard_targets_and_disjoint_subtrees():
+    """Só destinos com curinga recebem o sufixo; ⊥ mais longo prevalece."""
+    index = OntologyIndex.from_registry(
+        {
+            "mcp": [
+                {"path": "resource.*", "alignments": {"a2a": "artifact.metadata"}},
+                {"path": "resource.blob.*", "alignments": {"a2a": {"relation": "⊥"}}},
+            ]
+        }
+    )
+
+    fixed = index.lookup("mcp", "a2a", "resource.uri")
+    assert fixed.target_entity == "artifact.metadata"
+    assert fixed.source_entity == "resource.uri"
+    blob = index.lookup("mcp", "a2a", "resource.blob.data")
+    assert blob.relation is SemanticRelation.DISJOINT
+
+
+def test_translator_does_not_ask_oracle_for_disjoint_concepts():
+    """Conceitos ⊥ no registro viram aproximação sem consultar o oráculo."""
+
+    class RecordingOracle:
+        def __init__(self):
+            self.concepts = []
+
+        def align(self, concept, source_protocol, target_protocol):
+            """Registra o conceito consultado; não conhece nenhum."""
+            self.concepts.append(concept)
+
+    oracle = RecordingOracle()
+    translator = SemanticTranslator(oracle=oracle, ontology_registry=_REGISTRY)
+    message = {"method": "prompts/get", "params": {"legacy": "v1", "other": "x"}}
+
+    result = translator.translate(message, Protocol.MCP, Protocol.A2A)
+
+    assert oracle.concepts == ["prompt.other"]
+    assert [c.translated for c in result.components] == [
+        "~prompt.legacy",
+        "~prompt.other",
+    ]
+    assert translator.alignment_stats.oracle_queries == 1
+
+
+def test_translator_consults_ontology_registry():
+    """O tradutor consulta o registro de ontologias."""
+    translator = SemanticTranslator(ontology_registry=_REGISTRY)
+    message = {"method": "prompts/get", "params": {"name": "resumo"}}
+
+    result = translator.translate(message, Protocol.MCP, Protocol.A2A)
+
+    assert result.components[0].translated == "skill.examples"
+    assert not result.has_losses
+
+
+def test_extract_semantics_emits_qualified_dotted_paths():
+    """A extração emite caminhos pontuados qualificados."""
+    translator = SemanticTranslator()
+
+    mcp = translator._extract_semantics(
+        _mcp_call("busca", query="rotas", filtro={"turno": "manhã"}), Protocol.MCP
+    )
+    a2a = translator._extract_semantics(
+        {
+            "role": "agent",
+            "task": {"id": "t-1"},
+            "parts": [
+                {"type": "text", "text": "olá"},
+                {"type": "data", "data": {"skill": {"id": "s", "description": "d"}}},
+            ],
+        },
+        Protocol.A2A,
+    )
+    acp = translator._extract_semantics(
+        {
+            "acp_version": "1.0",
+            "correlation_id": "c-1",
+            "payload": {"intent": "i", "parameters": {"dataset_uri": "u"}},
+        },
+        Protocol.ACP,
+    )
+
+    assert mcp.conceitos == [
+        "tool.name",
+        "tool.inputSchema.query",
+        "tool.inputSchema.filtro.turno",
+    ]
+    assert a2a.conceitos == ["task.id", "text", "skill.id", "skill.description"]
+    assert acp.conceitos == ["correlation_id", "payload.dataset_uri"]
+
+
+def test_direct_mappings_hit_flattened_paths():
+    """Mapeamentos diretos atingem os caminhos achatados."""
+    translator = SemanticTranslator()
+    message = _mcp_call("busca", query="rotas", limit=10)
+
+    result = translator.translate(message, Protocol.MCP, Protocol.A2A)
+
+    assert [c.translated for c in result.components] == [
+        "skill.id",
+        "skill.inputSchema.query",
+        "skill.inputSchema.limit",
+    ]
+    stats = translator.alignment_stats
+    assert (stats.direct, stats.approximations, stats.oracle_queries) == (3, 0, 0)
+    assert stats.direct_hit_rate == 1.0
+
+
+def test_protocol_graph_prefers_direct_route_and_caches_plans():
+    """O grafo prefere a rota direta e guarda os planos."""
+    graph = SemanticTranslator().planner
+
+    direct = graph.plan("mcp", "a2a")
+    assert direct.route == ("mcp", "a2a")
+    assert direct.confidence == pytest.approx(0.95)
+    assert graph.plan("mcp", "a2a") is direct
+
+
+def test_protocol_graph_composes_pivot_route_through_acp():
+    """O grafo compõe uma rota via pivô ACP."""
+    plan = SemanticTranslator().planner.plan("mcp", "anp")
+
+    assert plan.route == ("mcp", "acp", "anp")
+    assert plan.is_pivoted
+    assert plan.confidence == pytest.approx(0.95 * 0.95)
+    assert plan.mapping["tool.name"] == "interface.id"
+    assert plan.mapping["resource.uri"] == "interface.inputSchema.dataset_uri"
+
+
+def test_protocol_graph_picks_highest_confidence_route():
+    """O grafo escolhe a rota de maior confiança."""
+    graph = ProtocolGraph(
+        {("x", "z"): {"a": "c"}, ("x", "y"): {"a": "b"}, ("y", "z"): {"b": "c"}}
+    )
+    graph.add_mapping("x", "z", {"a": "c"}, confidence=0.5)
+
+    assert graph.plan("x", "z").route == ("x", "y", "z")
+    assert graph.plan("z", "x").route == ()
+
+
+def test_translate_mcp_to_anp_via_pivot():
+    """Tradução MCP → ANP passando pelo pivô."""
+    translator = SemanticTranslator()
+    message = _mcp_call("busca")
+
+    result = translator.translate(message, Protocol.MCP, Protocol.ANP)
+
+    assert result.message["anp_version"] == "1.0"
+    assert result.components[0].translated == "interface.id"
+    assert result.components[0].confidence == pytest.approx(0.9025)
+
+
+@pytest.fixture
+def sgte_adapter():
+    """Adaptador ``sgte`` registrado durante o teste."""
+
+    def extract(message):
+        structure = SemanticStructure(intent=message.get("op", ""))
+        structure.conceitos = [f"rota.{key}" for key in message.get("campos", {})]
+        return structure
+
+    adapter = ProtocolAdapter(
+        "sgte",
+        extract,
+        template=EnvelopeTemplate({"op": "traduzido", "itens": COMPONENTS, "meta": {}}),
+    )
+    register_adapter(adapter)
+    yield adapter
+    st._ADAPTERS.pop("sgte", None)
+
+
+def test_registered_adapter_handles_custom_protocol(sgte_adapter):
+    """Um adaptador registrado traduz um protocolo próprio."""
+    translator = SemanticTranslator()
+    translator.planner.add_mapping("mcp", "sgte", {"tool.name": "rota.id"})
+
+    result = translator.translate(_mcp_call("R-042"), Protocol.MCP, "sgte")
+    other = translator.translate(_mcp_call("R-043"), Protocol.MCP, "sgte")
+
+    assert result.message["op"] == "traduzido"
+    assert result.message["itens"][0]["translated"] == "rota.id"
+    assert result.envelope["meta"] is not other.envelope["meta"]
+    assert get_adapter("sgte") is sgte_adapter
+
+
+def test_unknown_protocol_adapter_is_loaded_lazily_from_entry_points(monkeypatch):
+    """Adaptadores desconhecidos são carregados sob demanda por entry points."""
+    loaded = []
+
+    class _EntryPoint:
+        name = "ext"
+
+        def load(self):
+            loaded.append(self.name)
+            return lambda: ProtocolAdapter("ext", lambda m: SemanticStructure(), dict)
+
+    def fake_entry_points(group, name=None):
+        assert group == "nlagent.protocol_adapters"
+        return [_EntryPoint()] if name in (None, "ext") else []
+
+    monkeypatch.setattr(st, "entry_points", fake_entry_points)
+    monkeypatch.delitem(st._ADAPTERS, "ext", raising=False)
+
+    assert "ext" in available_adapters()
+    assert loaded == []
+    assert get_adapter("ext").name == "ext"
+    assert loaded == ["ext"]
+    with pytest.raises(ValueError):
+        get_adapter("inexistente")
+    st._ADAPTERS.pop("ext", None)